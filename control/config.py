@@ -15,6 +15,7 @@ bode_deg = True                 # Bode Plot phase units
 bode_Hz = False                 # Bode plot frequency units
 bode_number_of_samples = None   # Bode plot number of samples
 bode_feature_periphery_decade = 1.0  # Bode plot feature periphery in decades
+bode_adaptive_grid = False      # Bode plot adaptive frequency grid
 
 # State space module variables
 _use_numpy_matrix = True        # Decide whether to use numpy.marix
@@ -26,6 +27,7 @@ def reset_defaults():
     global bode_Hz; bode_Hz = False
     global bode_number_of_samples; bode_number_of_samples = None
     global bode_feature_periphery_decade; bode_feature_periphery_decade = 1.0
+    global bode_adaptive_grid; bode_adaptive_grid = False
     global _use_numpy_matrix; _use_numpy_matrix = True
 
 
@@ -120,3 +120,30 @@ def mag2db(mag):
 
     """
     return 20. * np.log10(mag)
+
+# Utility function to find the roots of many polynomials at once
+def _roots_batch(pol):
+    """roots of a stack of polynomials, padded with NaN
+
+    Gives the same results as np.roots applied to each row: rows are
+    grouped by the position of their first and last nonzero coefficient,
+    and the eigenvalues of the companion matrices of each group are
+    computed in a single call.
+    """
+    nrows, n = pol.shape
+    out = np.full((nrows, max(n - 1, 0)), np.nan, dtype=complex)
+    nonzero = pol != 0
+    valid = nonzero.any(axis=1)
+    first = np.argmax(nonzero, axis=1)
+    last = n - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+    for f, l in set(zip(first[valid], last[valid])):
+        rows = np.nonzero(valid & (first == f) & (last == l))[0]
+        order = l - f
+        if order > 0:
+            A = np.zeros((len(rows), order, order))
+            A[:, 1:, :-1] = np.eye(order - 1)
+            A[:, 0, :] = -pol[rows, f + 1:l + 1] / pol[rows, f:f + 1]
+            out[rows, :order] = np.linalg.eigvals(A)
+        # trailing zero coefficients are roots at the origin
+        out[rows, order:order + n - 1 - l] = 0.
+    return out
@@ -50,10 +50,12 @@ $Id: frd.py 185 2012-08-30 05:44:32Z murrayrm $
 
 # External function declarations
 from warnings import warn
+import mmap
+import tempfile
 import numpy as np
 from numpy import angle, array, empty, ones, \
-    real, imag, absolute, eye, linalg, where, dot
-from scipy.interpolate import splprep, splev
+    real, imag, eye, linalg, where
+from scipy.interpolate import make_interp_spline
 from .lti import LTI
 
 __all__ = ['FRD', 'frd']
@@ -87,6 +89,10 @@ class FRD(LTI):
 
     epsw = 1e-8
 
+    # Maximum number of response entries processed at once when operating
+    # on memory-mapped frequency response data
+    blocksize = 2**20
+
     def __init__(self, *args, **kwargs):
         """FRD(d, w)
 
@@ -104,8 +110,17 @@ class FRD(LTI):
         To construct frequency response data for an existing LTI
         object, other than an FRD, call FRD(sys, omega)
 
+        If d is a complex ndarray and the keyword copy=False is given, the
+        data is used as is instead of being copied.  This allows an FRD to
+        be backed by an on-disk array, such as a `numpy.memmap` or the
+        result of ``numpy.load(file, mmap_mode='r')``.  Operations on such
+        an FRD (arithmetic, freqresp) process the data in blocks of
+        frequencies and store their results in temporary memory-mapped
+        files, so that the full data set never needs to fit in memory.
+
         """
         smooth = kwargs.get('smooth', False)
+        copy = kwargs.get('copy', True)
 
         if len(args) == 2:
             if not isinstance(args[0], FRD) and isinstance(args[0], LTI):
@@ -120,12 +135,14 @@ class FRD(LTI):
                 self.fresp = empty(
                     (otherlti.outputs, otherlti.inputs, numfreq),
                     dtype=complex)
-                for k, w in enumerate(self.omega):
-                    self.fresp[:, :, k] = otherlti._evalfr(w)
+                self.fresp[:] = otherlti._evalfr(self.omega)
 
             else:
                 # The user provided a response and a freq vector
-                self.fresp = array(args[0], dtype=complex)
+                if not copy and _is_mapped(args[0]):
+                    self.fresp = np.asanyarray(args[0], dtype=complex)
+                else:
+                    self.fresp = array(args[0], dtype=complex, copy=copy)
                 if len(self.fresp.shape) == 1:
                     self.fresp = self.fresp.reshape(1, 1, len(args[0]))
                 self.omega = array(args[1], dtype=float)
@@ -148,16 +165,17 @@ class FRD(LTI):
         else:
             raise ValueError("Needs 1 or 2 arguments; receivd %i." % len(args))
 
+        # Sorted copy of the frequencies, for looking up exact samples
+        self._omega_order = np.argsort(self.omega, kind='mergesort')
+        self._omega_sorted = self.omega[self._omega_order]
+
         # create interpolation functions
         if smooth:
-            self.ifunc = empty((self.fresp.shape[0], self.fresp.shape[1]),
-                               dtype=tuple)
-            for i in range(self.fresp.shape[0]):
-                for j in range(self.fresp.shape[1]):
-                    self.ifunc[i,j],u = splprep(
-                        u=self.omega, x=[real(self.fresp[i, j, :]),
-                                         imag(self.fresp[i, j, :])],
-                        w=1.0/(absolute(self.fresp[i, j, :])+0.001), s=0.0)
+            # All input/output pairs share the same frequency points, and
+            # hence the same knots, so a single (complex valued) cubic
+            # spline covers all of them
+            self.ifunc = make_interp_spline(
+                self.omega, np.moveaxis(self.fresp, -1, 0), k=3)
         else:
             self.ifunc = None
         LTI.__init__(self, self.fresp.shape[1], self.fresp.shape[0])
@@ -182,10 +200,95 @@ class FRD(LTI):
 
         return '\n'.join(outstr)
 
+    def _blocks(self, numfreq=None):
+        """Slices of the frequency axis, each with at most FRD.blocksize
+        response entries."""
+        if numfreq is None:
+            numfreq = len(self.omega)
+        step = max(1, FRD.blocksize //
+                   max(1, self.fresp.shape[0] * self.fresp.shape[1]))
+        for start in range(0, numfreq, step):
+            yield slice(start, start + step)
+
+    def _blockwise(self, func, others=(), shape=None, dtype=complex):
+        """Compute func(self.fresp, *[other.fresp for other in others]).
+
+        If any of the responses is memory mapped, func is applied to blocks
+        of frequencies, and the result is stored in a temporary memory
+        mapped file.  Otherwise func is applied to the full arrays.
+        """
+        arrays = [self.fresp] + [other.fresp for other in others]
+        if not any(_is_mapped(arr) for arr in arrays):
+            return func(*arrays)
+
+        if shape is None:
+            shape = self.fresp.shape
+        out = _fresp_empty(shape, dtype, *arrays)
+        for blk in self._blocks():
+            out[:, :, blk] = func(*[arr[:, :, blk] for arr in arrays])
+        return out
+
+    def combine(self, func, *others, **kwargs):
+        """Evaluate an expression of FRD objects in a single pass.
+
+        T = P.combine(func, C, ...)
+
+        func is called with blocks of the frequency responses of self and
+        of the other systems (converted to FRD objects at the frequencies
+        of self), as arrays of shape (outputs, inputs, nfreq), and must
+        return the matching block of the result, as an array of shape
+        (outputs, inputs, nfreq).  For example,
+
+        >>> T = P.combine(lambda p, c: p * c / (1 + p * c), C)
+
+        computes the complementary sensitivity of a SISO loop.  Compared to
+        T = P*C/(1 + P*C), no intermediate FRD objects are created, the
+        result is allocated once, and the temporary arrays created by func
+        only span a single block of frequencies.
+
+        Parameters
+        ----------
+        func : callable
+            Function evaluating the expression on blocks of responses.
+        *others : LTI or scalar
+            Additional systems passed to func.
+        blocksize : int, optional
+            Maximum number of response entries per block.  Defaults to
+            FRD.blocksize.
+        smooth : bool, optional
+            If True, the resulting FRD is interpolating.
+
+        Returns
+        -------
+        sys : FRD
+            Frequency response data of the expression.
+        """
+        blocksize = kwargs.get('blocksize', FRD.blocksize)
+        smooth = kwargs.get('smooth', False)
+        others = [_convertToFRD(other, omega=self.omega) for other in others]
+        arrays = [self.fresp] + [other.fresp for other in others]
+
+        numfreq = len(self.omega)
+        step = max(1, blocksize //
+                   max([arr.shape[0] * arr.shape[1] for arr in arrays]))
+        fresp = None
+        for start in range(0, numfreq, step):
+            blk = slice(start, start + step)
+            result = np.asarray(func(*[arr[:, :, blk] for arr in arrays]))
+            if fresp is None:
+                # The first block determines the size of the result
+                fresp = _fresp_empty(
+                    result.shape[:2] + (numfreq,), complex, *arrays)
+            fresp[:, :, blk] = result
+
+        if fresp is None:
+            fresp = empty((self.outputs, self.inputs, 0), dtype=complex)
+        return FRD(fresp, self.omega, smooth=smooth, copy=False)
+
     def __neg__(self):
         """Negate a transfer function."""
 
-        return FRD(-self.fresp, self.omega)
+        return FRD(self._blockwise(np.negative), self.omega, copy=False)
 
     def __add__(self, other):
         """Add two LTI objects (parallel connection)."""
@@ -197,6 +300,12 @@ class FRD(LTI):
                 warn("Frequency points do not match; expect"
                       " truncation and interpolation.")
 
+        # Add constants directly, without creating a constant FRD
+        if isinstance(other, (int, float, complex, np.number)) and \
+           self.inputs == 1 and self.outputs == 1:
+            return FRD(self._blockwise(lambda f: f + other), self.omega,
+                       copy=False)
+
         # Convert the second argument to a frequency response function.
         # or re-base the frd to the current omega (if needed)
         other = _convertToFRD(other, omega=self.omega)
@@ -209,7 +318,8 @@ second has %i." % (self.inputs, other.inputs))
             raise ValueError("The first summand has %i output(s), but the \
 second has %i." % (self.outputs, other.outputs))
 
-        return FRD(self.fresp + other.fresp, other.omega)
+        return FRD(self._blockwise(np.add, (other,)), other.omega,
+                   copy=False)
 
     def __radd__(self, other):
         """Right add two LTI objects (parallel connection)."""
@@ -231,8 +341,8 @@ second has %i." % (self.outputs, other.outputs))
 
         # Convert the second argument to a transfer function.
         if isinstance(other, (int, float, complex, np.number)):
-            return FRD(self.fresp * other, self.omega,
-                       smooth=(self.ifunc is not None))
+            return FRD(self._blockwise(lambda f: f * other), self.omega,
+                       smooth=(self.ifunc is not None), copy=False)
         else:
             other = _convertToFRD(other, omega=self.omega)
 
@@ -244,21 +354,20 @@ second has %i." % (self.outputs, other.outputs))
 
         inputs = other.inputs
         outputs = self.outputs
-        fresp = empty((outputs, inputs, len(self.omega)),
-                      dtype=self.fresp.dtype)
-        for i in range(len(self.omega)):
-            fresp[:,:,i] = dot(self.fresp[:,:,i], other.fresp[:,:,i])
+        fresp = self._blockwise(
+            lambda f1, f2: np.einsum('ijk,jlk->ilk', f1, f2), (other,),
+            shape=(outputs, inputs, len(self.omega)))
         return FRD(fresp, self.omega,
                    smooth=(self.ifunc is not None) and
-                          (other.ifunc is not None))
+                          (other.ifunc is not None), copy=False)
 
     def __rmul__(self, other):
         """Right Multiply two LTI objects (serial connection)."""
 
         # Convert the second argument to an frd function.
         if isinstance(other, (int, float, complex, np.number)):
-            return FRD(self.fresp * other, self.omega,
-                       smooth=(self.ifunc is not None))
+            return FRD(self._blockwise(lambda f: f * other), self.omega,
+                       smooth=(self.ifunc is not None), copy=False)
         else:
             other = _convertToFRD(other, omega=self.omega)
 
@@ -271,21 +380,20 @@ second has %i." % (self.outputs, other.outputs))
         inputs = self.inputs
         outputs = other.outputs
 
-        fresp = empty((outputs, inputs, len(self.omega)),
-                      dtype=self.fresp.dtype)
-        for i in range(len(self.omega)):
-            fresp[:,:,i] = dot(other.fresp[:,:,i], self.fresp[:,:,i])
+        fresp = self._blockwise(
+            lambda f1, f2: np.einsum('ijk,jlk->ilk', f2, f1), (other,),
+            shape=(outputs, inputs, len(self.omega)))
         return FRD(fresp, self.omega,
                    smooth=(self.ifunc is not None) and
-                          (other.ifunc is not None))
+                          (other.ifunc is not None), copy=False)
 
     # TODO: Division of MIMO transfer function objects is not written yet.
     def __truediv__(self, other):
         """Divide two LTI objects."""
 
         if isinstance(other, (int, float, complex, np.number)):
-            return FRD(self.fresp * (1/other), self.omega,
-                       smooth=(self.ifunc is not None))
+            return FRD(self._blockwise(lambda f: f * (1/other)), self.omega,
+                       smooth=(self.ifunc is not None), copy=False)
         else:
             other = _convertToFRD(other, omega=self.omega)
 
@@ -295,9 +403,9 @@ second has %i." % (self.outputs, other.outputs))
             raise NotImplementedError(
                 "FRD.__truediv__ is currently implemented only for SISO systems.")
 
-        return FRD(self.fresp/other.fresp, self.omega,
+        return FRD(self._blockwise(np.true_divide, (other,)), self.omega,
                    smooth=(self.ifunc is not None) and
-                          (other.ifunc is not None))
+                          (other.ifunc is not None), copy=False)
 
     # TODO: Remove when transition to python3 complete
     def __div__(self, other):
@@ -307,8 +415,8 @@ second has %i." % (self.outputs, other.outputs))
     def __rtruediv__(self, other):
         """Right divide two LTI objects."""
         if isinstance(other, (int, float, complex, np.number)):
-            return FRD(other / self.fresp, self.omega,
-                       smooth=(self.ifunc is not None))
+            return FRD(self._blockwise(lambda f: other / f), self.omega,
+                       smooth=(self.ifunc is not None), copy=False)
         else:
             other = _convertToFRD(other, omega=self.omega)
 
@@ -379,27 +487,44 @@ second has %i." % (self.outputs, other.outputs))
             out = empty((self.outputs, self.inputs), dtype=complex)
 
         if self.ifunc is None:
-            try:
-                out = self.fresp[:, :, where(self.omega == omega)[0][0]]
-            except:
-                raise ValueError(
-                    "Frequency %f not in frequency list, try an interpolating"
-                    " FRD if you want additional points" % omega)
+            out = self.fresp[:, :, self._freq_index(omega)]
         else:
+            # Evaluate all input/output pairs at all frequencies at once
             if getattr(omega, '__iter__', False):
-                for i in range(self.outputs):
-                    for j in range(self.inputs):
-                        for k,w in enumerate(omega):
-                            frraw = splev(w, self.ifunc[i,j], der=0)
-                            out[i,j,k] = frraw[0] + 1.0j*frraw[1]
+                out[:] = np.moveaxis(
+                    self.ifunc(np.asarray(omega, dtype=float)), 0, -1)
             else:
-                for i in range(self.outputs):
-                    for j in range(self.inputs):
-                        frraw = splev(omega, self.ifunc[i,j], der=0)
-                        out[i,j] = frraw[0] + 1.0j*frraw[1]
+                out[:] = self.ifunc(omega)
 
         return out
 
+    def _freq_index(self, omega):
+        """Find the index of (an array of) frequencies in self.omega.
+
+        Uses a binary search on the sorted frequencies.  A frequency
+        matches a data point if they differ by less than FRD.epsw; a
+        ValueError is raised if there is no match.
+        """
+        omega_arr = np.asarray(omega, dtype=float)
+        wsorted = self._omega_sorted
+        if len(wsorted) == 0:
+            raise ValueError("FRD has no frequency points")
+
+        # Pick the closest of the two neighbouring data points
+        hi = np.clip(np.searchsorted(wsorted, omega_arr), 0, len(wsorted) - 1)
+        lo = np.clip(hi - 1, 0, len(wsorted) - 1)
+        idx = where(np.abs(wsorted[hi] - omega_arr) <
+                       np.abs(wsorted[lo] - omega_arr), hi, lo)
+
+        missing = np.abs(wsorted[idx] - omega_arr) > FRD.epsw
+        if np.any(missing):
+            raise ValueError(
+                "Frequency %f not in frequency list, try an interpolating"
+                " FRD if you want additional points" %
+                np.atleast_1d(omega_arr)[np.atleast_1d(missing)][0])
+
+        return self._omega_order[idx]
+
     # Method for generating the frequency response of the system
     def freqresp(self, omega):
         """Evaluate a transfer function at a list of angular frequencies.
@@ -414,15 +539,20 @@ second has %i." % (self.outputs, other.outputs))
 
         # Preallocate outputs.
         numfreq = len(omega)
-        mag = empty((self.outputs, self.inputs, numfreq))
-        phase = empty((self.outputs, self.inputs, numfreq))
+        shape = (self.outputs, self.inputs, numfreq)
+        mag = _fresp_empty(shape, float, self.fresp)
+        phase = _fresp_empty(shape, float, self.fresp)
 
         omega.sort()
 
-        for k, w in enumerate(omega):
-            fresp = self._evalfr(w)
-            mag[:, :, k] = abs(fresp)
-            phase[:, :, k] = angle(fresp)
+        # Memory mapped data is evaluated one block of frequencies at a time
+        omega_arr = np.asarray(omega, dtype=float)
+        blocks = self._blocks(numfreq) if _is_mapped(self.fresp) \
+            else [slice(None)]
+        for blk in blocks:
+            fresp = self._evalfr(omega_arr[blk])
+            mag[:, :, blk] = abs(fresp)
+            phase[:, :, blk] = angle(fresp)
 
         return mag, phase, omega
 
@@ -435,22 +565,41 @@ second has %i." % (self.outputs, other.outputs))
             self.inputs != other.outputs):
             raise ValueError(
                 "FRD.feedback, inputs/outputs mismatch")
-        fresp = empty((self.outputs, self.inputs, len(other.omega)),
-                      dtype=complex)
-        # TODO: vectorize this
+
         # TODO: handle omega re-mapping
-        # TODO: is there a reason to use linalg.solve instead of linalg.inv?
-        # https://github.com/python-control/python-control/pull/314#discussion_r294075154
-        for k, w in enumerate(other.omega):
-            fresp[:, :, k] = np.dot(
-                self.fresp[:, :, k],
-                linalg.solve(
-                    eye(self.inputs)
-                    + np.dot(other.fresp[:, :, k], self.fresp[:, :, k]),
-                    eye(self.inputs))
-            )
-
-        return FRD(fresp, other.omega, smooth=(self.ifunc is not None))
+        # Solve P (I - sign O P)^-1 for all frequencies at once, as
+        # (I - sign O P)^T X^T = P^T
+        def _feedback(P, O):
+            P, O = np.moveaxis(P, -1, 0), np.moveaxis(O, -1, 0)
+            M = eye(self.inputs) - sign * np.matmul(O, P)
+            X = linalg.solve(np.swapaxes(M, 1, 2), np.swapaxes(P, 1, 2))
+            return np.moveaxis(np.swapaxes(X, 1, 2), 0, -1)
+
+        fresp = self._blockwise(_feedback, (other,))
+
+        return FRD(fresp, other.omega, smooth=(self.ifunc is not None),
+                   copy=False)
+
+def _is_mapped(arr):
+    """Check whether an array is backed by a memory mapped file."""
+    while arr is not None:
+        if isinstance(arr, mmap.mmap):
+            return True
+        arr = getattr(arr, 'base', None)
+    return False
+
+
+def _fresp_empty(shape, dtype, *like):
+    """Allocate an array for frequency response data.
+
+    If any of the arrays in like is memory mapped, the new array is
+    memory mapped to a temporary file as well.
+    """
+    if any(_is_mapped(arr) for arr in like) and np.prod(shape) > 0:
+        return np.memmap(tempfile.TemporaryFile(), dtype=dtype, mode='w+',
+                         shape=shape)
+    return empty(shape, dtype=dtype)
+
 
 def _convertToFRD(sys, omega, inputs=1, outputs=1):
     """Convert a system to frequency response data form (if needed).
@@ -483,8 +632,7 @@ def _convertToFRD(sys, omega, inputs=1, outputs=1):
     elif isinstance(sys, LTI):
         omega.sort()
         fresp = empty((sys.outputs, sys.inputs, len(omega)), dtype=complex)
-        for k, w in enumerate(omega):
-            fresp[:, :, k] = sys._evalfr(w)
+        fresp[:] = sys._evalfr(omega)
 
         return FRD(fresp, omega, smooth=True)
 
@@ -507,7 +655,7 @@ def _convertToFRD(sys, omega, inputs=1, outputs=1):
     raise TypeError('''Can't convert given type "%s" to FRD system.''' %
                     sys.__class__)
 
-def frd(*args):
+def frd(*args, **kwargs):
     """frd(d, w)
 
     Construct a frequency response data model
@@ -532,6 +680,11 @@ def frd(*args):
         vector with frequencies
     sys: LTI (StateSpace or TransferFunction)
         A linear system
+    smooth: bool, optional
+        If True, create an interpolating FRD (see FRD).
+    copy: bool, optional
+        If False, use a complex response array as is instead of copying it,
+        so that a `numpy.memmap` stays on disk (see FRD).  Default is True.
 
     Returns
     -------
@@ -542,4 +695,4 @@ def frd(*args):
     --------
     FRD, ss, tf
     """
-    return FRD(*args)
+    return FRD(*args, **kwargs)
@@ -63,7 +63,8 @@ __all__ = ['bode_plot', 'nyquist_plot', 'gangof4_plot',
 
 
 def bode_plot(syslist, omega=None, dB=None, Hz=None, deg=None,
-              Plot=True, omega_limits=None, omega_num=None, margins=None, *args, **kwargs):
+              Plot=True, omega_limits=None, omega_num=None, margins=None,
+              *args, **kwargs):
     """
     Bode plot for a system
 
@@ -90,6 +91,14 @@ def bode_plot(syslist, omega=None, dB=None, Hz=None, deg=None,
         number of samples
     margins : boolean
         If True, plot gain and phase margin
+    n_jobs : int, optional
+        Number of worker threads used to compute the frequency responses of
+        the systems in syslist before plotting.  If -1, use one thread per
+        CPU.  The default (None) computes the responses sequentially.
+        Keyword only.
+    executor : concurrent.futures.Executor, optional
+        Executor used to compute the frequency responses (e.g., a
+        ProcessPoolExecutor).  Overrides n_jobs.  Keyword only.
     \*args, \**kwargs:
         Additional options to matplotlib (color, linestyle, etc)
 
@@ -113,11 +122,20 @@ def bode_plot(syslist, omega=None, dB=None, Hz=None, deg=None,
     \omega dt) where omega ranges from 0 to pi/dt and dt is the discrete
     timebase.  If not timebase is specified (dt = True), dt is set to 1.
 
+    3. The frequency responses of all systems are computed before any
+    plotting is done.  With Plot=False, bode_plot can be used to compute
+    the responses of a large list of systems in parallel (using n_jobs or
+    executor) without generating a figure.
+
     Examples
     --------
     >>> sys = ss("1. -2; 3. -4", "5.; 7", "6. 8", "9.")
     >>> mag, phase, omega = bode(sys)
     """
+    # Options for computing the responses, not passed on to matplotlib
+    n_jobs = kwargs.pop('n_jobs', None)
+    executor = kwargs.pop('executor', None)
+
     # Set default values for options
     from . import config
     if dB is None:
@@ -149,243 +167,150 @@ def bode_plot(syslist, omega=None, dB=None, Hz=None, deg=None,
                                     np.log10(omega_limits[1]), 
                                     endpoint=True)
 
-    mags, phases, omegas, nyquistfrqs = [], [], [], []
+    # Compute the frequency responses for all systems up front, so that
+    # the (possibly expensive) evaluation can be done in parallel
+    omega_syslist = []
     for sys in syslist:
         if sys.inputs > 1 or sys.outputs > 1:
             # TODO: Add MIMO bode plots.
             raise NotImplementedError("Bode is currently only implemented for SISO systems.")
+        omega_sys = np.array(omega)
+        if sys.isdtime(True):
+            nyquistfrq = 2. * math.pi * 1. / sys.dt / 2.
+            omega_sys = omega_sys[omega_sys < nyquistfrq]
+            # TODO: What distance to the Nyquist frequency is appropriate?
+        omega_syslist.append(omega_sys)
+    responses = _freqresp_list(syslist, omega_syslist, n_jobs, executor)
+
+    mags, phases, omegas, nyquistfrqs = [], [], [], []
+    for sys, response in zip(syslist, responses):
+        if sys.isdtime(True):
+            nyquistfrq = 2. * math.pi * 1. / sys.dt / 2.
         else:
-            omega_sys = np.array(omega)
-            if sys.isdtime(True):
-                nyquistfrq = 2. * math.pi * 1. / sys.dt / 2.
-                omega_sys = omega_sys[omega_sys < nyquistfrq]
-                # TODO: What distance to the Nyquist frequency is appropriate?
+            nyquistfrq = None
+        # Get the magnitude and phase of the system
+        mag_tmp, phase_tmp, omega_sys = response
+        mag = np.atleast_1d(np.squeeze(mag_tmp))
+        phase = np.atleast_1d(np.squeeze(phase_tmp))
+        phase = unwrap(phase)
+
+        mags.append(mag)
+        phases.append(phase)
+        omegas.append(omega_sys)
+        nyquistfrqs.append(nyquistfrq)
+        # Get the dimensions of the current axis, which we will divide up
+        # TODO: Not current implemented; just use subplot for now
+
+        if Plot:
+            nyquistfrq_plot = None
+            if Hz:
+                omega_plot = omega_sys / (2. * math.pi)
+                if nyquistfrq:
+                    nyquistfrq_plot = nyquistfrq / (2. * math.pi)
+            else:
+                omega_plot = omega_sys
+                if nyquistfrq:
+                    nyquistfrq_plot = nyquistfrq
+
+            # Set up the axes with labels so that multiple calls to
+            # bode_plot will superimpose the data.  This was implicit
+            # before matplotlib 2.1, but changed after that (See
+            # https://github.com/matplotlib/matplotlib/issues/9024).
+            # The code below should work on all cases.
+
+            # Get the current figure
+
+            if 'sisotool' in kwargs:
+                fig = kwargs['fig']
+                ax_mag = fig.axes[0]
+                ax_phase = fig.axes[2]
+                sisotool = kwargs['sisotool']
+                del kwargs['fig']
+                del kwargs['sisotool']
+            else:
+                fig = plt.gcf()
+                ax_mag = None
+                ax_phase = None
+                sisotool = False
+
+                # Get the current axes if they already exist
+                for ax in fig.axes:
+                    if ax.get_label() == 'control-bode-magnitude':
+                        ax_mag = ax
+                    elif ax.get_label() == 'control-bode-phase':
+                        ax_phase = ax
+
+                # If no axes present, create them from scratch
+                if ax_mag is None or ax_phase is None:
+                    plt.clf()
+                    ax_mag = plt.subplot(211,
+                                         label='control-bode-magnitude')
+                    ax_phase = plt.subplot(212,
+                                           label='control-bode-phase',
+                                           sharex=ax_mag)
+
+            # Magnitude plot
+            if dB:
+                pltline = ax_mag.semilogx(omega_plot, 20 * np.log10(mag),
+                                          *args, **kwargs)
             else:
-                nyquistfrq = None
-            # Get the magnitude and phase of the system
-            mag_tmp, phase_tmp, omega_sys = sys.freqresp(omega_sys)
-            mag = np.atleast_1d(np.squeeze(mag_tmp))
-            phase = np.atleast_1d(np.squeeze(phase_tmp))
-            phase = unwrap(phase)
-
-            mags.append(mag)
-            phases.append(phase)
-            omegas.append(omega_sys)
-            nyquistfrqs.append(nyquistfrq)
-            # Get the dimensions of the current axis, which we will divide up
-            # TODO: Not current implemented; just use subplot for now
-
-            if Plot:
-                nyquistfrq_plot = None
-                if Hz:
-                    omega_plot = omega_sys / (2. * math.pi)
-                    if nyquistfrq:
-                        nyquistfrq_plot = nyquistfrq / (2. * math.pi)
-                else:
-                    omega_plot = omega_sys
-                    if nyquistfrq:
-                        nyquistfrq_plot = nyquistfrq
-
-                # Set up the axes with labels so that multiple calls to
-                # bode_plot will superimpose the data.  This was implicit
-                # before matplotlib 2.1, but changed after that (See
-                # https://github.com/matplotlib/matplotlib/issues/9024).
-                # The code below should work on all cases.
-
-                # Get the current figure
-
-                if 'sisotool' in kwargs:
-                    fig = kwargs['fig']
-                    ax_mag = fig.axes[0]
-                    ax_phase = fig.axes[2]
-                    sisotool = kwargs['sisotool']
-                    del kwargs['fig']
-                    del kwargs['sisotool']
-                else:
-                    fig = plt.gcf()
-                    ax_mag = None
-                    ax_phase = None
-                    sisotool = False
-
-                    # Get the current axes if they already exist
-                    for ax in fig.axes:
-                        if ax.get_label() == 'control-bode-magnitude':
-                            ax_mag = ax
-                        elif ax.get_label() == 'control-bode-phase':
-                            ax_phase = ax
-
-                    # If no axes present, create them from scratch
-                    if ax_mag is None or ax_phase is None:
-                        plt.clf()
-                        ax_mag = plt.subplot(211,
-                                             label='control-bode-magnitude')
-                        ax_phase = plt.subplot(212,
-                                               label='control-bode-phase',
-                                               sharex=ax_mag)
-
-                # Magnitude plot
-                if dB:
-                    pltline = ax_mag.semilogx(omega_plot, 20 * np.log10(mag),
-                                              *args, **kwargs)
-                else:
-                    pltline = ax_mag.loglog(omega_plot, mag, *args, **kwargs)
-
-                if nyquistfrq_plot:
-                    ax_mag.axvline(nyquistfrq_plot,
-                                   color=pltline[0].get_color())
-
-                # Add a grid to the plot + labeling
-                ax_mag.grid(False if margins else True, which='both')
-                ax_mag.set_ylabel("Magnitude (dB)" if dB else "Magnitude")
-
-                # Phase plot
-                if deg:
-                    phase_plot = phase * 180. / math.pi
-                else:
-                    phase_plot = phase
-                ax_phase.semilogx(omega_plot, phase_plot, *args, **kwargs)
-
-                # Show the phase and gain margins in the plot
-                if margins:
-                    margin = stability_margins(sys)
-                    gm, pm, Wcg, Wcp = margin[0], margin[1], margin[3], margin[4]
-                    # TODO: add some documentation describing why this is here
-                    phase_at_cp = phases[0][(np.abs(omegas[0] - Wcp)).argmin()]
-                    if phase_at_cp >= 0.:
-                        phase_limit = 180.
-                    else:
-                        phase_limit = -180.
-
-                    if Hz:
-                        Wcg, Wcp = Wcg/(2*math.pi),Wcp/(2*math.pi)
-
-                    ax_mag.axhline(y=0 if dB else 1, color='k', linestyle=':',
-                                   zorder=-20)
-                    ax_phase.axhline(y=phase_limit if deg else math.radians(phase_limit), 
-                                     color='k', linestyle=':', zorder=-20)
-                    mag_ylim = ax_mag.get_ylim()
-                    phase_ylim = ax_phase.get_ylim()
-
-                    if pm != float('inf') and Wcp != float('nan'):
-                        if dB:
-                            ax_mag.semilogx([Wcp, Wcp], [0.,-1e5],
-                                            color='k', linestyle=':',
-                                            zorder=-20)
-                        else:
-                            ax_mag.loglog([Wcp,Wcp], [1.,1e-8],color='k',
-                                          linestyle=':', zorder=-20)
-
-                        if deg:
-                            ax_phase.semilogx([Wcp, Wcp],
-                                              [1e5, phase_limit+pm], 
-                                              color='k', linestyle=':',
-                                              zorder=-20)
-                            ax_phase.semilogx([Wcp, Wcp],
-                                              [phase_limit + pm, phase_limit], 
-                                              color='k', zorder=-20)
-                        else:
-                            ax_phase.semilogx([Wcp, Wcp],
-                                              [1e5, math.radians(phase_limit) +
-                                               math.radians(pm)],
-                                              color='k', linestyle=':',
-                                              zorder=-20)
-                            ax_phase.semilogx([Wcp, Wcp],
-                                              [math.radians(phase_limit) +
-                                               math.radians(pm),
-                                               math.radians(phase_limit)], 
-                                              color='k', zorder=-20)
-
-                    if gm != float('inf') and Wcg != float('nan'):
-                        if dB:
-                            ax_mag.semilogx([Wcg, Wcg],
-                                            [-20.*np.log10(gm), -1e5],
-                                            color='k', linestyle=':',
-                                            zorder=-20)
-                            ax_mag.semilogx([Wcg, Wcg], [0,-20*np.log10(gm)],
-                                            color='k', zorder=-20)
-                        else:
-                            ax_mag.loglog([Wcg, Wcg],
-                                          [1./gm,1e-8],color='k',
-                                          linestyle=':', zorder=-20)
-                            ax_mag.loglog([Wcg, Wcg],
-                                          [1.,1./gm],color='k', zorder=-20)
-
-                        if deg:
-                            ax_phase.semilogx([Wcg, Wcg], [1e-8, phase_limit],
-                                              color='k', linestyle=':',
-                                              zorder=-20)
-                        else:
-                            ax_phase.semilogx([Wcg, Wcg],
-                                              [1e-8, math.radians(phase_limit)],
-                                              color='k', linestyle=':',
-                                              zorder=-20)
-
-                    ax_mag.set_ylim(mag_ylim)
-                    ax_phase.set_ylim(phase_ylim)
-
-                    if sisotool:
-                        ax_mag.text(0.04, 0.06,
-                                    'G.M.: %.2f %s\nFreq: %.2f %s' % 
-                                    (20*np.log10(gm) if dB else gm,
-                                     'dB ' if dB else '',
-                                     Wcg, 'Hz' if Hz else 'rad/s'), 
-                                    horizontalalignment='left',
-                                    verticalalignment='bottom',
-                                    transform=ax_mag.transAxes,
-                                    fontsize=8 if int(matplotlib.__version__[0]) == 1 else 6)
-                        ax_phase.text(0.04, 0.06,
-                                      'P.M.: %.2f %s\nFreq: %.2f %s' %
-                                      (pm if deg else math.radians(pm),
-                                       'deg' if deg else 'rad',
-                                       Wcp, 'Hz' if Hz else 'rad/s'), 
-                                      horizontalalignment='left',
-                                      verticalalignment='bottom',
-                                      transform=ax_phase.transAxes,
-                                      fontsize=8 if int(matplotlib.__version__[0]) == 1 else 6)
-                    else:
-                        plt.suptitle('Gm = %.2f %s(at %.2f %s), Pm = %.2f %s (at %.2f %s)' % 
-                                     (20*np.log10(gm) if dB else gm, 
-                                      'dB ' if dB else '\b',
-                                      Wcg, 'Hz' if Hz else 'rad/s', 
-                                      pm if deg else math.radians(pm),
-                                      'deg' if deg else 'rad',
-                                      Wcp, 'Hz' if Hz else 'rad/s'))
-
-                if nyquistfrq_plot:
-                    ax_phase.axvline(nyquistfrq_plot, color=pltline[0].get_color())
-
-                # Add a grid to the plot + labeling
-                ax_phase.set_ylabel("Phase (deg)" if deg else "Phase (rad)")
-
-                def gen_zero_centered_series(val_min, val_max, period):
-                    v1 = np.ceil(val_min / period - 0.2)
-                    v2 = np.floor(val_max / period + 0.2)
-                    return np.arange(v1, v2 + 1) * period
-                if deg:
-                    ylim = ax_phase.get_ylim()
-                    ax_phase.set_yticks(gen_zero_centered_series(ylim[0],
-                                                                 ylim[1], 45.))
-                    ax_phase.set_yticks(gen_zero_centered_series(ylim[0],
-                                                                 ylim[1], 15.),
-                                        minor=True)
-                else:
-                    ylim = ax_phase.get_ylim()
-                    ax_phase.set_yticks(gen_zero_centered_series(ylim[0],
-                                                                 ylim[1],
-                                                                 math.pi / 4.))
-                    ax_phase.set_yticks(gen_zero_centered_series(ylim[0],
-                                                                 ylim[1],
-                                                                 math.pi / 12.),
-                                        minor=True)
-                ax_phase.grid(False if margins else True, which='both')
-                # ax_mag.grid(which='minor', alpha=0.3)
-                # ax_mag.grid(which='major', alpha=0.9)
-                # ax_phase.grid(which='minor', alpha=0.3)
-                # ax_phase.grid(which='major', alpha=0.9)
-
-                # Label the frequency axis
-                ax_phase.set_xlabel("Frequency (Hz)" if Hz
-                                    else "Frequency (rad/sec)")
+                pltline = ax_mag.loglog(omega_plot, mag, *args, **kwargs)
+
+            if nyquistfrq_plot:
+                ax_mag.axvline(nyquistfrq_plot,
+                               color=pltline[0].get_color())
+
+            # Add a grid to the plot + labeling
+            ax_mag.grid(False if margins else True, which='both')
+            ax_mag.set_ylabel("Magnitude (dB)" if dB else "Magnitude")
+
+            # Phase plot
+            if deg:
+                phase_plot = phase * 180. / math.pi
+            else:
+                phase_plot = phase
+            ax_phase.semilogx(omega_plot, phase_plot, *args, **kwargs)
+
+            # Show the phase and gain margins in the plot
+            if margins:
+                _bode_margin_plot(ax_mag, ax_phase, sys, phases[0],
+                                  omegas[0], dB, deg, Hz, sisotool)
+
+            if nyquistfrq_plot:
+                ax_phase.axvline(nyquistfrq_plot, color=pltline[0].get_color())
+
+            # Add a grid to the plot + labeling
+            ax_phase.set_ylabel("Phase (deg)" if deg else "Phase (rad)")
+
+            def gen_zero_centered_series(val_min, val_max, period):
+                v1 = np.ceil(val_min / period - 0.2)
+                v2 = np.floor(val_max / period + 0.2)
+                return np.arange(v1, v2 + 1) * period
+            if deg:
+                ylim = ax_phase.get_ylim()
+                ax_phase.set_yticks(gen_zero_centered_series(ylim[0],
+                                                             ylim[1], 45.))
+                ax_phase.set_yticks(gen_zero_centered_series(ylim[0],
+                                                             ylim[1], 15.),
+                                    minor=True)
+            else:
+                ylim = ax_phase.get_ylim()
+                ax_phase.set_yticks(gen_zero_centered_series(ylim[0],
+                                                             ylim[1],
+                                                             math.pi / 4.))
+                ax_phase.set_yticks(gen_zero_centered_series(ylim[0],
+                                                             ylim[1],
+                                                             math.pi / 12.),
+                                    minor=True)
+            ax_phase.grid(False if margins else True, which='both')
+            # ax_mag.grid(which='minor', alpha=0.3)
+            # ax_mag.grid(which='major', alpha=0.9)
+            # ax_phase.grid(which='minor', alpha=0.3)
+            # ax_phase.grid(which='major', alpha=0.9)
+
+            # Label the frequency axis
+            ax_phase.set_xlabel("Frequency (Hz)" if Hz
+                                else "Frequency (rad/sec)")
 
     if len(syslist) == 1:
         return mags[0], phases[0], omegas[0]
@@ -393,6 +318,118 @@ def bode_plot(syslist, omega=None, dB=None, Hz=None, deg=None,
         return mags, phases, omegas
 
 
+def _bode_margin_plot(ax_mag, ax_phase, sys, phase, omega, dB, deg, Hz,
+                      sisotool=False):
+    """Show the gain and phase margins of sys in a bode plot
+
+    phase and omega are the (unwrapped) phase and frequencies of the
+    response of sys, used to determine which -180 degree line applies.
+    """
+    margin = stability_margins(sys)
+    gm, pm, Wcg, Wcp = margin[0], margin[1], margin[3], margin[4]
+    # TODO: add some documentation describing why this is here
+    phase_at_cp = phase[(np.abs(omega - Wcp)).argmin()]
+    if phase_at_cp >= 0.:
+        phase_limit = 180.
+    else:
+        phase_limit = -180.
+
+    if Hz:
+        Wcg, Wcp = Wcg/(2*math.pi),Wcp/(2*math.pi)
+
+    ax_mag.axhline(y=0 if dB else 1, color='k', linestyle=':',
+                   zorder=-20)
+    ax_phase.axhline(y=phase_limit if deg else math.radians(phase_limit), 
+                     color='k', linestyle=':', zorder=-20)
+    mag_ylim = ax_mag.get_ylim()
+    phase_ylim = ax_phase.get_ylim()
+
+    if pm != float('inf') and Wcp != float('nan'):
+        if dB:
+            ax_mag.semilogx([Wcp, Wcp], [0.,-1e5],
+                            color='k', linestyle=':',
+                            zorder=-20)
+        else:
+            ax_mag.loglog([Wcp,Wcp], [1.,1e-8],color='k',
+                          linestyle=':', zorder=-20)
+
+        if deg:
+            ax_phase.semilogx([Wcp, Wcp],
+                              [1e5, phase_limit+pm], 
+                              color='k', linestyle=':',
+                              zorder=-20)
+            ax_phase.semilogx([Wcp, Wcp],
+                              [phase_limit + pm, phase_limit], 
+                              color='k', zorder=-20)
+        else:
+            ax_phase.semilogx([Wcp, Wcp],
+                              [1e5, math.radians(phase_limit) +
+                               math.radians(pm)],
+                              color='k', linestyle=':',
+                              zorder=-20)
+            ax_phase.semilogx([Wcp, Wcp],
+                              [math.radians(phase_limit) +
+                               math.radians(pm),
+                               math.radians(phase_limit)], 
+                              color='k', zorder=-20)
+
+    if gm != float('inf') and Wcg != float('nan'):
+        if dB:
+            ax_mag.semilogx([Wcg, Wcg],
+                            [-20.*np.log10(gm), -1e5],
+                            color='k', linestyle=':',
+                            zorder=-20)
+            ax_mag.semilogx([Wcg, Wcg], [0,-20*np.log10(gm)],
+                            color='k', zorder=-20)
+        else:
+            ax_mag.loglog([Wcg, Wcg],
+                          [1./gm,1e-8],color='k',
+                          linestyle=':', zorder=-20)
+            ax_mag.loglog([Wcg, Wcg],
+                          [1.,1./gm],color='k', zorder=-20)
+
+        if deg:
+            ax_phase.semilogx([Wcg, Wcg], [1e-8, phase_limit],
+                              color='k', linestyle=':',
+                              zorder=-20)
+        else:
+            ax_phase.semilogx([Wcg, Wcg],
+                              [1e-8, math.radians(phase_limit)],
+                              color='k', linestyle=':',
+                              zorder=-20)
+
+    ax_mag.set_ylim(mag_ylim)
+    ax_phase.set_ylim(phase_ylim)
+
+    if sisotool:
+        ax_mag.text(0.04, 0.06,
+                    'G.M.: %.2f %s\nFreq: %.2f %s' % 
+                    (20*np.log10(gm) if dB else gm,
+                     'dB ' if dB else '',
+                     Wcg, 'Hz' if Hz else 'rad/s'), 
+                    horizontalalignment='left',
+                    verticalalignment='bottom',
+                    transform=ax_mag.transAxes,
+                    fontsize=8 if int(matplotlib.__version__[0]) == 1 else 6)
+        ax_phase.text(0.04, 0.06,
+                      'P.M.: %.2f %s\nFreq: %.2f %s' %
+                      (pm if deg else math.radians(pm),
+                       'deg' if deg else 'rad',
+                       Wcp, 'Hz' if Hz else 'rad/s'), 
+                      horizontalalignment='left',
+                      verticalalignment='bottom',
+                      transform=ax_phase.transAxes,
+                      fontsize=8 if int(matplotlib.__version__[0]) == 1 else 6)
+    else:
+        plt.suptitle('Gm = %.2f %s(at %.2f %s), Pm = %.2f %s (at %.2f %s)' % 
+                     (20*np.log10(gm) if dB else gm, 
+                      'dB ' if dB else '\b',
+                      Wcg, 'Hz' if Hz else 'rad/s', 
+                      pm if deg else math.radians(pm),
+                      'deg' if deg else 'rad',
+                      Wcp, 'Hz' if Hz else 'rad/s'))
+
+
 def nyquist_plot(syslist, omega=None, Plot=True, color=None,
                  labelFreq=0, *args, **kwargs):
     """
@@ -412,16 +449,24 @@ def nyquist_plot(syslist, omega=None, Plot=True, color=None,
         Used to specify the color of the plot
     labelFreq : int
         Label every nth frequency on the plot
+    n_jobs : int, optional
+        Number of worker threads used to compute the frequency responses of
+        the systems in syslist before plotting.  If -1, use one thread per
+        CPU.  The default (None) computes the responses sequentially.
+        Keyword only.
+    executor : concurrent.futures.Executor, optional
+        Executor used to compute the frequency responses (e.g., a
+        ProcessPoolExecutor).  Overrides n_jobs.  Keyword only.
     \*args, \**kwargs:
         Additional options to matplotlib (color, linestyle, etc)
 
     Returns
     -------
-    real : array
+    real : array (list if len(syslist) > 1)
         real part of the frequency response array
-    imag : array
+    imag : array (list if len(syslist) > 1)
         imaginary part of the frequency response array
-    freq : array
+    freq : array (list if len(syslist) > 1)
         frequencies
 
     Examples
@@ -430,6 +475,10 @@ def nyquist_plot(syslist, omega=None, Plot=True, color=None,
     >>> real, imag, freq = nyquist_plot(sys)
 
     """
+    # Options for computing the responses, not passed on to matplotlib
+    n_jobs = kwargs.pop('n_jobs', None)
+    executor = kwargs.pop('executor', None)
+
     # If argument was a singleton, turn it into a list
     if not getattr(syslist, '__iter__', False):
         syslist = (syslist,)
@@ -451,54 +500,63 @@ def nyquist_plot(syslist, omega=None, Plot=True, color=None,
         if sys.inputs > 1 or sys.outputs > 1:
             # TODO: Add MIMO nyquist plots.
             raise NotImplementedError("Nyquist is currently only implemented for SISO systems.")
-        else:
-            # Get the magnitude and phase of the system
-            mag_tmp, phase_tmp, omega = sys.freqresp(omega)
-            mag = np.squeeze(mag_tmp)
-            phase = np.squeeze(phase_tmp)
-
-            # Compute the primary curve
-            x = sp.multiply(mag, sp.cos(phase))
-            y = sp.multiply(mag, sp.sin(phase))
-
-            if Plot:
-                # Plot the primary curve and mirror image
-                p = plt.plot(x, y, '-', color=color, *args, **kwargs)
-                c = p[0].get_color()
-                ax = plt.gca()
-                # Plot arrow to indicate Nyquist encirclement orientation
-                ax.arrow(x[0], y[0], (x[1]-x[0])/2, (y[1]-y[0])/2, fc=c, ec=c,
-                         head_width=0.2, head_length=0.2)
-
-                plt.plot(x, -y, '-', color=c, *args, **kwargs)
-                ax.arrow(x[-1], -y[-1], (x[-1]-x[-2])/2, (y[-1]-y[-2])/2, fc=c, ec=c,
-                         head_width=0.2, head_length=0.2)
-
-                # Mark the -1 point
-                plt.plot([-1], [0], 'r+')
-
-            # Label the frequencies of the points
-            if labelFreq:
-                ind = slice(None, None, labelFreq)
-                for xpt, ypt, omegapt in zip(x[ind], y[ind], omega[ind]):
-                    # Convert to Hz
-                    f = omegapt / (2 * sp.pi)
-
-                    # Factor out multiples of 1000 and limit the
-                    # result to the range [-8, 8].
-                    pow1000 = max(min(get_pow1000(f), 8), -8)
-
-                    # Get the SI prefix.
-                    prefix = gen_prefix(pow1000)
-
-                    # Apply the text. (Use a space before the text to
-                    # prevent overlap with the data.)
-                    #
-                    # np.round() is used because 0.99... appears
-                    # instead of 1.0, and this would otherwise be
-                    # truncated to 0.
-                    plt.text(xpt, ypt, ' ' + str(int(np.round(f / 1000 ** pow1000, 0))) + ' ' +
-                             prefix + 'Hz')
+
+    # Compute the frequency responses for all systems up front
+    responses = _freqresp_list(
+        syslist, [np.array(omega) for sys in syslist], n_jobs, executor)
+
+    xs, ys, omegas = [], [], []
+    for sys, response in zip(syslist, responses):
+        # Get the magnitude and phase of the system
+        mag_tmp, phase_tmp, omega = response
+        mag = np.squeeze(mag_tmp)
+        phase = np.squeeze(phase_tmp)
+
+        # Compute the primary curve
+        x = sp.multiply(mag, sp.cos(phase))
+        y = sp.multiply(mag, sp.sin(phase))
+        xs.append(x)
+        ys.append(y)
+        omegas.append(omega)
+
+        if Plot:
+            # Plot the primary curve and mirror image
+            p = plt.plot(x, y, '-', color=color, *args, **kwargs)
+            c = p[0].get_color()
+            ax = plt.gca()
+            # Plot arrow to indicate Nyquist encirclement orientation
+            ax.arrow(x[0], y[0], (x[1]-x[0])/2, (y[1]-y[0])/2, fc=c, ec=c,
+                     head_width=0.2, head_length=0.2)
+
+            plt.plot(x, -y, '-', color=c, *args, **kwargs)
+            ax.arrow(x[-1], -y[-1], (x[-1]-x[-2])/2, (y[-1]-y[-2])/2, fc=c, ec=c,
+                     head_width=0.2, head_length=0.2)
+
+            # Mark the -1 point
+            plt.plot([-1], [0], 'r+')
+
+        # Label the frequencies of the points
+        if labelFreq:
+            ind = slice(None, None, labelFreq)
+            for xpt, ypt, omegapt in zip(x[ind], y[ind], omega[ind]):
+                # Convert to Hz
+                f = omegapt / (2 * sp.pi)
+
+                # Factor out multiples of 1000 and limit the
+                # result to the range [-8, 8].
+                pow1000 = max(min(get_pow1000(f), 8), -8)
+
+                # Get the SI prefix.
+                prefix = gen_prefix(pow1000)
+
+                # Apply the text. (Use a space before the text to
+                # prevent overlap with the data.)
+                #
+                # np.round() is used because 0.99... appears
+                # instead of 1.0, and this would otherwise be
+                # truncated to 0.
+                plt.text(xpt, ypt, ' ' + str(int(np.round(f / 1000 ** pow1000, 0))) + ' ' +
+                         prefix + 'Hz')
 
     if Plot:
         ax = plt.gca()
@@ -506,7 +564,10 @@ def nyquist_plot(syslist, omega=None, Plot=True, color=None,
         ax.set_ylabel("Imaginary axis")
         ax.grid(color="lightgray")
 
-    return x, y, omega
+    if len(syslist) == 1:
+        return xs[0], ys[0], omegas[0]
+    else:
+        return xs, ys, omegas
 
 
 # TODO: think about how (and whether) to handle lists of systems
@@ -592,7 +653,7 @@ def gangof4_plot(P, C, omega=None):
 
 # Compute reasonable defaults for axes
 def default_frequency_range(syslist, Hz=None, number_of_samples=None, 
-                            feature_periphery_decade=None):
+                            feature_periphery_decade=None, adaptive=None):
     """Compute a reasonable default frequency range for frequency
     domain plots.
 
@@ -622,6 +683,15 @@ def default_frequency_range(syslist, Hz=None, number_of_samples=None,
         0.1 .. 10 Hz.  The default value is read from
         ``config.bode_feature_periphery_decade``.
 
+    adaptive : bool, optional
+        If True, start from a coarse grid and recursively refine it where
+        the magnitude or phase of the frequency responses is poorly
+        approximated by linear interpolation (in log frequency), close to
+        lightly damped poles and zeros and around gain and phase
+        crossovers.  In this case number_of_samples is the maximum number
+        of points returned.  The default value is read from
+        ``config.bode_adaptive_grid``.
+
     Returns
     -------
     omega : array
@@ -646,10 +716,13 @@ def default_frequency_range(syslist, Hz=None, number_of_samples=None,
         number_of_samples = config.bode_number_of_samples
     if feature_periphery_decade is None:
         feature_periphery_decade = config.bode_feature_periphery_decade
+    if adaptive is None:
+        adaptive = config.bode_adaptive_grid
 
     # Find the list of all poles and zeros in the systems
     features = np.array(())
     freq_interesting = []
+    resonances = []
 
     # detect if single sys passed by checking if it is sequence-like
     if not getattr(syslist, '__iter__', False):
@@ -659,9 +732,10 @@ def default_frequency_range(syslist, Hz=None, number_of_samples=None,
         try:
             # Add new features to the list
             if sys.isctime():
-                features_ = np.concatenate((np.abs(sys.pole()),
-                                            np.abs(sys.zero())))
+                roots_ = np.concatenate((sys.pole(), sys.zero()))
+                features_ = np.abs(roots_)
                 # Get rid of poles and zeros at the origin
+                resonances.append(roots_[features_ != 0.0])
                 features_ = features_[features_ != 0.0]
                 features = np.concatenate((features, features_))
             elif sys.isdtime(strict=True):
@@ -680,6 +754,7 @@ def default_frequency_range(syslist, Hz=None, number_of_samples=None,
                 # TODO: improve
                 features__ = np.abs(np.log(features_) / (1.j * sys.dt))
                 features = np.concatenate((features, features__))
+                resonances.append(np.log(features_) / sys.dt)
             else:
                 # TODO
                 raise NotImplementedError('type of system in not implemented now')
@@ -709,13 +784,115 @@ def default_frequency_range(syslist, Hz=None, number_of_samples=None,
     # (Attention: there is a list of system but only one omega vector)
 
     # Set the range to be an order of magnitude beyond any features
-    if number_of_samples:
+    if adaptive:
+        omega = _adaptive_frequency_grid(
+            syslist, lsp_min, lsp_max, np.concatenate([[]] + resonances),
+            max_points=number_of_samples or 1000)
+    elif number_of_samples:
         omega = sp.logspace(lsp_min, lsp_max, num=number_of_samples, endpoint=True)
     else:
         omega = sp.logspace(lsp_min, lsp_max, endpoint=True)
     return omega
 
 
+def _adaptive_frequency_grid(syslist, lsp_min, lsp_max, roots,
+                             max_points=1000, tol_dB=0.1, tol_deg=1.,
+                             points_per_decade=5, min_decade=1e-4,
+                             crossover_decade=1e-2):
+    """Generate a frequency grid adapted to the responses of syslist.
+
+    The grid starts out with points_per_decade points per decade between
+    10**lsp_min and 10**lsp_max, plus points at the natural frequency and
+    the half power frequencies of every lightly damped root in roots (given
+    as continuous time poles and zeros).  Each interval is then repeatedly
+    split at its (logarithmic) midpoint if the response at the midpoint
+    differs from the interpolated response by more than tol_dB in
+    magnitude or tol_deg in phase, or if the interval contains a gain or
+    phase crossover and is wider than crossover_decade.  Intervals
+    narrower than min_decade are never split, and the grid never grows
+    beyond max_points.  If the seed grid alone has more than max_points
+    points, it is thinned out evenly across the whole range.
+    """
+    wmin, wmax = 10. ** lsp_min, 10. ** lsp_max
+    num = max(int(np.ceil((lsp_max - lsp_min) * points_per_decade)) + 1, 2)
+    omega = np.logspace(lsp_min, lsp_max, num=num, endpoint=True)
+
+    # Add points around lightly damped poles and zeros
+    wn = np.abs(roots)
+    zeta = -np.real(roots) / np.where(wn > 0, wn, 1.)
+    light = np.abs(zeta) < 0.5
+    wn, zeta = wn[light], np.abs(zeta[light])
+    omega = np.concatenate((omega, wn, wn * (1. - zeta), wn * (1. + zeta)))
+    omega = np.unique(omega[(omega >= wmin) & (omega <= wmax)])
+
+    # If the seed grid is already too large, thin it out evenly so that it
+    # still covers the full frequency range
+    max_points = max(max_points, 2)
+    if len(omega) > max_points:
+        omega = omega[np.unique(np.round(
+            np.linspace(0, len(omega) - 1, max_points)).astype(int))]
+
+    def _eval(w):
+        # Stack the responses of all channels of all systems into one array
+        # (discrete time responses are only evaluated below the Nyquist
+        # frequency and are set to NaN above it)
+        resp = [np.empty((0, len(w)))]
+        for sys in syslist:
+            valid = np.ones(len(w), dtype=bool)
+            if sys.isdtime(strict=True):
+                valid = w < math.pi / sys.dt
+            mag, phase, _ = sys.freqresp(np.array(w[valid]))
+            resp_sys = np.full((sys.outputs * sys.inputs, len(w)), np.nan,
+                               dtype=complex)
+            resp_sys[:, valid] = np.reshape(mag * np.exp(1j * phase),
+                                            (-1, np.count_nonzero(valid)))
+            resp.append(resp_sys)
+        return np.concatenate(resp)
+
+    resp = _eval(omega)
+    active = np.ones(len(omega) - 1, dtype=bool)
+    while active.any() and len(omega) < max_points:
+        idx = np.nonzero(active)[0]
+        wmid = np.sqrt(omega[idx] * omega[idx + 1])
+        resp_mid = _eval(wmid)
+        resp_lo, resp_hi = resp[:, idx], resp[:, idx + 1]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Compare against linear interpolation of the log of the
+            # response, measuring phase relative to the lower point
+            err_mag = 20. * np.abs(np.log10(np.abs(resp_mid)) - 0.5 * (
+                np.log10(np.abs(resp_lo)) + np.log10(np.abs(resp_hi))))
+            err_phase = np.degrees(np.abs(
+                np.angle(resp_mid / resp_lo) -
+                0.5 * np.angle(resp_hi / resp_lo)))
+            err = np.fmax(np.nan_to_num(err_mag) / tol_dB,
+                          np.nan_to_num(err_phase) / tol_deg).max(axis=0)
+
+            # Gain crossovers and phase crossovers (through -180 deg)
+            cross = ((np.abs(resp_lo) - 1.) * (np.abs(resp_hi) - 1.) <= 0) | \
+                ((np.imag(resp_lo) * np.imag(resp_hi) <= 0) &
+                 ((np.real(resp_lo) < 0) | (np.real(resp_hi) < 0)))
+            cross = cross.any(axis=0)
+
+        width = np.log10(omega[idx + 1] / omega[idx])
+        refine = ((err > 1.) & (width > min_decade)) | \
+            (cross & (width > crossover_decade))
+        refine = np.nonzero(refine)[0][:max_points - len(omega)]
+        if len(refine) == 0:
+            break
+
+        # Insert the new points and mark the intervals next to them as
+        # the only ones that still need to be checked
+        omega = np.insert(omega, idx[refine] + 1, wmid[refine])
+        resp = np.insert(resp, idx[refine] + 1, resp_mid[:, refine], axis=1)
+        new = idx[refine] + 1 + np.arange(len(refine))
+        active = np.zeros(len(omega) - 1, dtype=bool)
+        active[new - 1] = True
+        active[new[new < len(active)]] = True
+
+    return omega
+
+
 #
 # KLD 5/23/11: Two functions to create nice looking labels
 #
@@ -765,6 +942,38 @@ def find_nearest_omega(omega_list, omega):
     idx = (np.abs(omega_list - omega)).argmin()
     return omega_list[(np.abs(omega_list - omega)).argmin()]
 
+
+def _freqresp(sys, omega):
+    # Module level function, so that it can be sent to a process pool
+    return sys.freqresp(omega)
+
+
+def _freqresp_list(syslist, omega_list, n_jobs=None, executor=None):
+    """Compute the frequency responses for a list of systems.
+
+    Returns a list of (mag, phase, omega) tuples, one per system in
+    syslist, evaluated at the matching frequency vector in omega_list.  If
+    an executor is given, or n_jobs is not None or 1, the responses are
+    computed in parallel.
+    """
+    if n_jobs is not None and (not isinstance(n_jobs, (int, np.integer)) or
+                               n_jobs == 0 or n_jobs < -1):
+        raise ValueError("Parameter ``n_jobs``: must be a positive integer "
+                         "or -1 (one thread per CPU); got %r." % (n_jobs,))
+    if executor is not None:
+        return list(executor.map(_freqresp, syslist, omega_list))
+
+    if n_jobs is None or n_jobs == 1 or len(syslist) < 2:
+        return [_freqresp(sys, omega)
+                for sys, omega in zip(syslist, omega_list)]
+
+    # Most of the work is done in NumPy/LAPACK, which releases the GIL
+    from concurrent.futures import ThreadPoolExecutor
+    import os
+    max_workers = os.cpu_count() if n_jobs < 0 else n_jobs
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_freqresp, syslist, omega_list))
+
 # Function aliases
 bode = bode_plot
 nyquist = nyquist_plot
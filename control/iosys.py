@@ -79,16 +79,19 @@ __email__ = "murray@cds.caltech.edu"
 
 import numpy as np
 import scipy as sp
+from scipy import sparse
+from scipy.sparse.linalg import splu
 import copy
 from warnings import warn
 
 from .statesp import StateSpace, tf2ss
-from .timeresp import _check_convert_array
+from .timeresp import _check_convert_array, forced_response
 from .lti import isctime, isdtime, _find_timebase
 
 __all__ = ['InputOutputSystem', 'LinearIOSystem', 'NonlinearIOSystem',
-           'InterconnectedSystem', 'input_output_response', 'find_eqpt',
-           'linearize', 'ss2io', 'tf2io']
+           'InterconnectedSystem', 'input_output_response',
+           'input_output_response_chunks', 'find_eqpt', 'linearize',
+           'ss2io', 'tf2io']
 
 
 class InputOutputSystem(object):
@@ -153,7 +156,20 @@ class InputOutputSystem(object):
     * _out(t, x, u): compute the output for the current state of the system.
       The default is to return the entire system state.
 
+    Systems with the `vectorized` attribute set to True also implement
+    _rhs_vectorized(t, x, u) and _out_vectorized(t, x, u), which evaluate
+    the right hand side and the output for a block of states and inputs,
+    given as the columns of 2D arrays.  These are used to evaluate many
+    states in a single call, for example by the implicit solvers of
+    `scipy.integrate.solve_ivp`.
+
+    Systems with a known Jacobian of the right hand side with respect to
+    the state implement _rhs_jacobian(t, x, u); the default returns None.
+
     """
+    # Systems only implement _rhs and _out unless stated otherwise
+    vectorized = False
+
     def __init__(self, inputs=None, outputs=None, states=None, params={},
                  dt=None, name=None):
         """Create an input/output system.
@@ -415,6 +431,20 @@ class InputOutputSystem(object):
         # If no output function was defined in subclass, return state
         return x
 
+    def _rhs_jacobian(self, t, x, u):
+        """Jacobian of the right hand side with respect to x, if known"""
+        return None
+
+    def _rhs_vectorized(self, t, x, u):
+        """Evaluate the right hand side for the columns of x and u"""
+        return np.column_stack([self._rhs(t, x[:, i], u[:, i])
+                                for i in range(x.shape[1])])
+
+    def _out_vectorized(self, t, x, u):
+        """Evaluate the output for the columns of x and u"""
+        return np.column_stack([self._out(t, x[:, i], u[:, i])
+                                for i in range(x.shape[1])])
+
     def set_inputs(self, inputs, prefix='u'):
         """Set the number/names of the system inputs.
 
@@ -627,6 +657,8 @@ class LinearIOSystem(InputOutputSystem, StateSpace):
     space system (defined by the StateSpace system object).
 
     """
+    vectorized = True
+
     def __init__(self, linsys, inputs=None, outputs=None, states=None,
                  name=None):
         """Create an I/O system from a state space linear system.
@@ -710,6 +742,15 @@ class LinearIOSystem(InputOutputSystem, StateSpace):
         y = self.C * np.reshape(x, (-1, 1)) + self.D * np.reshape(u, (-1, 1))
         return np.array(y).reshape((self.noutputs,))
 
+    def _rhs_jacobian(self, t, x, u):
+        return np.asarray(self.A)
+
+    def _rhs_vectorized(self, t, x, u):
+        return np.asarray(np.dot(self.A, x) + np.dot(self.B, u))
+
+    def _out_vectorized(self, t, x, u):
+        return np.asarray(np.dot(self.C, x) + np.dot(self.D, u))
+
 
 class NonlinearIOSystem(InputOutputSystem):
     """Nonlinear I/O system.
@@ -719,7 +760,8 @@ class NonlinearIOSystem(InputOutputSystem):
 
     """
     def __init__(self, updfcn, outfcn=None, inputs=None, outputs=None,
-                 states=None, params={}, dt=None, name=None):
+                 states=None, params={}, dt=None, name=None,
+                 vectorized=False, jacfcn=None):
         """Create a nonlinear I/O system given update and output functions.
 
         Creates an `InputOutputSystem` for a nonlinear system by specifying a
@@ -779,6 +821,25 @@ class NonlinearIOSystem(InputOutputSystem):
         name : string, optional
             System name (used for specifying signals).
 
+        vectorized : bool, optional
+            If True, `updfcn` and `outfcn` also accept a block of states and
+            inputs, as 2D arrays with shape (nstates, k) and (ninputs, k),
+            and return the results for all k columns at once.  Solvers that
+            evaluate many states, such as the implicit methods 'BDF' and
+            'Radau' in input_output_response, can then evaluate them in a
+            single call.  Default is False.
+
+        jacfcn : callable, optional
+            Function returning the Jacobian of `updfcn` with respect to the
+            state, as an array with shape (nstates, nstates)
+
+                `jacfcn(t, x, u[, param]) -> array`
+
+            where the arguments are the same as for `updfcn`.  If given, it
+            is used by the implicit solvers 'BDF', 'Radau' and 'LSODA' in
+            input_output_response, also when the system is part of an
+            interconnection.
+
         Returns
         -------
         iosys : NonlinearIOSystem
@@ -788,6 +849,8 @@ class NonlinearIOSystem(InputOutputSystem):
         # Store the update and output functions
         self.updfcn = updfcn
         self.outfcn = outfcn
+        self.vectorized = vectorized
+        self.jacfcn = jacfcn
 
         # Initialize the rest of the structure
         super(NonlinearIOSystem, self).__init__(
@@ -831,6 +894,27 @@ class NonlinearIOSystem(InputOutputSystem):
             if self.outfcn is not None else x
         return np.array(y).reshape((-1,))
 
+    def _rhs_jacobian(self, t, x, u):
+        if self.jacfcn is None:
+            return None
+        jac = self.jacfcn(t, x, u, self._current_params)
+        return np.array(jac, dtype=float).reshape(
+            (self.nstates, self.nstates))
+
+    def _rhs_vectorized(self, t, x, u):
+        if not self.vectorized:
+            return super(NonlinearIOSystem, self)._rhs_vectorized(t, x, u)
+        xdot = self.updfcn(t, x, u, self._current_params) \
+            if self.updfcn is not None else np.zeros((0, x.shape[1]))
+        return np.array(xdot).reshape((-1, x.shape[1]))
+
+    def _out_vectorized(self, t, x, u):
+        if not self.vectorized:
+            return super(NonlinearIOSystem, self)._out_vectorized(t, x, u)
+        y = self.outfcn(t, x, u, self._current_params) \
+            if self.outfcn is not None else x
+        return np.array(y).reshape((-1, x.shape[1]))
+
 
 class InterconnectedSystem(InputOutputSystem):
     """Interconnection of a set of input/output systems.
@@ -1047,6 +1131,11 @@ class InterconnectedSystem(InputOutputSystem):
         x = np.array(x, ndmin=1)
         u = np.array(u, ndmin=1)
 
+        # Use the compiled right hand side, if there are no algebraic loops
+        compiled = self._compile()
+        if compiled is not None:
+            return compiled.rhs(t, x, u)
+
         # Compute the input and output vectors
         ulist, ylist = self._compute_static_io(t, x, u)
 
@@ -1077,7 +1166,90 @@ class InterconnectedSystem(InputOutputSystem):
         # Make the full set of subsystem outputs to system output
         return np.dot(self.output_map, ylist)
 
+    def _rhs_jacobian(self, t, x, u):
+        """Sparse Jacobian of the right hand side, from the subsystems
+
+        The Jacobians of the subsystem right hand sides are combined with
+        the linearizations of their inputs and outputs (exact for linear
+        subsystems, by finite differences of single subsystems otherwise)
+        through the connection map.  Returns None if a subsystem has no
+        Jacobian or the interconnection has an algebraic loop.
+        """
+        x = np.array(x, ndmin=1)
+        u = np.array(u, ndmin=1)
+        compiled = self._compile()
+        if compiled is None:
+            return None
+        ulist, ylist = compiled.static_io(t, x, u)
+
+        # Block diagonal linearization of the subsystems
+        blocks = []
+        for sys, xoff, uoff in zip(
+                self.syslist, self.state_offset, self.input_offset):
+            blocks.append(_local_linearization(
+                sys, t, x[xoff:xoff + sys.nstates],
+                ulist[uoff:uoff + sys.ninputs]))
+            if blocks[-1] is None:
+                return None
+        A, B, C, D = [sparse.block_diag([block[i] for block in blocks],
+                                        format='csc') for i in range(4)]
+
+        # The subsystem inputs depend on the states through
+        # ulist = K (C x + D ulist) + ..., with I - K D invertible
+        K = sparse.csc_matrix(self.connect_map)
+        M = (sparse.identity(K.shape[0], format='csc') - K * D).tocsc()
+        if M.shape[0] == 0 or self.nstates == 0:
+            return A
+        dudx = splu(M).solve((K * C).toarray())
+        return (A + B * sparse.csc_matrix(dudx)).tocsc()
+
+    def _jac_sparsity(self):
+        """Structure of the Jacobian of the right hand side
+
+        Returns a sparse matrix that is nonzero where the right hand side
+        of a subsystem can depend on a state, through the connections, or
+        None if the interconnection has an algebraic loop.
+        """
+        if self._compile() is None:
+            return None
+        A, B, C, D = [sparse.block_diag(
+            [_linearization_pattern(sys)[i] for sys in self.syslist],
+            format='csc') for i in range(4)]
+
+        # Signals reach the subsystem inputs through chains of feedthrough
+        K = sparse.csc_matrix(self.connect_map != 0, dtype=float)
+        reach = (K * C).astype(bool).astype(float)
+        step = reach
+        for count in range(len(self.syslist)):
+            step = (K * D * step).astype(bool).astype(float)
+            reach = (reach + step).astype(bool).astype(float)
+        return (A + B * reach).astype(bool).astype(float).tocsc()
+
+    @property
+    def vectorized(self):
+        """True if all subsystems are vectorized, without algebraic loops"""
+        return all(sys.vectorized for sys in self.syslist) and \
+            self._compile() is not None
+
+    def _rhs_vectorized(self, t, x, u):
+        compiled = self._compile()
+        if compiled is None:
+            return super(InterconnectedSystem, self)._rhs_vectorized(t, x, u)
+        return compiled.rhs(t, x, u)
+
+    def _out_vectorized(self, t, x, u):
+        compiled = self._compile()
+        if compiled is None:
+            return super(InterconnectedSystem, self)._out_vectorized(t, x, u)
+        ulist, ylist = compiled.static_io(t, x, u)
+        return np.dot(self.output_map, ylist)
+
     def _compute_static_io(self, t, x, u):
+        # Use the compiled evaluation order, if there are no algebraic loops
+        compiled = self._compile()
+        if compiled is not None:
+            return compiled.static_io(t, x, u)
+
         # Figure out the total number of inputs and outputs
         (ninputs, noutputs) = self.connect_map.shape
 
@@ -1135,6 +1307,71 @@ class InterconnectedSystem(InputOutputSystem):
 
         return ulist, ylist
 
+    def _linear_statespace(self):
+        """State space form of an interconnection of linear systems
+
+        If all subsystems are linear (LinearIOSystem, or interconnections
+        of linear systems) and there are no algebraic loops, returns a
+        StateSpace system with the same inputs, outputs and states as the
+        interconnection.  Otherwise returns None.
+        """
+        subsystems = [_linear_statespace(sys) for sys in self.syslist]
+        if any(sys is None for sys in subsystems) or self._compile() is None:
+            return None
+
+        # Block diagonal system with all subsystem inputs and outputs
+        ninputs, noutputs = self.connect_map.shape
+        A = np.zeros((self.nstates, self.nstates))
+        B = np.zeros((self.nstates, ninputs))
+        C = np.zeros((noutputs, self.nstates))
+        D = np.zeros((noutputs, ninputs))
+        for sys, xoff, uoff, yoff in zip(
+                subsystems, self.state_offset, self.input_offset,
+                self.output_offset):
+            xs = slice(xoff, xoff + sys.states)
+            us = slice(uoff, uoff + sys.inputs)
+            ys = slice(yoff, yoff + sys.outputs)
+            A[xs, xs], B[xs, us] = sys.A, sys.B
+            C[ys, xs], D[ys, us] = sys.C, sys.D
+
+        # Close the connections: ulist = K (C x + D ulist) + input_map u,
+        # where I - K D is invertible since there are no algebraic loops
+        K = np.asarray(self.connect_map)
+        F = np.linalg.solve(np.eye(ninputs) - np.dot(K, D),
+                            np.hstack((np.dot(K, C), self.input_map)))
+        Fx, Fu = F[:, :self.nstates], F[:, self.nstates:]
+
+        # The outputs are combinations of the subsystem outputs and inputs
+        Y = np.block([[C + np.dot(D, Fx), np.dot(D, Fu)], [Fx, Fu]])
+        Y = np.dot(self.output_map, Y)
+        return StateSpace(
+            A + np.dot(B, Fx), np.dot(B, Fu), Y[:, :self.nstates],
+            Y[:, self.nstates:], self.dt, remove_useless=False)
+
+    def _compile(self):
+        """Compile the interconnection for fast evaluation
+
+        The connection graph is analyzed once: the subsystems are sorted
+        so that each subsystem comes after the subsystems whose outputs
+        feed through to its own outputs, and the slices and the nonzero
+        entries of the connection map are stored for each subsystem.  The
+        static signals then follow from a single pass over the subsystems,
+        without the fixed point iteration in _compute_static_io.
+
+        Returns a _CompiledInterconnection, or None if the interconnection
+        has an algebraic loop.  The result is kept until the connection or
+        input map is replaced (set_connect_map, set_input_map).
+        """
+        maps = (self.connect_map, self.input_map)
+        cache = getattr(self, '_compiled', None)
+        if cache is not None and cache[0] is maps[0] and \
+           cache[1] is maps[1]:
+            return cache[2]
+
+        compiled = _CompiledInterconnection.create(self)
+        self._compiled = maps + (compiled,)
+        return compiled
+
     def _parse_input_spec(self, spec):
         """Parse an input specification and returns the index
 
@@ -1358,8 +1595,218 @@ class InterconnectedSystem(InputOutputSystem):
         self.noutputs = output_map.shape[0]
 
 
-def input_output_response(sys, T, U=0., X0=0, params={}, method='RK45',
-                          return_x=False, squeeze=True):
+class _CompiledInterconnection(object):
+    """Evaluation order and signal maps of an InterconnectedSystem"""
+    def __init__(self, connect_map, input_map, blocks, delayed, dynamic,
+                 nstates):
+        self.connect_map = connect_map
+        self.input_map = input_map
+        self.blocks = blocks
+        self.delayed = delayed
+        self.dynamic = dynamic
+        self.nstates = nstates
+
+    @classmethod
+    def create(cls, iosys):
+        """Compile an InterconnectedSystem, or None for algebraic loops"""
+        connect_map = np.asarray(iosys.connect_map)
+        input_map = np.asarray(iosys.input_map)
+
+        # Slices into the state, input and output vectors
+        slices = []
+        for sys, xoff, uoff, yoff in zip(
+                iosys.syslist, iosys.state_offset, iosys.input_offset,
+                iosys.output_offset):
+            slices.append((slice(xoff, xoff + sys.nstates),
+                           slice(uoff, uoff + sys.ninputs),
+                           slice(yoff, yoff + sys.noutputs)))
+
+        # Subsystem j depends on i if an output of i reaches an input of j
+        # that feeds through to the outputs of j
+        nsys = len(iosys.syslist)
+        depends = [set() for sys in iosys.syslist]
+        for j, sys in enumerate(iosys.syslist):
+            feedthrough = _feedthrough_inputs(sys)
+            rows = connect_map[slices[j][1]][feedthrough]
+            for i in range(nsys):
+                if np.any(rows[:, slices[i][2]] != 0):
+                    depends[j].add(i)
+
+        # Topological sort (Kahn), keeping the order of syslist for ties
+        order, done = [], set()
+        while len(order) < nsys:
+            ready = [j for j in range(nsys)
+                     if j not in done and depends[j] <= done]
+            if not ready:
+                return None     # algebraic loop
+            order.extend(ready)
+            done.update(ready)
+
+        # For each subsystem, the nonzero columns of its connection rows.
+        # Inputs from subsystems later in the order do not feed through;
+        # they are recomputed after the pass, for use in the states.
+        position = dict((j, k) for k, j in enumerate(order))
+        blocks, delayed = [], []
+        for j in order:
+            xs, us, ys = slices[j]
+            rows = connect_map[us]
+            cols = np.nonzero(np.any(rows != 0, axis=0))[0]
+            block = (iosys.syslist[j], xs, us, ys, cols, rows[:, cols])
+            blocks.append(block)
+            if any(position[i] >= position[j] and
+                   np.any(rows[:, slices[i][2]] != 0) for i in range(nsys)):
+                delayed.append(block)
+        dynamic = [(sys, xs, us) for sys, xs, us, ys, cols, gains in blocks
+                   if sys.nstates != 0]
+        return cls(connect_map, input_map, blocks, delayed, dynamic,
+                   iosys.nstates)
+
+    def static_io(self, t, x, u):
+        """Subsystem inputs and outputs, as in _compute_static_io
+
+        States and inputs given as 2D arrays are evaluated column by
+        column, using the vectorized functions of the subsystems.
+        """
+        batch = np.shape(x)[1:]
+        ulist = np.dot(self.input_map, u)
+        yout = np.zeros((self.connect_map.shape[1],) + batch)
+        for sys, xs, us, ys, cols, gains in self.blocks:
+            ulist[us] += np.dot(gains, yout[cols])
+            ysys = sys._out_vectorized(t, x[xs], ulist[us]) if batch \
+                else sys._out(t, x[xs], ulist[us])
+            yout[ys] = np.reshape(ysys, (-1,) + batch)
+
+        # Inputs that do not feed through were evaluated before all of
+        # their sources; recompute them from the final outputs
+        if self.delayed:
+            uext = np.dot(self.input_map, u)
+            for sys, xs, us, ys, cols, gains in self.delayed:
+                ulist[us] = uext[us] + np.dot(gains, yout[cols])
+        return ulist, np.concatenate((yout, ulist))
+
+    def rhs(self, t, x, u):
+        """State derivatives (or updates) of the subsystems"""
+        batch = np.shape(x)[1:]
+        ulist, _ylist = self.static_io(t, x, u)
+        xdot = np.zeros((self.nstates,) + batch)
+        for sys, xs, us in self.dynamic:
+            xdot[xs] = sys._rhs_vectorized(t, x[xs], ulist[us]) if batch \
+                else sys._rhs(t, x[xs], ulist[us])
+        return xdot
+
+
+def _linear_statespace(sys):
+    """StateSpace form of a linear input/output system, or None"""
+    if isinstance(sys, LinearIOSystem):
+        return sys
+    elif isinstance(sys, InterconnectedSystem):
+        return sys._linear_statespace()
+    else:
+        return None
+
+
+def _local_linearization(sys, t, x, u, eps=1e-6):
+    """Matrices A, B, C, D of a subsystem, or None without a Jacobian
+
+    A is the Jacobian of the right hand side; B, C and D are computed by
+    finite differences unless the subsystem is linear.
+    """
+    if isinstance(sys, LinearIOSystem):
+        return [np.asarray(M) for M in (sys.A, sys.B, sys.C, sys.D)]
+    A = sys._rhs_jacobian(t, x, u) if sys.nstates > 0 \
+        else np.zeros((0, 0))
+    if A is None:
+        return None
+    A = A.toarray() if sparse.issparse(A) else np.asarray(A)
+
+    F0, H0 = sys._rhs(t, x, u), sys._out(t, x, u)
+    B = np.zeros((sys.nstates, sys.ninputs))
+    C = np.zeros((sys.noutputs, sys.nstates))
+    D = np.zeros((sys.noutputs, sys.ninputs))
+    for i in range(sys.nstates):
+        dx = np.zeros((sys.nstates,))
+        dx[i] = eps
+        C[:, i] = (sys._out(t, x + dx, u) - H0) / eps
+    for i in range(sys.ninputs):
+        du = np.zeros((sys.ninputs,))
+        du[i] = eps
+        if sys.nstates > 0:
+            B[:, i] = (sys._rhs(t, x, u + du) - F0) / eps
+        D[:, i] = (sys._out(t, x, u + du) - H0) / eps
+    return A, B, C, D
+
+
+def _linearization_pattern(sys):
+    """Structure of the matrices A, B, C, D of a subsystem"""
+    if isinstance(sys, LinearIOSystem):
+        return [np.asarray(M) != 0 for M in (sys.A, sys.B, sys.C, sys.D)]
+    D = np.ones((sys.noutputs, sys.ninputs), dtype=bool)
+    D[:, ~_feedthrough_inputs(sys)] = False
+    if isinstance(sys, InterconnectedSystem) and \
+       sys._jac_sparsity() is not None:
+        A = sys._jac_sparsity().toarray() != 0
+    else:
+        A = np.ones((sys.nstates, sys.nstates), dtype=bool)
+    return [A, np.ones((sys.nstates, sys.ninputs), dtype=bool),
+            np.ones((sys.noutputs, sys.nstates), dtype=bool), D]
+
+
+def _feedthrough_inputs(sys):
+    """Mask of the inputs of sys that can feed through to its outputs"""
+    if isinstance(sys, StateSpace):
+        return np.any(np.asarray(sys.D) != 0, axis=0)
+    elif isinstance(sys, NonlinearIOSystem) and sys.outfcn is None:
+        return np.zeros(sys.ninputs, dtype=bool)
+    else:
+        return np.ones(sys.ninputs, dtype=bool)
+
+
+class _InputSampler(object):
+    """Input signal U, defined at the times T, as a function of time
+
+    Replaces scipy.interpolate.interp1d for the input lookups in the
+    simulations: on a uniform time grid the sample index follows from the
+    time directly, otherwise by bisection.  With kind='linear' the input
+    is interpolated between the samples and extrapolated linearly outside
+    of T; with kind='zoh' each sample is held until the next one.
+    Returns arrays with shape U.shape[:-1], as interp1d does.
+    """
+    def __init__(self, T, U, kind='linear'):
+        if kind not in ('linear', 'zoh'):
+            raise ValueError("unknown interpolation kind '%s'" % kind)
+        self.T = np.asarray(T, dtype=float)
+        U = np.asarray(U, dtype=float)
+        self.shape = U.shape[:-1]
+        self.U = U.reshape((-1, U.shape[-1]))
+        self.kind = kind
+        self.T0 = self.T[0]
+        self.dt = self.T[1] - self.T[0] if len(self.T) > 1 else 0
+        self.uniform = len(self.T) > 1 and \
+            np.allclose(np.diff(self.T), self.dt)
+
+    def __call__(self, t):
+        nsamples = len(self.T)
+        if nsamples == 1:
+            return self.U[:, 0].reshape(self.shape)
+
+        # Index of the sample at or before t (up to rounding of t)
+        if self.uniform:
+            k = int(np.floor((t - self.T0) / self.dt + 1e-9))
+        else:
+            k = int(np.searchsorted(self.T, t, side='right')) - 1
+
+        if self.kind == 'zoh':
+            value = self.U[:, min(max(k, 0), nsamples - 1)]
+        else:
+            k = min(max(k, 0), nsamples - 2)
+            frac = (t - self.T[k]) / (self.T[k + 1] - self.T[k])
+            value = self.U[:, k] + frac * (self.U[:, k + 1] - self.U[:, k])
+        return value.reshape(self.shape)
+
+
+def input_output_response(sys, T, U=0., X0=0, params={}, method=None,
+                          return_x=False, squeeze=True,
+                          input_interpolation='linear'):
 
     """Compute the output response of a system to a given input.
 
@@ -1376,12 +1823,23 @@ def input_output_response(sys, T, U=0., X0=0, params={}, method='RK45',
         Input array giving input at each time `T` (default = 0).
     X0: array-like or number, optional
         Initial condition (default = 0).
+    method : str or OdeSolver, optional
+        Integration method passed to scipy.integrate.solve_ivp for
+        continuous time systems.  If None (default), linear systems
+        (including interconnections of linear systems) are simulated
+        exactly with forced_response, and other systems with 'RK45'.  If
+        a method is given, it is always used.
     return_x : bool, optional
         If True, return the values of the state at each time (default = False).
     squeeze : bool, optional
         If True (default), squeeze unused dimensions out of the output
         response.  In particular, for a single output system, return a
         vector of shape (nsteps) instead of (nsteps, 1).
+    input_interpolation : str, optional
+        How the input of continuous time systems is defined in between
+        the times `T`: 'linear' (default) interpolates linearly, 'zoh'
+        holds each value until the next time step (zero-order hold).  With
+        'zoh', the system is integrated one time step at a time.
 
     Returns
     -------
@@ -1439,17 +1897,81 @@ def input_output_response(sys, T, U=0., X0=0, params={}, method='RK45',
     # Update the parameter values
     sys._update_params(params)
 
-    # Create a lambda function for the right hand side
-    u = sp.interpolate.interp1d(T, U, fill_value="extrapolate")
-    def ivp_rhs(t, x): return sys._rhs(t, x, u(t))
+    # Linear systems, also interconnected, are simulated exactly, unless
+    # an integration method was asked for explicitly (forced_response
+    # interpolates the input linearly, so zero-order hold inputs of
+    # continuous time systems are integrated as well)
+    u = _InputSampler(T, U, kind=input_interpolation)
+    linsys = None
+    if isdtime(sys, strict=True) or \
+       (method is None and input_interpolation == 'linear'):
+        linsys = _linear_statespace(sys)
+    if method is None:
+        method = 'RK45'
+    if linsys is not None and n_steps > 1:
+        dt = T[1] - T[0]
+        if np.allclose(np.diff(T), dt) and \
+           (isctime(sys) or sys.dt is True or np.isclose(dt, sys.dt)):
+            # Time invariant: simulate on exact multiples of the time step
+            if isdtime(sys, strict=True) and sys.dt is not True:
+                dt = sys.dt
+            _T, y, x = forced_response(linsys, dt * np.arange(n_steps), U,
+                                       X0, squeeze=False)
+            y = np.reshape(y, (linsys.outputs, n_steps))
+            if (squeeze): y = np.squeeze(y)
+            if return_x:
+                return T, y, np.reshape(x, (nstates, n_steps))
+            else:
+                return T, y
+
+    # Create a lambda function for the right hand side (u_ivp is rebound
+    # to the held input of each interval for zero-order hold inputs)
+    u_ivp = u
+    def ivp_rhs(t, x): return sys._rhs(t, x, u_ivp(t))
+
+    # Vectorized systems evaluate blocks of states (shape (nstates, k))
+    def ivp_rhs_vectorized(t, x):
+        ut = np.reshape(u_ivp(t), (-1, 1))
+        return sys._rhs_vectorized(
+            t, x, np.broadcast_to(ut, (ut.shape[0], x.shape[1])))
 
     # Perform the simulation
     if isctime(sys):
         if not hasattr(sp.integrate, 'solve_ivp'):
             raise NameError("scipy.integrate.solve_ivp not found; "
                             "use SciPy 1.0 or greater")
-        soln = sp.integrate.solve_ivp(ivp_rhs, (T0, Tf), X0, t_eval=T,
-                                      method=method, vectorized=False)
+        # Implicit solvers use the Jacobian, or its sparsity pattern
+        options = {}
+        if method in ('BDF', 'Radau', 'LSODA'):
+            if sys._rhs_jacobian(T0, X0, u(T0)) is not None:
+                def ivp_jac(t, x):
+                    jac = sys._rhs_jacobian(t, x, u_ivp(t))
+                    if method == 'LSODA' and sparse.issparse(jac):
+                        jac = jac.toarray()
+                    return jac
+                options['jac'] = ivp_jac
+            elif method != 'LSODA' and \
+                    isinstance(sys, InterconnectedSystem):
+                options['jac_sparsity'] = sys._jac_sparsity()
+
+        rhs = ivp_rhs_vectorized if sys.vectorized else ivp_rhs
+        if input_interpolation == 'zoh':
+            # Integrate one sample interval at a time, so that the solver
+            # never steps across a jump in the input
+            soln = sp.optimize.OptimizeResult(t=T, success=True)
+            xs = [X0]
+            for k in range(n_steps - 1):
+                u_ivp = lambda t, uk=u(T[k]): uk
+                soln_k = sp.integrate.solve_ivp(
+                    rhs, (T[k], T[k + 1]), xs[-1], method=method,
+                    vectorized=sys.vectorized, **options)
+                soln.success = soln.success and soln_k.success
+                xs.append(soln_k.y[:, -1])
+            soln.y = np.transpose(xs)
+        else:
+            soln = sp.integrate.solve_ivp(
+                rhs, (T0, Tf), X0, t_eval=T, method=method,
+                vectorized=sys.vectorized, **options)
 
         # Compute the output associated with the state (and use sys.out to
         # figure out the number of outputs just in case it wasn't specified)
@@ -1488,12 +2010,15 @@ def input_output_response(sys, T, U=0., X0=0, params={}, method='RK45',
         soln.y = []                     # Solution, following scipy convention
         y = []                          # System output
         for i in range(len(T)):
+            # Inputs are given at the sampling times
+            ui = U[i] if len(U.shape) == 1 else U[:, i]
+
             # Store the current state and output
             soln.y.append(x)
-            y.append(sys._out(T[i], x, u(T[i])))
+            y.append(sys._out(T[i], x, ui))
 
             # Update the state for the next iteration
-            x = sys._rhs(T[i], x, u(T[i]))
+            x = sys._rhs(T[i], x, ui)
 
         # Convert output to numpy arrays
         soln.y = np.transpose(np.array(soln.y))
@@ -1514,6 +2039,93 @@ def input_output_response(sys, T, U=0., X0=0, params={}, method='RK45',
         return soln.t, y
 
 
+def input_output_response_chunks(sys, chunks, dt, X0=0, T0=0., params={},
+                                 method=None, squeeze=True,
+                                 input_interpolation='linear'):
+    """Compute the output response of a system, one input chunk at a time.
+
+    Generator version of input_output_response, for very long simulations.
+    The input is taken from an iterable of chunks, and the response to each
+    chunk is yielded as soon as it has been computed.  Only the state and
+    the input at the end of the previous chunk are kept between chunks, so
+    the memory use does not grow with the length of the simulation.
+
+    Parameters
+    ----------
+    sys: InputOutputSystem
+        Input/output system to simulate.
+    chunks: iterable of array-like
+        Consecutive pieces of the input, each with shape (ninputs,
+        nsamples), or (nsamples,) for single input systems.  Inputs are
+        interpolated across the chunk boundaries as in
+        input_output_response (see input_interpolation).
+    dt: float
+        Time between the input samples.  For discrete time systems, this
+        must be the sampling time.
+    X0: array-like or number, optional
+        Initial condition (default = 0).
+    T0: float, optional
+        Time of the first input sample (default = 0).
+    squeeze : bool, optional
+        If True (default), return the output response of single output
+        systems as a vector of shape (nsamples) instead of (1, nsamples).
+
+    Yields
+    ------
+    T : array
+        Time values of the chunk.
+    yout : array
+        Response of the system during the chunk.
+    xout : array
+        Time evolution of the state vector during the chunk.
+
+    Raises
+    ------
+    TypeError
+        If the system is not an input/output system.
+
+    """
+    # Sanity checking on the input
+    if not isinstance(sys, InputOutputSystem):
+        raise TypeError("System of type ", type(sys), " not valid")
+    nstates = _find_size(sys.nstates, X0)
+    X0 = _check_convert_array(X0, [(nstates,), (nstates, 1)],
+                              'Parameter ``X0``: ', squeeze=True)
+    sys._update_params(params)
+
+    n_done, u_last, x_last = 0, None, X0
+    for chunk in chunks:
+        U = np.asarray(chunk, dtype=float)
+        U = U.reshape(-1, U.shape[-1]) if U.ndim else U.reshape(1, 1)
+        n_steps = U.shape[1]
+        if n_steps == 0:
+            continue
+        T = T0 + dt * np.arange(n_done, n_done + n_steps)
+
+        if nstates == 0 or (u_last is None and n_steps > 1):
+            # Static systems and the first chunk are simulated directly
+            _T, y, x = input_output_response(
+                sys, T, U, x_last, params, method=method, return_x=True,
+                squeeze=False, input_interpolation=input_interpolation)
+        elif u_last is None:
+            x = x_last.reshape(nstates, 1)
+            y = np.reshape(sys._out(T[0], x_last, U[:, 0]), (-1, 1))
+        else:
+            # Continue from the last sample of the previous chunk
+            _T, y, x = input_output_response(
+                sys, np.hstack((T[0] - dt, T)), np.hstack((u_last, U)),
+                x_last, params, method=method, return_x=True,
+                squeeze=False, input_interpolation=input_interpolation)
+            y, x = y[:, 1:], x[:, 1:]
+
+        n_done, u_last = n_done + n_steps, U[:, -1:]
+        if nstates > 0:
+            x_last = x[:, -1]
+        if squeeze and y.shape[0] == 1:
+            y = y[0]
+        yield T, y, x
+
+
 def find_eqpt(sys, x0, u0=[], y0=None, t=0, params={},
               iu=None, iy=None, ix=None, idx=None, dx0=None,
               return_y=False, return_result=False, **kw):
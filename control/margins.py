@@ -5,8 +5,11 @@ Functions for computing stability margins and related functions.
 Routines in this module:
 
 margin.stability_margins
+margin.stability_margins_batch
 margin.phase_crossover_frequencies
 margin.margin
+margin.disk_margins
+margin.multiloop_disk_margins
 """
 
 # Python 3 compatibility (needs to go here)
@@ -52,12 +55,15 @@ $Id$
 
 import math
 import numpy as np
-import scipy as sp
 from . import xferfcn
 from .lti import issiso
+from .ctrlutil import _roots_batch
 from . import frdata
+from . import statesp
 
-__all__ = ['stability_margins', 'phase_crossover_frequencies', 'margin']
+__all__ = ['stability_margins', 'stability_margins_batch',
+           'phase_crossover_frequencies', 'margin', 'disk_margins',
+           'multiloop_disk_margins']
 
 # helper functions for stability_margins
 def _polyimsplit(pol):
@@ -65,10 +71,10 @@ def _polyimsplit(pol):
     imaginary part with w applied"""
     rpencil = np.zeros_like(pol)
     ipencil = np.zeros_like(pol)
-    rpencil[-1::-4] = 1.
-    rpencil[-3::-4] = -1.
-    ipencil[-2::-4] = 1.
-    ipencil[-4::-4] = -1.
+    rpencil[..., -1::-4] = 1.
+    rpencil[..., -3::-4] = -1.
+    ipencil[..., -2::-4] = 1.
+    ipencil[..., -4::-4] = -1.
     return pol * rpencil, pol*ipencil
 
 def _polysqr(pol):
@@ -98,7 +104,7 @@ def _polysqr(pol):
 #                    issue 1, pp 51-59, closer to Matlab behavior, but
 #                    not completely identical in edge cases, which don't
 #                    cross but touch gain=1
-def stability_margins(sysdata, returnall=False, epsw=0.0):
+def stability_margins(sysdata, returnall=False, epsw=0.0, polish=True):
     """Calculate stability margins and associated crossover frequencies.
 
     Parameters
@@ -117,6 +123,10 @@ def stability_margins(sysdata, returnall=False, epsw=0.0):
     epsw: float, optional
         Frequencies below this value (default 0.0) are considered static gain,
         and not returned as margin.
+    polish: bool, optional
+        For frequency data or FRD systems, the crossings are first located by
+        interpolation between the given frequencies.  If True (default), they
+        are then refined on the interpolated response.
 
     Returns
     -------
@@ -210,14 +220,18 @@ def stability_margins(sysdata, returnall=False, epsw=0.0):
         wstab.sort()
 
     else:
-        # a bit coarse, have the interpolated frd evaluated again
+        # locate the crossings on the frequency grid, and refine them on the
+        # interpolated frd; all brackets are treated in one go
+        omega = sys.omega
+        resp = sys._evalfr(omega)[0][0]
+
         def mod(w):
             """to give the function to calculate |G(jw)| = 1"""
             return np.abs(sys._evalfr(w)[0][0]) - 1
 
-        def arg(w):
-            """function to calculate the phase angle at -180 deg"""
-            return np.angle(-sys._evalfr(w)[0][0])
+        def imag(w):
+            """crossings of the real axis, for the phase angle at -180 deg"""
+            return np.imag(sys._evalfr(w)[0][0])
 
         def dstab(w):
             """function to calculate the distance from -1 point"""
@@ -225,27 +239,24 @@ def stability_margins(sysdata, returnall=False, epsw=0.0):
 
         # Find all crossings, note that this depends on omega having
         # a correct range
-        widx = np.where(np.diff(np.sign(mod(sys.omega))))[0]
-        wc = np.array(
-            [ sp.optimize.brentq(mod, sys.omega[i], sys.omega[i+1])
-              for i in widx if i+1 < len(sys.omega)])
+        fw = np.abs(resp) - 1
+        widx = np.where(np.diff(np.sign(fw)))[0]
+        wc = _frd_crossings(mod, omega[widx], omega[widx+1],
+                            fw[widx], fw[widx+1], polish)
 
         # find the phase crossings ang(H(jw) == -180
-        widx = np.where(np.diff(np.sign(arg(sys.omega))))[0]
-        widx = widx[np.real(sys._evalfr(sys.omega[widx])[0][0]) <= 0]
-        w_180 = np.array(
-            [ sp.optimize.brentq(arg, sys.omega[i], sys.omega[i+1])
-              for i in widx if i+1 < len(sys.omega) ])
-
-        # find all stab margins?
-        widx = np.where(np.diff(np.sign(np.diff(dstab(sys.omega)))))[0]
-        wstab = np.array([ sp.optimize.minimize_scalar(
-                  dstab, bracket=(sys.omega[i], sys.omega[i+1])).x
-              for i in widx if i+1 < len(sys.omega) and
-              np.diff(np.diff(dstab(sys.omega[i-1:i+2])))[0] > 0 ])
-        wstab = wstab[(wstab >= sys.omega[0]) *
-                      (wstab <= sys.omega[-1])]
-
+        fw = np.imag(resp)
+        widx = np.where(np.diff(np.sign(fw)))[0]
+        widx = widx[np.real(resp[widx]) <= 0]
+        w_180 = _frd_crossings(imag, omega[widx], omega[widx+1],
+                               fw[widx], fw[widx+1], polish)
+
+        # find all stab margins, minima of the distance to -1
+        fw = np.abs(resp + 1.)
+        widx = np.where(np.diff(np.sign(np.diff(fw))) > 0)[0]
+        wstab = _frd_minima(dstab, omega[widx], omega[widx+1],
+                            omega[widx+2], fw[widx], fw[widx+1],
+                            fw[widx+2], polish)
 
     # margins, as iterables, converted frdata and xferfcn calculations to
     # vector for this
@@ -275,6 +286,316 @@ def stability_margins(sysdata, returnall=False, epsw=0.0):
             (not wstab.shape[0] and float('nan')) or wstab[SM==np.amin(SM)][0])
 
 
+# helper functions for stability_margins on frequency data; these work on
+# all brackets at once, so the interpolated response is evaluated once per
+# iteration instead of once per iteration and crossing
+def _frd_crossings(f, a, b, fa, fb, polish=True, xtol=2e-12,
+                   rtol=4*np.finfo(float).eps, maxiter=100):
+    """Zeros of f in the brackets [a, b], with f(a) = fa and f(b) = fb"""
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    fa, fb = np.array(fa, dtype=float), np.array(fb, dtype=float)
+    if not a.shape[0]:
+        return a
+
+    # interpolate linearly in log frequency, or in frequency at 0
+    with np.errstate(all='ignore'):
+        t = fa / (fa - fb)
+        t[fb == fa] = 0.5
+        x = np.where(a > 0, a * (b/a)**t, a + (b - a)*t)
+    if not polish:
+        return x
+
+    # Illinois variant of regula falsi, for all brackets at once
+    side = np.zeros(a.shape, dtype=int)
+    done = (fa == 0) | (fb == 0)
+    x = np.where(fa == 0, a, np.where(fb == 0, b, x))
+    for it in range(maxiter):
+        if done.all():
+            break
+        fx = f(x)
+        done |= fx == 0
+        left = np.sign(fx) == np.sign(fa)
+        fb = np.where(left & (side == 1), fb/2, fb)
+        fa = np.where(~left & (side == -1), fa/2, fa)
+        a, fa = np.where(left, x, a), np.where(left, fx, fa)
+        b, fb = np.where(left, b, x), np.where(left, fb, fx)
+        side = np.where(left, 1, -1)
+        with np.errstate(all='ignore'):
+            xnew = (a*fb - b*fa) / (fb - fa)
+        xnew = np.where(np.isfinite(xnew), xnew, (a + b)/2)
+        done |= np.abs(xnew - x) <= xtol + rtol*np.abs(xnew)
+        x = np.where(done & (fx == 0), x, xnew)
+    return x
+
+def _frd_minima(f, a, m, b, fa, fm, fb, polish=True, rtol=1e-10,
+                maxiter=100):
+    """Minima of f in the brackets [a, b], with f(m) below f(a) and f(b)"""
+    a, m, b = [np.array(w, dtype=float) for w in (a, m, b)]
+    if not a.shape[0]:
+        return a
+    if not polish:
+        # vertex of the parabola through the three points
+        with np.errstate(all='ignore'):
+            d1, d2 = (m - a)*(fm - fb), (m - b)*(fm - fa)
+            x = m - 0.5*((m - a)*d1 - (m - b)*d2) / (d1 - d2)
+        return np.where(np.isfinite(x), np.clip(x, a, b), m)
+
+    # golden section search, for all brackets at once
+    g = (np.sqrt(5.) - 1)/2
+    c, d = b - g*(b - a), a + g*(b - a)
+    fc, fd = f(c), f(d)
+    for it in range(maxiter):
+        if (b - a <= rtol*np.abs(a + b)).all():
+            break
+        left = fc < fd
+        a, b = np.where(left, a, c), np.where(left, d, b)
+        c, d = np.where(left, b - g*(b - a), d), \
+            np.where(left, c, a + g*(b - a))
+        fnew = f(np.where(left, c, d))
+        fc, fd = np.where(left, fnew, fd), np.where(left, fc, fnew)
+    return (a + b)/2
+
+# helper functions for stability_margins_batch; polynomials are stored as
+# the rows of 2D arrays, padded with leading zeros
+def _polyadd_batch(a, b):
+    """add two stacks of polynomials"""
+    n = max(a.shape[1], b.shape[1])
+    return np.pad(a, ((0, 0), (n - a.shape[1], 0)), 'constant') + \
+        np.pad(b, ((0, 0), (n - b.shape[1], 0)), 'constant')
+
+def _polymul_batch(a, b):
+    """multiply two stacks of polynomials"""
+    out = np.zeros((a.shape[0], a.shape[1] + b.shape[1] - 1),
+                   dtype=np.result_type(a, b))
+    for i in range(a.shape[1]):
+        out[:, i:i + b.shape[1]] += a[:, i:i + 1] * b
+    return out
+
+def _polyder_batch(pol):
+    """derivative of a stack of polynomials"""
+    if pol.shape[1] < 2:
+        return np.zeros((pol.shape[0], 1))
+    return pol[:, :-1] * np.arange(pol.shape[1] - 1, 0, -1)
+
+def _polyval_batch(pol, x):
+    """evaluate the rows of pol at the matching rows of x"""
+    out = np.zeros(x.shape, dtype=np.result_type(pol, x))
+    for k in range(pol.shape[1]):
+        out = out * x + pol[:, k:k + 1]
+    return out
+
+def _real_sorted(w, keep):
+    """real parts of w where keep is True, sorted and padded with NaN"""
+    return np.sort(np.where(keep, np.real(w), np.nan), axis=1)
+
+def _stability_margins_tf_batch(num, den, epsw):
+    """Margins of continuous time SISO transfer functions
+
+    num and den are the stacked numerator and denominator polynomials;
+    the computation is the same as in stability_margins, but done for all
+    systems at once.  Returns GM, PM, SM, w_180, wc, wstab as 2D arrays,
+    one row per system, padded with NaN.
+    """
+    rnum, inum = _polyimsplit(num)
+    rden, iden = _polyimsplit(den)
+    with np.errstate(all='ignore'):
+        def _evalfr(w):
+            return _polyval_batch(num, 1.j*w) / _polyval_batch(den, 1.j*w)
+
+        # phase crossover, only where the negative real axis is crossed
+        test_w_180 = _polyadd_batch(_polymul_batch(inum, rden),
+                                    _polymul_batch(rnum, -iden))
+        w_180 = _roots_batch(test_w_180)
+        keep = (np.imag(w_180) == 0) & (np.real(w_180) >= epsw)
+        keep &= np.real(_evalfr(np.real(w_180))) <= 0.0
+        w_180 = _real_sorted(w_180, keep)
+
+        # gain crossover
+        test_wc = _polyadd_batch(
+            _polyadd_batch(_polymul_batch(rnum, rnum),
+                           _polymul_batch(inum, inum)),
+            -_polyadd_batch(_polymul_batch(rden, rden),
+                            _polymul_batch(iden, iden)))
+        wc = _roots_batch(test_wc)
+        wc = _real_sorted(wc, (np.imag(wc) == 0) & (np.real(wc) > epsw))
+
+        # minima of the distance to -1
+        test_wstabd = _polyadd_batch(_polymul_batch(rden, rden),
+                                     _polymul_batch(iden, iden))
+        rsum, isum = _polyadd_batch(rnum, rden), _polyadd_batch(inum, iden)
+        test_wstabn = _polyadd_batch(_polymul_batch(rsum, rsum),
+                                     _polymul_batch(isum, isum))
+        test_wstab = _polyadd_batch(
+            _polymul_batch(_polyder_batch(test_wstabn), test_wstabd),
+            -_polymul_batch(_polyder_batch(test_wstabd), test_wstabn))
+        wstab = _roots_batch(test_wstab)
+        wstabr = np.real(wstab)
+        wstabplus = _polyval_batch(_polyder_batch(test_wstab), wstabr)
+        wstab = _real_sorted(wstab, (np.imag(wstab) == 0) &
+                             (wstabr >= 0) & (wstabr > epsw) &
+                             (wstabplus > 0.))
+
+        GM = 1.0/np.abs(_evalfr(w_180))
+        SM = np.abs(_evalfr(wstab) + 1)
+        PM = np.remainder(np.angle(_evalfr(wc), deg=True), 360.0) - 180.0
+
+    return GM, PM, SM, w_180, wc, wstab
+
+def _stability_margins_list(syslist, returnall=False, epsw=0.0):
+    """stability_margins for a list of systems, without parallelism"""
+    nsys = len(syslist)
+    results = [None] * nsys
+
+    # Collect the continuous time transfer functions, which are done in
+    # one batch; everything else goes through stability_margins
+    batch = []
+    for k, sysdata in enumerate(syslist):
+        if isinstance(sysdata, frdata.FRD) or \
+           (getattr(sysdata, '__iter__', False) and len(sysdata) == 3):
+            results[k] = stability_margins(sysdata, returnall, epsw)
+            continue
+        sys = xferfcn._convert_to_transfer_function(sysdata)
+        if not issiso(sys):
+            raise ValueError("Can only do margins for SISO system")
+        if sys.isdtime(strict=True):
+            results[k] = stability_margins(sys, returnall, epsw)
+        else:
+            batch.append((k, sys.num[0][0], sys.den[0][0]))
+
+    if batch:
+        idx = np.array([b[0] for b in batch])
+        num = np.zeros((len(batch), max(len(b[1]) for b in batch)))
+        den = np.zeros((len(batch), max(len(b[2]) for b in batch)))
+        for i, (k, n, d) in enumerate(batch):
+            num[i, num.shape[1] - len(n):] = n
+            den[i, den.shape[1] - len(d):] = d
+        GM, PM, SM, w_180, wc, wstab = \
+            _stability_margins_tf_batch(num, den, epsw)
+
+    if returnall:
+        out = [[None] * nsys for i in range(6)]
+        for k, res in enumerate(results):
+            if res is not None:
+                for i in range(6):
+                    out[i][k] = res[i]
+        for i, k in enumerate(idx if batch else []):
+            for j, (val, w) in enumerate(((GM, w_180), (PM, wc),
+                                          (SM, wstab))):
+                valid = ~np.isnan(w[i])
+                out[j][k] = val[i][valid]
+                out[j + 3][k] = w[i][valid]
+        return tuple(out)
+
+    out = np.empty((6, nsys))
+    for k, res in enumerate(results):
+        if res is not None:
+            out[:, k] = res
+
+    if batch:
+        rows = np.arange(len(batch))
+
+        # gain margin closest to 1, ignoring infinite gain margins
+        valid = ~np.isnan(w_180) & ~np.isinf(GM)
+        with np.errstate(all='ignore'):
+            crit = np.where(~np.isnan(w_180), np.abs(np.log(GM)), np.inf)
+        crit = np.pad(crit, ((0, 0), (0, 1)), 'constant',
+                      constant_values=np.inf)
+        gmidx = np.argmin(crit, axis=1)
+        found = valid.any(axis=1)
+        gmidx = np.where(found, gmidx, 0)
+        out[0, idx] = np.where(
+            found, np.pad(GM, ((0, 0), (0, 1)), 'constant')[rows, gmidx],
+            np.inf)
+        out[3, idx] = np.where(
+            found, np.pad(w_180, ((0, 0), (0, 1)), 'constant')[rows, gmidx],
+            np.nan)
+
+        # smallest phase margin and stability margin
+        for i, (val, w, crit) in enumerate(((PM, wc, np.abs(PM)),
+                                            (SM, wstab, SM))):
+            found = ~np.isnan(w)
+            crit = np.pad(np.where(found, crit, np.inf), ((0, 0), (0, 1)),
+                          'constant', constant_values=np.inf)
+            j = np.argmin(crit, axis=1)
+            found = found.any(axis=1)
+            j = np.where(found, j, 0)
+            out[i + 1, idx] = np.where(
+                found, np.pad(val, ((0, 0), (0, 1)), 'constant')[rows, j],
+                np.inf)
+            out[i + 4, idx] = np.where(
+                found, np.pad(w, ((0, 0), (0, 1)), 'constant')[rows, j],
+                np.nan)
+
+    return tuple(out)
+
+def stability_margins_batch(syslist, params=None, returnall=False, epsw=0.0,
+                            n_jobs=None, executor=None):
+    """Calculate stability margins for a batch of systems.
+
+    Computes the same results as calling stability_margins on every
+    system, but for continuous time systems the polynomial manipulations
+    and root computations are shared across the batch.
+
+    Parameters
+    ----------
+    syslist: list of LTI systems, or callable
+        SISO systems (or (mag, phase, omega) sequences) to compute the
+        margins for.  If params is given, syslist is a function that
+        returns a system for each element of params.
+    params: array_like, optional
+        Parameter values for a parameterized family of systems.
+    returnall: bool, optional
+        If true, return lists with all margins found for each system. If
+        False (default), return arrays with the minimum stability margins.
+    epsw: float, optional
+        Frequencies below this value (default 0.0) are considered static
+        gain, and not returned as margin.
+    n_jobs: int, optional
+        Number of worker processes used to compute the margins.  If -1, use
+        one process per CPU.  The default (None) runs in this process.
+    executor: concurrent.futures.Executor, optional
+        Executor used to compute the margins.  The systems are split into
+        n_jobs chunks (one per CPU if n_jobs is None or -1), and each chunk
+        is submitted to the executor as one task.
+
+    Returns
+    -------
+    gm, pm, sm, wg, wp, ws: array (list of arrays if returnall is True)
+        Gain margins, phase margins, stability margins and the
+        corresponding frequencies, one entry per system.  See
+        stability_margins.
+    """
+    if params is not None:
+        syslist = [syslist(p) for p in params]
+    syslist = list(syslist)
+
+    if executor is None and (n_jobs is None or n_jobs == 1):
+        return _stability_margins_list(syslist, returnall, epsw)
+
+    # Split the systems into one chunk per worker
+    import os
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            return stability_margins_batch(
+                syslist, returnall=returnall, epsw=epsw, n_jobs=n_jobs,
+                executor=pool)
+    nchunks = max(1, n_jobs)
+    bounds = np.linspace(0, len(syslist), nchunks + 1).astype(int)
+    chunks = [syslist[bounds[i]:bounds[i+1]] for i in range(nchunks)
+              if bounds[i] < bounds[i+1]]
+    results = list(executor.map(_stability_margins_list, chunks,
+                                [returnall] * len(chunks),
+                                [epsw] * len(chunks)))
+    if returnall:
+        return tuple(sum([list(res[i]) for res in results], [])
+                     for i in range(6))
+    return tuple(np.concatenate([res[i] for res in results])
+                 for i in range(6))
+
+
 # Contributed by Steffen Waldherr <waldherr@ist.uni-stuttgart.de>
 #! TODO - need to add test functions
 def phase_crossover_frequencies(sys):
@@ -314,8 +635,7 @@ def phase_crossover_frequencies(sys):
     realposfreq = realfreq[realfreq >= 0.]
 
     # using real() to avoid rounding errors and results like 1+0j
-    # it would be nice to have a vectorized version of self.evalfr here
-    gain = np.real(np.asarray([tf._evalfr(f)[0][0] for f in realposfreq]))
+    gain = np.real(tf._evalfr(realposfreq)[0][0])
 
     return realposfreq, gain
 
@@ -368,3 +688,194 @@ def margin(*args):
             % len(args))
 
     return margin[0], margin[1], margin[3], margin[4]
+
+
+# Disk margins; the loop L is closed with negative unit feedback, and the
+# margins follow from M = S + (skew - 1)/2 I, with S the sensitivity
+def _disk_response(L, omega, skew):
+    """Frequencies and M(jw) for the loop transfer L, as (N, p, p) array"""
+    if not isinstance(L, (frdata.FRD, statesp.StateSpace,
+                          xferfcn.TransferFunction)):
+        L = xferfcn._convert_to_transfer_function(L)
+    if L.inputs != L.outputs:
+        raise ValueError("Disk margins need a square loop transfer function")
+    if omega is None:
+        if isinstance(L, frdata.FRD):
+            omega = L.omega
+        else:
+            from .freqplot import default_frequency_range
+            omega = default_frequency_range(L, Hz=False,
+                                            number_of_samples=1000)
+    omega = np.sort(np.atleast_1d(np.asarray(omega, dtype=float)))
+    return omega, _disk_matrix(L, omega, skew)
+
+def _disk_matrix(L, omega, skew):
+    """M = S + (skew - 1)/2 I at the frequencies omega"""
+    resp = np.moveaxis(np.asarray(L._evalfr(omega)).reshape(
+        (L.outputs, L.inputs, -1)), -1, 0)
+    eye = np.eye(L.outputs)
+    return np.linalg.inv(eye + resp) + (skew - 1)/2. * eye
+
+def _perron_vector(A):
+    """Perron vectors of a stack of nonnegative matrices"""
+    w, V = np.linalg.eig(A)
+    k = np.argmax(np.real(w), axis=-1)
+    v = np.abs(V[np.arange(A.shape[0]), :, k])
+    return np.maximum(v, 1e-12 * np.max(v, axis=-1, keepdims=True) + 1e-300)
+
+def _mu_upper_bound(M):
+    """Upper bound of the structured singular value of a stack of matrices
+
+    The uncertainty structure is a diagonal of complex scalars, one per
+    loop.  The bound is the smallest of the maximum singular value of M
+    and of D M D^-1, with D the Perron-Frobenius scaling of |M|.
+    """
+    ub = np.linalg.svd(M, compute_uv=False)[:, 0]
+    if M.shape[-1] > 1:
+        A = np.abs(M)
+        d = np.sqrt(_perron_vector(np.swapaxes(A, -1, -2)) /
+                    _perron_vector(A))
+        MD = M * d[:, :, None] / d[:, None, :]
+        ub = np.minimum(ub, np.linalg.svd(MD, compute_uv=False)[:, 0])
+    return ub
+
+def _disk_to_margins(alpha, skew):
+    """Gain interval and phase margin (deg) for disk size alpha"""
+    a, b = (1 - skew)/2., (1 + skew)/2.
+    with np.errstate(all='ignore'):
+        gmin = np.maximum((1 - a*alpha) / (1 + b*alpha), 0.)
+        gmax = np.where(b*alpha < 1, (1 + a*alpha) / (1 - b*alpha), np.inf)
+        den = 2. + 2.*alpha**2*a*b
+        pm = np.where(den > 0, np.degrees(np.arccos(np.clip(
+            (2. - alpha**2*(a**2 + b**2)) / den, -1., 1.))), 180.)
+    return np.stack((gmin, gmax), axis=-1), pm
+
+def _disk_peaks(f, omega, peak, polish):
+    """Refine the peaks of f, given in columns of peak, at grid indices
+
+    f is a function of a frequency array with one entry per column; peaks
+    at the ends of the grid are kept as they are.
+    """
+    idx = np.argmax(peak, axis=0)
+    wm = omega[idx]
+    cols = np.arange(peak.shape[1])
+    interior = (idx > 0) & (idx < len(omega) - 1)
+    if polish and interior.any():
+        i, c = idx[interior], cols[interior]
+        def g(w):
+            wfull = wm.copy()
+            wfull[interior] = w
+            return -f(wfull)[interior]
+        wm[interior] = _frd_minima(
+            g, omega[i-1], omega[i], omega[i+1],
+            -peak[i-1, c], -peak[i, c], -peak[i+1, c])
+    return wm, np.maximum(f(wm) if polish else peak[idx, cols],
+                          peak[idx, cols])
+
+def disk_margins(L, omega=None, skew=0.0, returnall=False, polish=True):
+    """Loop-at-a-time disk margins.
+
+    Each loop of the (square) loop transfer function L is perturbed in
+    turn, while the other loops are closed.  The disk margin alpha of a
+    loop is the size of the largest disk of simultaneous gain and phase
+    variations f = (1 + (1 - skew)/2 delta) / (1 - (1 + skew)/2 delta),
+    |delta| < alpha, for which the closed loop remains stable.
+
+    Parameters
+    ----------
+    L: LTI system or FRD
+        Loop transfer function, with the loop closed by negative unit
+        feedback.  The closed loop is assumed to be stable.
+    omega: array_like, optional
+        Frequencies to evaluate the margins at; defaults to the frequencies
+        of an FRD, or a frequency range computed from the system dynamics.
+    skew: float, optional
+        Skew of the disk; 0 (default) gives balanced variations, 1 gain
+        increases only and -1 gain decreases only.
+    returnall: bool, optional
+        If True, return the margins at every frequency instead of the
+        minimum margins.
+    polish: bool, optional
+        If True (default), refine the frequency of the minimum margin for
+        LTI systems.
+
+    Returns
+    -------
+    dm: array
+        Disk margin, one per loop
+    dgm: array
+        Lower and upper gain margin (absolute values), one row per loop
+    dpm: array
+        Phase margin (degrees), one per loop
+    wm: array
+        Frequency of the minimum disk margin, or the frequencies if
+        returnall is True
+
+    Examples
+    --------
+    >>> L = tf(25, [1, 10, 10, 10])
+    >>> dm, dgm, dpm, wm = disk_margins(L)
+    """
+    omega, M = _disk_response(L, omega, skew)
+    p = M.shape[-1]
+    peak = np.abs(M[:, np.arange(p), np.arange(p)])
+    if returnall:
+        with np.errstate(divide='ignore'):
+            alpha = 1. / peak.T
+        dgm, dpm = _disk_to_margins(alpha, skew)
+        return alpha, dgm, dpm, omega
+
+    loops = np.arange(p)
+    def f(w):
+        return np.abs(_disk_matrix(L, w, skew)[loops, loops, loops])
+    wm, peak = _disk_peaks(f, omega, peak,
+                           polish and not isinstance(L, frdata.FRD))
+    with np.errstate(divide='ignore'):
+        alpha = 1. / peak
+    dgm, dpm = _disk_to_margins(alpha, skew)
+    return alpha, dgm, dpm, wm
+
+def multiloop_disk_margins(L, omega=None, skew=0.0, returnall=False,
+                           polish=True):
+    """Multi-loop disk margin.
+
+    Gives the size of the largest disk of gain and phase variations
+    that can be applied independently and simultaneously in all loops of
+    L, with the closed loop remaining stable.  The margin is computed
+    from an upper bound of the structured singular value, so it is a
+    guaranteed (possibly conservative) margin.  See disk_margins for the
+    description of the disk and the parameters.
+
+    Returns
+    -------
+    dm: float or array
+        Disk margin
+    dgm: array
+        Lower and upper gain margin (absolute values)
+    dpm: float or array
+        Phase margin (degrees)
+    wm: float or array
+        Frequency of the minimum disk margin, or the frequencies if
+        returnall is True
+
+    Examples
+    --------
+    >>> L = ss([[-1., 0.], [0., -2.]], [[1., 0.], [0.5, 1.]], eye(2), 0)
+    >>> dm, dgm, dpm, wm = multiloop_disk_margins(L)
+    """
+    omega, M = _disk_response(L, omega, skew)
+    peak = _mu_upper_bound(M)
+    if returnall:
+        with np.errstate(divide='ignore'):
+            alpha = 1. / peak
+        dgm, dpm = _disk_to_margins(alpha, skew)
+        return alpha, dgm, dpm, omega
+
+    def f(w):
+        return _mu_upper_bound(_disk_matrix(L, w, skew))
+    wm, peak = _disk_peaks(f, omega, peak[:, None],
+                           polish and not isinstance(L, frdata.FRD))
+    with np.errstate(divide='ignore'):
+        alpha = 1. / peak[0]
+    dgm, dpm = _disk_to_margins(alpha, skew)
+    return alpha, dgm, dpm, wm[0]
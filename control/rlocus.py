@@ -49,11 +49,13 @@
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
-from scipy import array, poly1d, row_stack, zeros_like, real, imag
+from scipy import array, poly1d, real, imag
 import scipy.signal             # signal processing toolbox
+from scipy.optimize import linear_sum_assignment
 import pylab                    # plotting routines
 from .xferfcn import _convert_to_transfer_function
 from .exception import ControlMIMONotImplemented
+from .ctrlutil import _roots_batch
 from .sisotool import _SisotoolUpdate
 from functools import partial
 
@@ -206,8 +208,11 @@ def _default_gains(num, den, xlim, ylim, zoom_xlim=None, zoom_ylim=None):
     """
     k_break, real_break = _break_points(num, den)
     kmax = _k_max(num, den, real_break, k_break)
-    kvect = np.hstack((np.linspace(0, kmax, 50), np.real(k_break)))
-    kvect.sort()
+
+    # Start from a coarse set of gains, the gains are refined below where
+    # the roots move too far apart
+    k_break = np.real(k_break)
+    kvect = np.unique(np.hstack((np.linspace(0, kmax, 20), k_break)))
 
     mymat = _RLFindRoots(num, den, kvect)
     mymat = _RLSortRoots(mymat)
@@ -272,13 +277,8 @@ def _default_gains(num, den, xlim, ylim, zoom_xlim=None, zoom_ylim=None):
 
     # Add more points into the root locus for points that are too far apart
     while len(indexes_too_far) > 0 and kvect.size < 5000:
-        for counter, index in enumerate(indexes_too_far):
-            index = index + counter*3
-            new_gains = np.linspace(kvect[index], kvect[index + 1], 5)
-            new_points = _RLFindRoots(num, den, new_gains[1:4])
-            kvect = np.insert(kvect, index + 1, new_gains[1:4])
-            mymat = np.insert(mymat, index + 1, new_points, axis=0)
-
+        kvect, mymat = _RLRefineGains(num, den, kvect, mymat,
+                                      indexes_too_far, tolerance, k_break)
         mymat = _RLSortRoots(mymat)
         indexes_too_far = _indexes_filt(mymat, tolerance, zoom_xlim, zoom_ylim)
 
@@ -290,6 +290,44 @@ def _default_gains(num, den, xlim, ylim, zoom_xlim=None, zoom_ylim=None):
     return kvect, mymat, xlim, ylim
 
 
+def _RLRefineGains(num, den, kvect, mymat, indexes, tolerance,
+                   k_break=(), max_new_gains=100):
+    """Insert gains after the given indexes, with the step following from
+    how far the roots move between the neighbouring gains.
+
+    Near a break-in or break-away gain in k_break the roots move with the
+    square root of the gain difference, so the new gains are placed by
+    repeated bisection towards the break gain.  Elsewhere they are spaced
+    equally.  The roots for all new gains are computed in a single call;
+    the result still needs to be sorted.
+    """
+    indexes = np.asarray(indexes, dtype=int)
+    with np.errstate(invalid='ignore'):
+        step = np.abs(mymat[indexes + 1] - mymat[indexes])
+    step = np.where(np.isfinite(step), step, 0.).max(axis=1)
+    ratio = np.where(step == 0, 4., step / tolerance)
+    k_break = np.asarray(k_break)
+
+    new_gains = []
+    for i, r in zip(indexes, ratio):
+        k0, k1 = kvect[i], kvect[i + 1]
+        if np.any(k_break == k0) or np.any(k_break == k1):
+            # bisect towards the break gain, 2 log2(ratio) times
+            kb, ko = (k0, k1) if np.any(k_break == k0) else (k1, k0)
+            n = int(np.clip(np.ceil(2 * np.log2(max(r, 2.))), 1, 52))
+            new_gains.append(
+                np.sort(kb + (ko - kb) * 0.5**np.arange(1, n + 1)))
+        else:
+            n = int(np.clip(np.ceil(r) - 1, 1, max_new_gains))
+            new_gains.append(np.linspace(k0, k1, n + 2)[1:-1])
+    number = [len(gains) for gains in new_gains]
+    new_gains = np.concatenate(new_gains)
+    new_points = _RLFindRoots(num, den, new_gains)
+    position = np.repeat(indexes + 1, number)
+    return (np.insert(kvect, position, new_gains),
+            np.insert(mymat, position, new_points, axis=0))
+
+
 def _indexes_filt(mymat, tolerance, zoom_xlim=None, zoom_ylim=None):
     """Calculate the distance between points and return the indexes.
 
@@ -308,12 +346,12 @@ def _indexes_filt(mymat, tolerance, zoom_xlim=None, zoom_ylim=None):
             np.unique(np.where(distance_points > tolerance_zoom)[0]))
         indexes_too_far_filtered = []
 
-        for index in indexes_too_far_zoom:
-            for point in mymat[index]:
-                if (zoom_xlim[0] <= point.real <= zoom_xlim[1]) and \
-                   (zoom_ylim[0] <= point.imag <= zoom_ylim[1]):
-                    indexes_too_far_filtered.append(index)
-                    break
+        inside = np.any((zoom_xlim[0] <= real(mymat)) &
+                        (real(mymat) <= zoom_xlim[1]) &
+                        (zoom_ylim[0] <= imag(mymat)) &
+                        (imag(mymat) <= zoom_ylim[1]), axis=1)
+        indexes_too_far_filtered.extend(
+            [index for index in indexes_too_far_zoom if inside[index]])
 
         # Check if zoom box is not overshot & insert points where neccessary
         if len(indexes_too_far_filtered) == 0 and len(mymat) < 500:
@@ -441,45 +479,62 @@ def _systopoly1d(sys):
 
 
 def _RLFindRoots(nump, denp, kvect):
-    """Find the roots for the root locus."""
-    # Convert numerator and denominator to polynomials if they aren't
-    roots = []
-    for k in kvect:
-        curpoly = denp + k * nump
-        curroots = curpoly.r
-        if len(curroots) < denp.order:
-            # if I have fewer poles than open loop, it is because i have
-            # one at infinity
-            curroots = np.insert(curroots, len(curroots), np.inf)
-
-        curroots.sort()
-        roots.append(curroots)
-
-    mymat = row_stack(roots)
+    """Find the roots for the root locus.
+
+    The roots for all gains are found at once, as the eigenvalues of a
+    stack of companion matrices.  Roots lost when the leading coefficient
+    vanishes are at infinity.
+    """
+    kvect = np.ravel(np.real(kvect)).astype(float)
+    num, den = np.atleast_1d(nump.coeffs), np.atleast_1d(denp.coeffs)
+    order = max(len(num), len(den))
+    num = np.concatenate((np.zeros(order - len(num)), num))
+    den = np.concatenate((np.zeros(order - len(den)), den))
+    mymat = _roots_batch(den + kvect[:, np.newaxis] * num)
+    mymat[np.isnan(mymat)] = np.inf
+    mymat.sort(axis=1)
     return mymat
 
 
 def _RLSortRoots(mymat):
     """Sort the roots from sys._RLFindRoots, so that the root
     locus doesn't show weird pseudo-branches as roots jump from
-    one branch to another."""
+    one branch to another.
 
-    sorted = zeros_like(mymat)
-    for n, row in enumerate(mymat):
-        if n == 0:
-            sorted[n, :] = row
-        else:
-            # sort the current row by finding the element with the
-            # smallest absolute distance to each root in the
-            # previous row
-            available = list(range(len(prevrow)))
-            for elem in row:
-                evect = elem-prevrow[available]
-                ind1 = abs(evect).argmin()
-                ind = available.pop(ind1)
-                sorted[n, ind] = elem
-        prevrow = sorted[n, :]
-    return sorted
+    Each row is matched to the previous one with the assignment that
+    minimizes the total distance between the roots.  The nearest
+    neighbours are tried first, for all rows at once; only where those
+    do not give a one-to-one assignment is the assignment problem solved.
+    """
+    nrows, ncols = mymat.shape
+    if nrows < 2:
+        return mymat.copy()
+
+    # distances between the roots in consecutive rows, roots at infinity
+    # stay at infinity
+    with np.errstate(invalid='ignore'):
+        dist = np.abs(mymat[1:, np.newaxis, :] - mymat[:-1, :, np.newaxis])
+    both_inf = np.isinf(mymat[1:, np.newaxis, :]) & \
+        np.isinf(mymat[:-1, :, np.newaxis])
+    dist[both_inf] = 0.
+    finite = np.isfinite(dist)
+    big = 10. * (np.max(dist[finite]) if finite.any() else 1.) + 1.
+    dist[~finite] = big
+
+    # match[n, j] is the root in row n+1 continuing root j of row n
+    match = np.argmin(dist, axis=2)
+    ambiguous = np.nonzero(
+        np.any(np.sort(match, axis=1) != np.arange(ncols), axis=1))[0]
+    for n in ambiguous:
+        rows, cols = linear_sum_assignment(dist[n])
+        match[n, rows] = cols
+
+    # follow the branches through the rows
+    order = np.empty((nrows, ncols), dtype=int)
+    order[0] = np.arange(ncols)
+    for n in range(1, nrows):
+        order[n] = match[n - 1, order[n - 1]]
+    return np.take_along_axis(mymat, order, axis=1)
 
 
 def _RLZoomDispatcher(event, sys, ax_rlocus, plotstr):
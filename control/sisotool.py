@@ -1,17 +1,26 @@
 __all__ = ['sisotool']
 
-from .freqplot import bode_plot
+from .freqplot import bode_plot, _bode_margin_plot
 from .timeresp import step_response
-from .lti import issiso
+from .lti import issiso, isdtime
+from .statesp import StateSpace, _convertToStateSpace
+from .xferfcn import _convert_to_transfer_function
+from .ctrlutil import unwrap
+from . import config
+import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
 import warnings
+import weakref
+
+# Data kept per sisotool figure for incremental updates
+_sisotool_cache = weakref.WeakKeyDictionary()
 
 def sisotool(sys, kvect = None, xlim_rlocus = None, ylim_rlocus = None,
              plotstr_rlocus = 'b' if int(matplotlib.__version__[0]) == 1 else 'C0',
              rlocus_grid = False, omega = None, dB = None, Hz = None,
              deg = None, omega_limits = None, omega_num = None,
-             margins_bode = True, tvect=None):
+             margins_bode = True, tvect=None, incremental=True):
     """
     Sisotool style collection of plots inspired by MATLAB's sisotool.
     The left two plots contain the bode magnitude and phase diagrams.
@@ -50,6 +59,11 @@ def sisotool(sys, kvect = None, xlim_rlocus = None, ylim_rlocus = None,
         If True, plot gain and phase margin in the bode plot
     tvect : list or ndarray, optional
         List of timesteps to use for closed loop step response
+    incremental : boolean
+        If True (default), clicks on the root locus only recompute what
+        changes with the gain: the open loop frequency response and the
+        state space realization of sys are kept, and the plotted lines are
+        updated in place.
 
     Examples
     --------
@@ -83,12 +97,23 @@ def sisotool(sys, kvect = None, xlim_rlocus = None, ylim_rlocus = None,
     }
 
     # First time call to setup the bode and step response plots
-    _SisotoolUpdate(sys, fig,1 if kvect is None else kvect[0],bode_plot_params)
+    _sisotool_cache.pop(fig, None)
+    _SisotoolUpdate(sys, fig,1 if kvect is None else kvect[0],bode_plot_params,
+                    incremental=incremental)
 
     # Setup the root-locus plot window
     root_locus(sys,kvect=kvect,xlim=xlim_rlocus,ylim = ylim_rlocus,plotstr=plotstr_rlocus,grid = rlocus_grid,fig=fig,bode_plot_params=bode_plot_params,tvect=tvect,sisotool=True)
 
-def _SisotoolUpdate(sys,fig,K,bode_plot_params,tvect=None):
+def _SisotoolUpdate(sys,fig,K,bode_plot_params,tvect=None,incremental=None):
+
+    # Update the plots in place, if the figure was set up for this system
+    cache = _sisotool_cache.get(fig)
+    if incremental is None:
+        incremental = cache is not None
+    if incremental and cache is not None and \
+       _SisotoolCacheValid(cache, sys, bode_plot_params, tvect):
+        _SisotoolIncrementalUpdate(cache, fig, K, tvect)
+        return
 
     if int(matplotlib.__version__[0]) == 1:
         title_font_size = 12
@@ -136,13 +161,83 @@ def _SisotoolUpdate(sys,fig,K,bode_plot_params,tvect=None):
     # Generate the step response and plot it
     sys_closed = (K*sys).feedback(1)
     if tvect is None:
-        tvect, yout = step_response(sys_closed)
+        tout, yout = step_response(sys_closed)
     else:
-        tvect, yout = step_response(sys_closed,tvect)
-    ax_step.plot(tvect, yout)
+        tout, yout = step_response(sys_closed,tvect)
+    ax_step.plot(tout, yout)
     ax_step.axhline(1.,linestyle=':',color='k',zorder=-20)
 
     # Manually adjust the spacing and draw the canvas
     fig.subplots_adjust(top=0.9,wspace = 0.3,hspace=0.35)
     fig.canvas.draw()
 
+    # Keep what does not depend on the gain for the next updates
+    if incremental and not isdtime(sys, strict=True):
+        _sisotool_cache[fig] = _SisotoolCache(
+            sys, bode_plot_params, tvect, ax_mag.lines[0].get_xdata())
+    else:
+        _sisotool_cache.pop(fig, None)
+
+def _SisotoolCache(sys, bode_plot_params, tvect, omega_plot):
+    """Collect the gain independent data for incremental updates"""
+    params = dict((key, value) for key, value in bode_plot_params.items()
+                  if key not in ('syslist', 'fig'))
+    Hz = config.bode_Hz if params['Hz'] is None else params['Hz']
+    omega = np.array(omega_plot) * (2*np.pi if Hz else 1.)
+    mag, phase, omega = sys.freqresp(omega)
+    ss = _convertToStateSpace(sys)
+    return {
+        'sys': sys, 'tvect': tvect, 'params': params,
+        'dB': config.bode_dB if params['dB'] is None else params['dB'],
+        'deg': config.bode_deg if params['deg'] is None else params['deg'],
+        'Hz': Hz, 'omega': omega, 'mag': np.squeeze(mag),
+        'phase': unwrap(np.atleast_1d(np.squeeze(phase))),
+        'tf': _convert_to_transfer_function(sys),
+        'A': ss.A, 'B': ss.B, 'C': ss.C, 'D': ss.D}
+
+def _SisotoolCacheValid(cache, sys, bode_plot_params, tvect):
+    """Check whether the cached data can be used for this update"""
+    def same(a, b):
+        return a is b or (np.shape(a) == np.shape(b) and
+                          np.all(np.equal(a, b)))
+    params = cache['params']
+    return cache['sys'] is sys and same(cache['tvect'], tvect) and \
+        all(key in bode_plot_params and same(bode_plot_params[key], value)
+            for key, value in params.items())
+
+def _SisotoolIncrementalUpdate(cache, fig, K, tvect):
+    """Update the bode and step response plots for a new gain in place"""
+    ax_mag, ax_phase, ax_step = fig.axes[0], fig.axes[2], fig.axes[3]
+    K = float(np.real(K))
+    dB, deg, Hz = cache['dB'], cache['deg'], cache['Hz']
+
+    # The open loop magnitude scales with the gain, the phase stays
+    mag = K * cache['mag']
+    ax_mag.lines[0].set_ydata(20 * np.log10(mag) if dB else mag)
+
+    # Replace the margin markers
+    for ax in (ax_mag, ax_phase):
+        for line in ax.lines[1:]:
+            line.remove()
+        for text in ax.texts[:]:
+            text.remove()
+    ax_mag.relim()
+    ax_mag.autoscale_view()
+    if cache['params'].get('margins', True):
+        _bode_margin_plot(ax_mag, ax_phase, cache['tf'] * K, cache['phase'],
+                          cache['omega'], dB, deg, Hz, sisotool=True)
+
+    # Closed loop with unity negative feedback around K*sys
+    A, B, C, D = cache['A'], cache['B'], cache['C'], cache['D']
+    e = 1. / (1. + K * D)
+    sys_closed = StateSpace(A - K * B * e * C, K * B * e, e * C, K * e * D)
+    if tvect is None:
+        tout, yout = step_response(sys_closed)
+    else:
+        tout, yout = step_response(sys_closed, tvect)
+    ax_step.lines[0].set_data(tout, yout)
+    ax_step.relim()
+    ax_step.autoscale_view()
+
+    fig.canvas.draw_idle()
+
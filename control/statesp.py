@@ -62,11 +62,15 @@ import scipy as sp
 from scipy.signal import lti, cont2discrete
 from warnings import warn
 from .lti import LTI, timebase, timebaseEqual, isdtime
+from .exception import ControlSlycot
 from . import config
 from copy import deepcopy
 
 __all__ = ['StateSpace', 'ss', 'rss', 'drss', 'tf2ss', 'ssdata']
 
+# Number of complex matrix entries that _horner_hessenberg processes at once
+_hessenberg_block_size = 2**22
+
 
 def _ssmatrix(data, axis=1):
     """Convert argument to a (possibly empty) state space matrix.
@@ -434,7 +438,7 @@ but B has %i row(s)\n(output(s))." % (self.inputs, other.outputs))
         if isdtime(self, strict=True):
             dt = timebase(self)
             s = exp(1.j * omega * dt)
-            if omega * dt > math.pi:
+            if np.any(omega * dt > math.pi):
                 warn("_evalfr: frequency evaluation above Nyquist frequency")
         else:
             s = omega * 1.j
@@ -444,14 +448,79 @@ but B has %i row(s)\n(output(s))." % (self.inputs, other.outputs))
     def horner(self, s):
         """Evaluate the systems's transfer function for a complex variable
 
-        Returns a matrix of values evaluated at complex variable s.
+        Returns a matrix of values evaluated at complex variable s.  If s
+        is an array of N complex values, an array of shape (outputs,
+        inputs, N) is returned, computed for all points at once.
         """
+        if getattr(s, '__iter__', False):
+            return self._horner_hessenberg(s)
+
         resp = np.dot(self.C, solve(s * eye(self.states) - self.A,
                                     self.B)) + self.D
         return array(resp)
 
+    def _horner_hessenberg(self, s):
+        """Evaluate the transfer function at an array of complex points.
+
+        The state matrix is reduced to upper Hessenberg form once, A = Q H
+        Q^T, after which (s I - H) X = Q^T B is solved for all points at
+        the same time using Gaussian elimination with partial pivoting
+        (the same approach used by TB05AD).  Each elimination step only
+        involves two rows, so the work is vectorized across the points.
+
+        Returns an array of shape (outputs, inputs, len(s)).
+        """
+        s = np.atleast_1d(np.asarray(s, dtype=complex))
+        A, B, C, D = (np.asarray(M, dtype=float)
+                      for M in (self.A, self.B, self.C, self.D))
+        n, m, p, N = self.states, self.inputs, self.outputs, len(s)
+
+        out = np.empty((p, m, N), dtype=complex)
+        out[:] = D[:, :, np.newaxis]
+        if n == 0:
+            return out
+
+        # Reduce to Hessenberg form and transform B and C accordingly
+        H, Q = sp.linalg.hessenberg(A, calc_q=True)
+        Bt = np.dot(Q.T, B)
+        Ct = np.dot(C, Q)
+
+        # Process the points in blocks to bound the memory used for the
+        # stack of (s I - H) matrices
+        blk = max(1, _hessenberg_block_size // (n * n))
+        rows = np.arange(n)
+        for start in range(0, N, blk):
+            sb = s[start:start + blk]
+            nb = len(sb)
+            M = -np.broadcast_to(H, (nb, n, n)).astype(complex)
+            M[:, rows, rows] += sb[:, np.newaxis]
+            X = np.broadcast_to(Bt, (nb, n, m)).astype(complex)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Forward elimination of the subdiagonal
+                for k in range(n - 1):
+                    swap = np.abs(M[:, k+1, k]) > np.abs(M[:, k, k])
+                    if swap.any():
+                        M[swap, k:k+2, k:] = M[swap, k:k+2, k:][:, ::-1]
+                        X[swap, k:k+2] = X[swap, k:k+2][:, ::-1]
+                    piv = M[:, k+1, k] / M[:, k, k]
+                    M[:, k+1, k+1:] -= piv[:, np.newaxis] * M[:, k, k+1:]
+                    X[:, k+1] -= piv[:, np.newaxis] * X[:, k]
+
+                # Back substitution on the resulting upper triangular system
+                for k in range(n - 1, -1, -1):
+                    if k < n - 1:
+                        X[:, k] -= np.einsum(
+                            'ij,ijk->ik', M[:, k, k+1:], X[:, k+1:])
+                    X[:, k] /= M[:, k, k, np.newaxis]
+
+            out[:, :, start:start + nb] += \
+                np.einsum('ij,kjl->ilk', Ct, X)
+
+        return out
+
     # Method for generating the frequency response of the system
-    def freqresp(self, omega):
+    def freqresp(self, omega, method=None):
         """Evaluate the system's transfer func. at a list of freqs, omega.
 
         mag, phase, omega = self.freqresp(omega)
@@ -471,6 +540,12 @@ but B has %i row(s)\n(output(s))." % (self.inputs, other.outputs))
             A list of frequencies in radians/sec at which the system should be
             evaluated. The list can be either a python list or a numpy array
             and will be sorted before evaluation.
+        method : str, optional
+            Algorithm used to compute the response.  'slycot' uses TB05AD
+            from Slycot.  'hessenberg' reduces the A matrix to upper
+            Hessenberg form once and evaluates all frequencies in a
+            vectorized fashion using NumPy.  The default (None) uses
+            'slycot' if it is installed and 'hessenberg' otherwise.
 
         Returns
         -------
@@ -486,6 +561,8 @@ but B has %i row(s)\n(output(s))." % (self.inputs, other.outputs))
             evaluated.
 
         """
+        if method not in (None, 'slycot', 'hessenberg'):
+            raise ValueError("unknown freqresp method '%s'" % method)
 
         # In case omega is passed in as a list, rather than a proper array.
         omega = np.asarray(omega)
@@ -506,10 +583,21 @@ but B has %i row(s)\n(output(s))." % (self.inputs, other.outputs))
             cmplx_freqs = omega * 1.j
 
         # Do the frequency response evaluation. Use TB05AD from Slycot
-        # if it's available, otherwise use the built-in horners function.
-        try:
-            from slycot import tb05ad
+        # if it's available, otherwise use the Hessenberg method.
+        if method is None or method == 'slycot':
+            try:
+                from slycot import tb05ad
+            except ImportError:
+                if method == 'slycot':
+                    raise ControlSlycot("can't find slycot module 'tb05ad'")
+                method = 'hessenberg'
+            else:
+                method = 'slycot'
 
+        if method == 'hessenberg':
+            Gfrf = self._horner_hessenberg(cmplx_freqs)
+
+        else:
             n = np.shape(self.A)[0]
             m = self.inputs
             p = self.outputs
@@ -538,10 +626,6 @@ but B has %i row(s)\n(output(s))." % (self.inputs, other.outputs))
                 # but zero-th spot is already filled.
                 Gfrf[:, :, kk+1] = result[0] + self.D
 
-        except ImportError:  # Slycot unavailable. Fall back to horner.
-            for kk, cmplx_freqs_kk in enumerate(cmplx_freqs):
-                Gfrf[:, :, kk] = self.horner(cmplx_freqs_kk)
-
         #      mag           phase           omega
         return np.abs(Gfrf), np.angle(Gfrf), omega
 
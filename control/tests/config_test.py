@@ -169,6 +169,24 @@ class TestConfig(unittest.TestCase):
 
         ct.reset_defaults()
 
+    def test_bode_adaptive_grid(self):
+        # Lightly damped resonance, which a coarse grid would miss
+        sys = ct.tf([1], [1, 0.002, 1]) * ct.tf([10], [1, 10])
+        ct.config.bode_adaptive_grid = True
+        mag_ret, phase_ret, omega_ret = ct.bode_plot(sys, Hz=False,
+                                                     Plot=False)
+        self.assertLess(len(omega_ret), 200)
+        np.testing.assert_almost_equal(omega_ret[[0, -1]], [0.1, 100.])
+        peak = np.abs(sys._evalfr(np.sqrt(1 - 2 * 0.001**2))[0][0])
+        np.testing.assert_allclose(mag_ret.max(), peak, rtol=1e-3)
+
+        # The number of samples limits the size of the grid
+        ct.config.bode_number_of_samples = 20
+        mag_ret, phase_ret, omega_ret = ct.bode_plot(sys, Plot=False)
+        self.assertLessEqual(len(omega_ret), 20)
+
+        ct.reset_defaults()
+
     def test_reset_defaults(self):
         ct.use_matlab_defaults()
         ct.reset_defaults()
@@ -177,6 +195,7 @@ class TestConfig(unittest.TestCase):
         self.assertEquals(ct.config.bode_Hz, False)
         self.assertEquals(ct.config.bode_number_of_samples, None)
         self.assertEquals(ct.config.bode_feature_periphery_decade, 1.0)
+        self.assertEquals(ct.config.bode_adaptive_grid, False)
 
     def tearDown(self):
         # Get rid of any figures that we created
@@ -161,6 +161,42 @@ class TestFRD(unittest.TestCase):
             f1.feedback().freqresp([0.1, 1.0, 10])[0],
             h1.feedback().freqresp([0.1, 1.0, 10])[0])
 
+    def testFeedbackMIMO(self):
+        sys = StateSpace([[-0.5, 0.0], [0.0, -1.0]],
+                         [[1.0, 0.0], [0.0, 1.0]],
+                         [[1.0, 0.0], [0.5, 1.0]],
+                         [[0.0, 0.0], [0.0, 0.0]])
+        K = np.array([[2., 0.1], [0., 1.]])
+        omega = np.logspace(-1, 2, 10)
+        f1 = FRD(sys, omega)
+        for sign in (-1, 1):
+            np.testing.assert_array_almost_equal(
+                f1.feedback(K, sign=sign).fresp,
+                FRD(sys.feedback(K, sign=sign), omega).fresp)
+
+        # SISO positive feedback
+        h1 = TransferFunction([1], [1, 2, 2])
+        np.testing.assert_array_almost_equal(
+            FRD(h1, omega).feedback(0.5, sign=1).fresp,
+            FRD(h1.feedback(0.5, sign=1), omega).fresp)
+
+    def testCombine(self):
+        P = TransferFunction([1], [1, 2, 2])
+        C = TransferFunction([2, 1], [1, 0])
+        omega = np.logspace(-1, 2, 100)
+        Pf, Cf = FRD(P, omega), FRD(C, omega)
+
+        T = Pf.combine(lambda p, c: p * c / (1 + p * c), Cf, blocksize=7)
+        np.testing.assert_array_almost_equal(
+            T.fresp, (Pf * Cf / (1 + Pf * Cf)).fresp)
+        np.testing.assert_array_almost_equal(
+            T.fresp, FRD((P * C).feedback(), omega).fresp)
+
+        # Other LTI systems are converted at the frequencies of self
+        T = Pf.combine(lambda p, c: p * c / (1 + p * c), C)
+        np.testing.assert_array_almost_equal(
+            T.fresp, FRD((P * C).feedback(), omega).fresp)
+
     def testFeedback2(self):
         h2 = StateSpace([[-1.0, 0], [0, -2.0]], [[0.4], [0.1]],
                         [[1.0, 0], [0, 1]], [[0.0], [0.0]])
@@ -266,6 +302,32 @@ class TestFRD(unittest.TestCase):
             (f1*f2).freqresp([0.1, 1.0, 10])[2],
             (sys*sys2).freqresp([0.1, 1.0, 10])[2])
 
+    def testMIMOSmoothEval(self):
+        """Evaluate an interpolating MIMO FRD at arrays of frequencies."""
+        sys = StateSpace([[-0.5, 0.0], [0.0, -1.0]],
+                         [[1.0, 0.0], [0.0, 1.0]],
+                         [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+                         [[0.0, 0.0], [0.0, 0.0], [0.0, 0.0]])
+        omega = np.logspace(-1, 2, 200)
+        f1 = FRD(sys, omega, smooth=True)
+
+        # Data points are reproduced exactly
+        np.testing.assert_array_almost_equal(
+            f1.eval(omega), sys._evalfr(omega))
+
+        # Intermediate points, evaluated all at once or one at a time
+        omega_eval = np.logspace(-0.9, 1.9, 37)
+        resp = f1.eval(omega_eval)
+        self.assertEqual(resp.shape, (3, 2, 37))
+        for k, w in enumerate(omega_eval):
+            np.testing.assert_array_almost_equal(resp[:, :, k], f1.eval(w))
+        np.testing.assert_array_almost_equal(
+            resp, sys._evalfr(omega_eval), decimal=4)
+
+        mag, phase, omega_out = f1.freqresp(omega_eval)
+        np.testing.assert_array_almost_equal(
+            mag * np.exp(1j * phase), resp)
+
     def testAgainstOctave(self):
         # with data from octave:
         # sys = ss([-2 0 0; 0 -1 1; 0 0 -3],
@@ -388,6 +450,71 @@ class TestFRD(unittest.TestCase):
         # Should get an error if we evaluate at an unknown frequency
         self.assertRaises(ValueError, frd_tf.eval, 2)
 
+    def test_eval_array(self):
+        # Unsorted data, looked up with a vector of exact frequencies
+        omega = np.array([10., 0.1, 3., 1.])
+        resp = np.arange(24).reshape(2, 3, 4) * (1 + 1j)
+        sys = FRD(resp, omega)
+
+        out = sys.eval([1., 10., 1., 0.1 + 1e-12])
+        self.assertEqual(out.shape, (2, 3, 4))
+        np.testing.assert_array_equal(out, resp[:, :, [3, 0, 3, 1]])
+        np.testing.assert_array_equal(sys.eval(3.), resp[:, :, 2])
+
+        # Frequencies outside the list generate an error
+        self.assertRaises(ValueError, sys.eval, [1., 2.])
+        self.assertRaises(ValueError, sys.eval, 100.)
+
+        # Frequency response of a non-interpolating FRD
+        mag, phase, w = sys.freqresp([10., 0.1])
+        np.testing.assert_array_equal(w, [0.1, 10.])
+        np.testing.assert_array_almost_equal(
+            mag * np.exp(1j * phase), resp[:, :, [1, 0]])
+
+    def test_memmap(self):
+        # FRD backed by an on-disk array
+        import tempfile
+        from control.frdata import _is_mapped
+        sys = StateSpace([[-0.5, 0.0], [0.0, -1.0]],
+                         [[1.0, 0.0], [0.0, 1.0]],
+                         [[1.0, 0.0], [0.0, 1.0]],
+                         [[0.0, 0.0], [0.0, 0.0]])
+        omega = np.logspace(-1, 2, 100)
+        ref = FRD(sys, omega)
+
+        with tempfile.TemporaryFile() as fp:
+            data = np.memmap(fp, dtype=complex, mode='w+',
+                             shape=ref.fresp.shape)
+            data[:] = ref.fresp
+            frd = FRD(data, omega, copy=False)
+            self.assertTrue(_is_mapped(frd.fresp))
+
+            # The factory function also keeps the data on disk
+            frd_f = ct.frd(data, omega, copy=False)
+            self.assertTrue(_is_mapped(frd_f.fresp))
+            np.testing.assert_array_equal(frd_f.fresp, ref.fresp)
+            self.assertFalse(_is_mapped(ct.frd(data, omega).fresp))
+
+            # Force evaluation in several blocks
+            blocksize, FRD.blocksize = FRD.blocksize, 40
+            try:
+                result = (frd * frd - frd) / 2.
+                self.assertTrue(_is_mapped(result.fresp))
+                np.testing.assert_array_almost_equal(
+                    result.fresp, ((ref * ref - ref) / 2.).fresp)
+
+                omega_eval = omega[::3].copy()
+                mag, phase, w = result.freqresp(omega_eval)
+                mag_ref, phase_ref, w = ((ref * ref - ref) / 2.).freqresp(
+                    omega_eval)
+                np.testing.assert_array_almost_equal(mag, mag_ref)
+                np.testing.assert_array_almost_equal(phase, phase_ref)
+            finally:
+                FRD.blocksize = blocksize
+
+        # Default constructor copies the data into memory
+        self.assertFalse(_is_mapped(FRD(frd.fresp, omega).fresp))
+
     # This test only works in Python 3 due to a conflict with the same
     # warning type in other test modules (frd_test.py).  See
     # https://bugs.python.org/issue4180 for more details
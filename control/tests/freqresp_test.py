@@ -138,6 +138,94 @@ class TestFreqresp(unittest.TestCase):
       phase_to_infinity = (np.array([10., 10.]), np.array([1.00000000e-08, -1.80000000e+02]))
       assert_array_almost_equal(phase_to_infinity, allaxes[1].lines[4].get_data())
 
+   def test_parallel(self):
+      # Compute responses for a list of systems in parallel
+      from concurrent.futures import ThreadPoolExecutor
+      np.random.seed(0)
+      syslist = [rss(4, 1, 1) for i in range(6)]
+      omega = np.logspace(-1, 2, 50)
+
+      mags, phases, omegas = ctrl.bode_plot(syslist, omega, Plot=False)
+      for n_jobs in (2, -1):
+         mags_p, phases_p, omegas_p = ctrl.bode_plot(
+            syslist, omega, Plot=False, n_jobs=n_jobs)
+         for k in range(len(syslist)):
+            np.testing.assert_array_almost_equal(mags_p[k], mags[k])
+            np.testing.assert_array_almost_equal(phases_p[k], phases[k])
+            np.testing.assert_array_equal(omegas_p[k], omegas[k])
+
+      with ThreadPoolExecutor(max_workers=2) as executor:
+         xs, ys, ws = ctrl.nyquist_plot(
+            syslist, omega, Plot=False, executor=executor)
+      self.assertEqual(len(xs), len(syslist))
+      for sys, x, y, w in zip(syslist, xs, ys, ws):
+         mag, phase, w_ref = sys.freqresp(omega)
+         np.testing.assert_array_almost_equal(
+            x + 1j * y, np.squeeze(mag * np.exp(1j * phase)))
+         np.testing.assert_array_equal(w, w_ref)
+
+      # Extra positional arguments still go to matplotlib
+      plt.figure()
+      ctrl.bode_plot(syslist[:2], omega, None, None, None, True, None,
+                     None, False, 'r--', n_jobs=2)
+      ctrl.nyquist_plot(syslist[:2], omega, True, None, 0, 'r--', n_jobs=2)
+      for line in plt.gcf().axes[0].get_lines()[:2]:
+         self.assertEqual(line.get_linestyle(), '--')
+
+      # Invalid n_jobs and MIMO systems fail before any response is computed
+      for n_jobs in (0, -2, 1.5):
+         self.assertRaises(ValueError, ctrl.bode_plot, syslist, omega,
+                           Plot=False, n_jobs=n_jobs)
+         self.assertRaises(ValueError, ctrl.nyquist_plot, syslist, omega,
+                           Plot=False, n_jobs=n_jobs)
+
+      class NoExecutor(object):
+         def map(self, *args):
+            raise AssertionError("responses computed for a MIMO system")
+
+      mimo = rss(2, 2, 2)
+      self.assertRaises(NotImplementedError, ctrl.bode_plot,
+                        syslist + [mimo], omega, Plot=False,
+                        executor=NoExecutor())
+      self.assertRaises(NotImplementedError, ctrl.nyquist_plot,
+                        syslist + [mimo], omega, Plot=False,
+                        executor=NoExecutor())
+
+   def test_adaptive_frequency_range(self):
+      # Adaptive grid should resolve the peak and crossover accurately
+      # with far fewer points than the default logspace grid
+      sys = ctrl.tf([1], [1, 0.01, 1]) * ctrl.tf([2], [1, 2]) * \
+            ctrl.tf([1, 0.2, 4], [1, 0.4, 4])
+      omega = ctrl.freqplot.default_frequency_range(sys, adaptive=True)
+      omega_ref = ctrl.freqplot.default_frequency_range(
+         sys, number_of_samples=1000)
+      self.assertLess(len(omega), 300)
+      np.testing.assert_almost_equal(omega[[0, -1]], omega_ref[[0, -1]])
+      self.assertTrue(np.all(np.diff(omega) > 0))
+
+      mag, phase, omega = sys.freqresp(omega)
+      mag_ref, phase_ref, omega_ref = sys.freqresp(np.logspace(-1, 1, 100000))
+      np.testing.assert_allclose(mag.max(), mag_ref.max(), rtol=1e-3)
+
+      # Mixed list of continuous and discrete time systems
+      sysd = ctrl.sample_system(sys, 0.1)
+      omega = ctrl.freqplot.default_frequency_range(
+         [sys, sysd], adaptive=True)
+      self.assertLess(len(omega), 1000)
+
+   def test_adaptive_frequency_range_wide(self):
+      # A small number of samples must not truncate a wide frequency range
+      sys = ctrl.tf([1], [1, .002, 1]) * ctrl.tf([1e4], [1, 1e4]) * \
+            ctrl.tf([1e-3], [1, 1e-3])
+      omega_ref = ctrl.freqplot.default_frequency_range(
+         sys, number_of_samples=30)
+      for n in (5, 30, 1000):
+         omega = ctrl.freqplot.default_frequency_range(
+            sys, number_of_samples=n, adaptive=True)
+         self.assertLessEqual(len(omega), n)
+         np.testing.assert_almost_equal(omega[[0, -1]], omega_ref[[0, -1]])
+         self.assertTrue(np.all(np.diff(omega) > 0))
+
    def test_discrete(self):
       # Test discrete time frequency response
 
@@ -313,6 +313,199 @@ class TestIOSys(unittest.TestCase):
         # ios_t, ios_y = ios.input_output_response(iosys, T, U, X0)
         self.assertRaises(RuntimeError, ios.input_output_response, *args)
 
+    def test_compiled_interconnection(self):
+        """Compiled evaluation agrees with the fixed point iteration"""
+        # Static nonlinearity feeding through a chain, listed in reverse
+        # order, with feedback through a strictly proper system
+        lnios = ios.LinearIOSystem(self.siso_linsys)
+        ftios = ios.LinearIOSystem(ct.StateSpace(
+            [[-1, 1], [0, -2]], [[0], [1]], [[1, 0]], [[2]]))
+        nlios = ios.NonlinearIOSystem(
+            None, lambda t, x, u, params: np.tanh(u), inputs=1, outputs=1)
+        iosys = ios.InterconnectedSystem(
+            (lnios, ftios, nlios),
+            ((0, 1), (1, 2), (2, (0, 0, -1))),
+            [(2, 0)], [(0, 0)]
+        )
+        compiled = iosys._compile()
+        self.assertIsNotNone(compiled)
+        self.assertEqual([block[0] for block in compiled.blocks],
+                         [lnios, nlios, ftios])
+
+        x, u = np.array([1., -1., 0.5, 2.]), np.array([0.3])
+        ulist, ylist = iosys._compute_static_io(0, x, u)
+        xdot, y = iosys._rhs(0, x, u), iosys._out(0, x, u)
+        iosys._compiled = (iosys.connect_map, iosys.input_map, None)
+        np.testing.assert_array_almost_equal(
+            iosys._compute_static_io(0, x, u)[0], ulist)
+        np.testing.assert_array_almost_equal(
+            iosys._compute_static_io(0, x, u)[1], ylist)
+        np.testing.assert_array_almost_equal(iosys._rhs(0, x, u), xdot)
+        np.testing.assert_array_almost_equal(iosys._out(0, x, u), y)
+
+        # Replacing the connection map recompiles the interconnection
+        iosys.set_connect_map(np.zeros(iosys.connect_map.shape))
+        self.assertIsNotNone(iosys._compile())
+        self.assertEqual(len(iosys._compile().delayed), 0)
+
+        # Algebraic loops are left to the fixed point iteration
+        loop = ios.InterconnectedSystem(
+            (nlios, ftios), ((0, 1), (1, (0, 0, -1))), 0, 0)
+        self.assertIsNone(loop._compile())
+
+    @unittest.skipIf(StrictVersion(sp.__version__) < "1.0",
+                     "requires SciPy 1.0 or greater")
+    def test_linear_interconnection(self):
+        """Interconnections of linear systems are collapsed to StateSpace"""
+        lnios = ios.LinearIOSystem(self.siso_linsys)
+        ftios = ios.LinearIOSystem(ct.StateSpace(
+            [[-1, 1], [0, -2]], [[0], [1]], [[1, 0]], [[2]]))
+        mimoios = ios.LinearIOSystem(self.mimo_linsys2)
+        iosys = ios.InterconnectedSystem(
+            (lnios, ftios, mimoios),
+            ((1, 0), ((2, 0), (1, 0, 0.5)), ((0, 0), (2, 1, -1))),
+            [(2, 1), [(1, 0), (2, 0)]], [(0, 0), (1, 0), (2, 0, 3)]
+        )
+        linsys = iosys._linear_statespace()
+        self.assertEqual((linsys.states, linsys.inputs, linsys.outputs),
+                         (6, 2, 3))
+
+        # Same dynamics and outputs as the interconnected system
+        x, u = np.arange(1., 7.), np.array([0.5, -2.])
+        A, B, C, D = [np.asarray(M) for M in
+                      (linsys.A, linsys.B, linsys.C, linsys.D)]
+        np.testing.assert_array_almost_equal(
+            np.dot(A, x) + np.dot(B, u), iosys._rhs(0, x, u))
+        np.testing.assert_array_almost_equal(
+            np.dot(C, x) + np.dot(D, u), iosys._out(0, x, u))
+
+        # Simulation goes through forced_response
+        T, X0 = self.T, np.ones(6)
+        U = [np.sin(T), np.cos(T)]
+        ios_t, ios_y, ios_x = ios.input_output_response(
+            iosys, T, U, X0, return_x=True)
+        lin_t, lin_y, lin_x = ct.forced_response(linsys, T, U, X0)
+        np.testing.assert_array_almost_equal(ios_t, T)
+        np.testing.assert_array_almost_equal(ios_y, lin_y)
+        np.testing.assert_array_almost_equal(ios_x, lin_x)
+
+        # An explicitly given integration method is still used
+        class CountingLSODA(sp.integrate.LSODA):
+            count = 0
+
+            def __init__(self, *args, **kwargs):
+                CountingLSODA.count += 1
+                super(CountingLSODA, self).__init__(*args, **kwargs)
+
+        ios_t, ios_y = ios.input_output_response(
+            iosys, T, U, X0, method=CountingLSODA)
+        self.assertEqual(CountingLSODA.count, 1)
+        np.testing.assert_array_almost_equal(ios_y, lin_y, decimal=2)
+
+        # Nonlinear subsystems and algebraic loops are not collapsed
+        nlios = ios.NonlinearIOSystem(
+            None, lambda t, x, u, params: u, inputs=1, outputs=1)
+        self.assertIsNone(ios.InterconnectedSystem(
+            (lnios, nlios), ((1, 0),), 0, 1)._linear_statespace())
+        self.assertIsNone(ios.InterconnectedSystem(
+            (ftios, ftios.copy()), ((1, 0), (0, (1, 0, -1))), 0, 0
+        )._linear_statespace())
+
+    @unittest.skipIf(StrictVersion(sp.__version__) < "1.0",
+                     "requires SciPy 1.0 or greater")
+    def test_vectorized_rhs(self):
+        """Vectorized right hand sides for blocks of states"""
+        # Vectorized nonlinear system simulated with an implicit solver
+        T = self.T
+        nlsys = ios.NonlinearIOSystem(predprey, states=2)
+        vecsys = ios.NonlinearIOSystem(predprey, states=2, vectorized=True)
+        self.assertFalse(nlsys.vectorized)
+        self.assertTrue(vecsys.vectorized)
+        for method in ('RK45', 'BDF'):
+            _t, y = ios.input_output_response(
+                nlsys, T, 0, [0.5, 0.5], method=method)
+            _t, yvec = ios.input_output_response(
+                vecsys, T, 0, [0.5, 0.5], method=method)
+            np.testing.assert_array_almost_equal(yvec, y)
+
+        # Interconnection of vectorized systems is vectorized
+        cubic = ios.NonlinearIOSystem(
+            lambda t, x, u, params: -x**3 + u, inputs=1, states=1,
+            vectorized=True)
+        lnios = ios.LinearIOSystem(self.siso_linsys)
+        iosys = ios.InterconnectedSystem(
+            (lnios, cubic), ((1, 0), (0, (1, 0, -1))), [(0, 0)], [(1, 0)])
+        self.assertTrue(iosys.vectorized)
+        x = np.array([[1., 0.5, -1.], [0., 2., 1.], [-1., 1., 3.]])
+        u = np.array([[0.5, -0.5, 1.]])
+        xdot = iosys._rhs_vectorized(0, x, u)
+        y = iosys._out_vectorized(0, x, u)
+        self.assertEqual(xdot.shape, (3, 3))
+        for i in range(3):
+            np.testing.assert_array_almost_equal(
+                xdot[:, i], iosys._rhs(0, x[:, i], u[:, i]))
+            np.testing.assert_array_almost_equal(
+                y[:, i], iosys._out(0, x[:, i], u[:, i]))
+
+        # Subsystems without a vectorized form are evaluated column-wise
+        iosys = ios.InterconnectedSystem(
+            (lnios, ios.NonlinearIOSystem(
+                lambda t, x, u, params: -x**3 + u, inputs=1, states=1)),
+            ((1, 0), (0, (1, 0, -1))), [(0, 0)], [(1, 0)])
+        self.assertFalse(iosys.vectorized)
+        np.testing.assert_array_almost_equal(
+            iosys._rhs_vectorized(0, x, u), xdot)
+
+    @unittest.skipIf(StrictVersion(sp.__version__) < "1.0",
+                     "requires SciPy 1.0 or greater")
+    def test_rhs_jacobian(self):
+        """Jacobians for the implicit solvers"""
+        # Damped pendulum with its Jacobian, a saturation and a linear system
+        calls = []
+        def pendjac(t, x, u, params):
+            calls.append(t)
+            return [[0, 1], [-np.cos(x[0]), -1]]
+        pendulum = ios.NonlinearIOSystem(
+            lambda t, x, u, params: [x[1], -np.sin(x[0]) - x[1] + u[0]],
+            lambda t, x, u, params: x[:1], inputs=1, outputs=1, states=2,
+            jacfcn=pendjac)
+        saturation = ios.NonlinearIOSystem(
+            None, lambda t, x, u, params: np.tanh(u), inputs=1, outputs=1)
+        lnios = ios.LinearIOSystem(self.siso_linsys)
+        np.testing.assert_array_equal(
+            lnios._rhs_jacobian(0, [0, 0], [0]), self.siso_linsys.A)
+
+        iosys = ios.InterconnectedSystem(
+            (pendulum, saturation, lnios),
+            ((1, 0), (2, (1, 0)), ((0, 0), (2, 0, -1))),
+            [(2, 0)], [(0, 0)]
+        )
+        x, u = np.array([0.3, -0.2, 1., 0.5]), np.array([0.2])
+        jac = iosys._rhs_jacobian(0, x, u)
+        np.testing.assert_array_almost_equal(
+            jac.toarray(), iosys.linearize(x, u).A, decimal=5)
+
+        # The sparsity pattern covers the Jacobian
+        pattern = iosys._jac_sparsity().toarray()
+        self.assertTrue(np.all(pattern[jac.toarray() != 0]))
+        np.testing.assert_array_equal(pattern[2], [0, 0, 1, 1])
+
+        # Implicit solvers agree with the explicit one
+        T, U = self.T, self.U
+        _t, y = ios.input_output_response(iosys, T, U, x)
+        for method in ('BDF', 'Radau', 'LSODA'):
+            del calls[:]
+            _t, yimp = ios.input_output_response(
+                iosys, T, U, x, method=method)
+            self.assertTrue(len(calls) > 0)
+            np.testing.assert_array_almost_equal(yimp, y, decimal=2)
+
+        # Without a Jacobian, only the sparsity pattern is known
+        pendulum.jacfcn = None
+        self.assertIsNone(iosys._rhs_jacobian(0, x, u))
+        _t, yimp = ios.input_output_response(iosys, T, U, x, method='BDF')
+        np.testing.assert_array_almost_equal(yimp, y, decimal=2)
+
     @unittest.skipIf(StrictVersion(sp.__version__) < "1.0",
                      "requires SciPy 1.0 or greater")
     def test_summer(self):
@@ -528,6 +721,96 @@ class TestIOSys(unittest.TestCase):
         np.testing.assert_array_almost_equal(ios_t, lin_t, decimal=3)
         np.testing.assert_array_almost_equal(ios_y, lin_y, decimal=3)
 
+    @unittest.skipIf(StrictVersion(sp.__version__) < "1.0",
+                     "requires SciPy 1.0 or greater")
+    def test_input_output_response_chunks(self):
+        """Test simulation of a long input in chunks"""
+        T, U, X0 = self.T, self.U, [1, 0]
+        chunks = (U[:1], U[1:40], U[40:41], U[41:])
+
+        # Continuous time: agrees within the integration tolerance
+        iosys = ios.LinearIOSystem(self.siso_linsys)
+        ios_t, ios_y = ios.input_output_response(iosys, T, U, X0)
+        results = list(ios.input_output_response_chunks(
+            iosys, chunks, T[1] - T[0], X0))
+        self.assertEqual([len(t) for t, y, x in results], [1, 39, 1, 59])
+        np.testing.assert_array_almost_equal(
+            np.hstack([t for t, y, x in results]), ios_t)
+        np.testing.assert_array_almost_equal(
+            np.hstack([y for t, y, x in results]), ios_y, decimal=2)
+
+        # Discrete time, MIMO: agrees exactly
+        linsys = ct.StateSpace(self.mimo_linsys1)
+        linsys.dt = T[1] - T[0]
+        iosys = ios.LinearIOSystem(linsys)
+        U = np.array([np.sin(T), np.cos(T)])
+        ios_t, ios_y, ios_x = ios.input_output_response(
+            iosys, T, U, X0, return_x=True)
+        results = list(ios.input_output_response_chunks(
+            iosys, (U[:, i:i+16] for i in range(0, len(T), 16)),
+            T[1] - T[0], X0))
+        np.testing.assert_array_almost_equal(
+            np.hstack([y for t, y, x in results]), ios_y)
+        np.testing.assert_array_almost_equal(
+            np.hstack([x for t, y, x in results]), ios_x)
+
+    def test_input_sampler(self):
+        """Input lookup agrees with scipy.interpolate.interp1d"""
+        T = self.T
+        U = np.array([np.sin(T), np.cos(3 * T)])
+        times = np.hstack((T, np.linspace(-1, 11, 97)))
+        for UU in (U, U[0]):
+            interp = sp.interpolate.interp1d(T, UU, fill_value="extrapolate")
+            sampler = ios._InputSampler(T, UU)
+            for t in times:
+                np.testing.assert_array_almost_equal(sampler(t), interp(t))
+                self.assertEqual(np.shape(sampler(t)), np.shape(interp(t)))
+
+        # Non-uniform time grid
+        Tn = np.array([0., 0.1, 0.5, 2., 2.2])
+        interp = sp.interpolate.interp1d(Tn, Tn**2, fill_value="extrapolate")
+        sampler = ios._InputSampler(Tn, Tn**2)
+        for t in np.linspace(-1, 3, 41):
+            self.assertAlmostEqual(sampler(t), interp(t))
+
+        # Zero order hold keeps each sample until the next one
+        sampler = ios._InputSampler(T, U, kind='zoh')
+        for k in (0, 10, 50, 99):
+            np.testing.assert_array_equal(sampler(T[k]), U[:, k])
+            np.testing.assert_array_equal(
+                sampler(T[k] + 0.9 * (T[1] - T[0])), U[:, k])
+        np.testing.assert_array_equal(sampler(-1), U[:, 0])
+        np.testing.assert_array_equal(sampler(11), U[:, -1])
+        self.assertRaises(ValueError, ios._InputSampler, T, U, 'cubic')
+
+    @unittest.skipIf(StrictVersion(sp.__version__) < "1.0",
+                     "requires SciPy 1.0 or greater")
+    def test_zoh_input_response(self):
+        """Zero order hold inputs match a ZOH discretization"""
+        T = np.linspace(0, 5, 26)
+        U = np.sign(np.sin(3 * T)) + 0.5 * np.cos(T)
+        X0 = [0.5, -0.5]
+        sysd = ct.c2d(self.siso_linsys, T[1] - T[0], 'zoh')
+        _t, yref, xref = ct.forced_response(sysd, T, U, X0)
+
+        linsys = ios.LinearIOSystem(self.siso_linsys)
+        nlsys = ios.NonlinearIOSystem(
+            lambda t, x, u, params: np.dot(linsys.A, x).A1 +
+            np.dot(linsys.B, u).A1,
+            lambda t, x, u, params: np.dot(linsys.C, x).A1 +
+            np.dot(linsys.D, u).A1, inputs=1, outputs=1, states=2)
+        for sys in (linsys, nlsys):
+            _t, y, x = ios.input_output_response(
+                sys, T, U, X0, return_x=True, input_interpolation='zoh')
+            np.testing.assert_array_almost_equal(x, xref, decimal=3)
+            np.testing.assert_array_almost_equal(y, yref, decimal=3)
+
+        # Linear interpolation gives a different response
+        _t, y = ios.input_output_response(linsys, T, U, X0)
+        self.assertFalse(np.allclose(y, yref, atol=1e-3))
+        self.assertRaises(ValueError, ios.input_output_response, linsys, T,
+                          U, X0, input_interpolation='cubic')
+
     def test_find_eqpts(self):
         """Test find_eqpt function"""
         # Simple equilibrium point with no inputs
@@ -192,6 +192,53 @@ class TestMargin(unittest.TestCase):
                     assert_array_almost_equal(
                         res, comp, 2)
 
+    def test_stability_margins_batch(self):
+        # batch results agree with stability_margins, including FRD and
+        # discrete time systems that are handled one by one
+        syslist = [sys for sys, rgm, rwgm, rpm, rwpm in self.tsys]
+        omega = np.logspace(-2, 2, 500)
+        syslist += [FRD(self.sys2, omega), TransferFunction([1], [1, 0]),
+                    TransferFunction([0.1], [1, -0.9], 0.1)]
+        out = stability_margins_batch(syslist)
+        for k, sys in enumerate(syslist):
+            assert_array_almost_equal(
+                [res[k] for res in out], stability_margins(sys))
+
+        out = stability_margins_batch(syslist, returnall=True)
+        for k, sys in enumerate(syslist):
+            for res, comp in zip(out, stability_margins(sys, returnall=True)):
+                assert_array_almost_equal(np.sort(res[k]), np.sort(comp))
+
+        # parameterized family of systems, evaluated in parallel
+        from concurrent.futures import ThreadPoolExecutor
+        gains = [0.5, 1., 2., 4.]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            out = stability_margins_batch(
+                lambda k: TransferFunction([k], [1, 2, 3, 4]), gains,
+                executor=executor)
+        for k, gain in enumerate(gains):
+            assert_array_almost_equal(
+                [res[k] for res in out],
+                stability_margins(TransferFunction([gain], [1, 2, 3, 4])))
+
+        # any object with a map method can be used as executor, with n_jobs
+        # setting the number of chunks
+        class MapExecutor(object):
+            def __init__(self):
+                self.tasks = 0
+
+            def map(self, fn, *iterables):
+                results = list(map(fn, *iterables))
+                self.tasks += len(results)
+                return results
+
+        executor = MapExecutor()
+        out2 = stability_margins_batch(
+            lambda k: TransferFunction([k], [1, 2, 3, 4]), gains,
+            n_jobs=3, executor=executor)
+        self.assertEqual(executor.tasks, 3)
+        assert_array_almost_equal(out2, out)
+
     def test_phase_crossover_frequencies(self):
         omega, gain = phase_crossover_frequencies(self.sys2)
         assert_array_almost_equal(omega, [1.73205,  0.])
@@ -260,6 +307,63 @@ class TestMargin(unittest.TestCase):
         assert_array_almost_equal(
             [pm], [44.55], 2)
 
+    def test_frd_polish(self):
+        # margins from densely sampled data match the analytic ones, with
+        # and without refining the interpolated crossings
+        omega = np.logspace(-3, 3, 5000)
+        sys = FRD(self.sys4, omega)
+        ref = stability_margins(self.sys4, returnall=True)
+        out = stability_margins(sys, returnall=True)
+        for res, comp in zip(out, ref):
+            assert_array_almost_equal(res, comp, 4)
+        out = stability_margins(sys, returnall=True, polish=False)
+        for res, comp in zip(out, ref):
+            assert_array_almost_equal(res, comp, 2)
+
+    def test_disk_margins(self):
+        # balanced disk margin of a SISO loop
+        L = TransferFunction(25, [1, 10, 10, 10])
+        dm, dgm, dpm, wm = disk_margins(L)
+        assert_array_almost_equal(dm, [0.4581])
+        assert_array_almost_equal(dgm, [[0.6273, 1.5942]])
+        assert_array_almost_equal(dpm, [25.8017], 2)
+        assert_array_almost_equal(wm, [1.955], 2)
+
+        # for SISO systems multi-loop and loop-at-a-time margins agree
+        out = multiloop_disk_margins(L)
+        assert_array_almost_equal(out[0], dm[0])
+        assert_array_almost_equal(out[3], wm[0], 2)
+
+        # sampled response gives the same result
+        out = disk_margins(FRD(L, np.logspace(-2, 2, 2000)))
+        assert_array_almost_equal(out[0], dm)
+
+        # margins at all frequencies
+        alpha, dgm, dpm, omega = disk_margins(L, returnall=True)
+        self.assertEqual(alpha.shape, (1, len(omega)))
+        self.assertTrue(np.all(alpha >= dm[0] - 1e-8))
+
+    def test_multiloop_disk_margins(self):
+        # decoupled loops, the multi-loop margin is the smallest one
+        L = StateSpace([[0., 1., 0., 0.], [0., -1., 0., 0.],
+                        [0., 0., 0., 1.], [0., 0., -2., -3.]],
+                       [[0., 0.], [2., 0.], [0., 0.], [0., 5.]],
+                       [[1., 0., 0., 0.], [0., 0., 1., 0.]], np.zeros((2, 2)))
+        dm, dgm, dpm, wm = disk_margins(L)
+        assert_array_almost_equal(
+            dm, [disk_margins(TransferFunction(2, [1, 1, 0]))[0][0],
+                 disk_margins(TransferFunction(5, [1, 3, 2]))[0][0]])
+        out = multiloop_disk_margins(L)
+        assert_array_almost_equal(out[0], min(dm))
+        assert_array_almost_equal(out[1], [0.5, 2.])
+
+        # with coupling, simultaneous variations leave less margin
+        L = StateSpace([[-1., 0.3], [0.2, -2.]], [[1., 4.], [0.5, 1.]],
+                       3*np.eye(2), np.zeros((2, 2)))
+        dm = disk_margins(L)[0]
+        out = multiloop_disk_margins(L)
+        self.assertTrue(out[0] <= min(dm) + 1e-8)
+
     def test_nocross(self):
         # what happens when no gain/phase crossover?
         s = TransferFunction([1, 0], [1])
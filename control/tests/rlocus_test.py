@@ -5,7 +5,8 @@
 
 import unittest
 import numpy as np
-from control.rlocus import root_locus, _RLClickDispatcher
+from control.rlocus import root_locus, _RLClickDispatcher, \
+    _RLFindRoots, _RLSortRoots, _systopoly1d, _break_points
 from control.xferfcn import TransferFunction
 from control.statesp import StateSpace
 from control.bdalg import feedback
@@ -45,6 +46,44 @@ class TestRootLocus(unittest.TestCase):
             roots, kvect = root_locus(sys, Plot=False)
             self.check_cl_poles(sys, roots, kvect)
 
+    def test_default_gains(self):
+        """Gains are refined towards the break-in point"""
+        sys = self.systems[0]
+        roots, kvect = root_locus(sys, Plot=False)
+        self.assertTrue(np.all(np.diff(kvect) >= 0))
+        k_break, real_break = _break_points(*_systopoly1d(sys))
+        self.assertIn(np.real(k_break[0]), kvect)
+
+        # closest gains to the break-in gain get near the break point
+        index = np.nonzero(kvect == np.real(k_break[0]))[0][0]
+        np.testing.assert_array_almost_equal(
+            np.sort(np.real(roots[index + 1])),
+            np.real([real_break[0], real_break[0]]), 1)
+
+    def test_find_sort_roots(self):
+        """Batched roots match np.roots, sorted branches are continuous"""
+        sys = TransferFunction([1, 3], [1, 2, 5, 4, 0])
+        nump, denp = _systopoly1d(sys)
+        kvect = np.linspace(0, 20, 201)
+        mymat = _RLFindRoots(nump, denp, kvect)
+        for k, roots in zip(kvect, mymat):
+            np.testing.assert_array_almost_equal(
+                np.sort(roots), np.sort(np.roots(denp + k*nump)))
+
+        # scramble the order within the rows, sorting gives branches that
+        # move little between consecutive gains
+        scrambled = np.array([np.random.permutation(row) for row in mymat])
+        sorted = _RLSortRoots(scrambled)
+        np.testing.assert_array_almost_equal(
+            np.sort(sorted, axis=1), np.sort(mymat, axis=1))
+        self.assertTrue(np.max(np.abs(np.diff(sorted, axis=0))) < 0.5)
+
+        # biproper system, the root at infinity at the gain cancelling
+        # the leading coefficient
+        nump, denp = _systopoly1d(TransferFunction([-1, 2], [1, 2]))
+        mymat = _RLFindRoots(nump, denp, [0., 1., 2.])
+        self.assertTrue(np.isinf(mymat[1, 0]))
+
     def test_root_locus_zoom(self):
         """Check the zooming functionality of the Root locus plot"""
         system = TransferFunction([1000], [1, 25, 100, 0])
@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from control.sisotool import sisotool
+from control.sisotool import sisotool, _SisotoolUpdate
 from control.tests.margin_test import assert_array_almost_equal
 from control.rlocus import _RLClickDispatcher
 from control.xferfcn import TransferFunction
@@ -62,6 +62,32 @@ class TestSisotool(unittest.TestCase):
         step_response_moved = np.array([[ 0.,          0.02458187,  0.16529784 , 0.46602716 , 0.91012035 , 1.43364313, 1.93996334 , 2.3190105  , 2.47041552 , 2.32724853] ])
         assert_array_almost_equal(ax_step.lines[0].get_data()[1][:10],step_response_moved)
 
+    def test_sisotool_incremental(self):
+        sisotool(self.system, Hz=False)
+        fig = plt.gcf()
+        ax_mag, ax_step = fig.axes[0], fig.axes[3]
+        bode_plot_params = {
+            'omega': None, 'dB': False, 'Hz': False, 'deg': True,
+            'omega_limits': None, 'omega_num': None, 'sisotool': True,
+            'fig': fig, 'margins': True}
+
+        # first update with new parameters redraws the plots
+        _SisotoolUpdate(self.system, fig, 7.393, bode_plot_params)
+        mag_line, step_line = ax_mag.lines[0], ax_step.lines[0]
+        mag = mag_line.get_data()[1].copy()
+        step = step_line.get_data()[1].copy()
+        texts = [text.get_text() for text in ax_mag.texts]
+
+        # later updates change the lines in place, with the same result
+        _SisotoolUpdate(self.system, fig, 2., bode_plot_params)
+        self.assertFalse(np.allclose(mag_line.get_data()[1], mag))
+        _SisotoolUpdate(self.system, fig, 7.393, bode_plot_params)
+        self.assertIs(ax_mag.lines[0], mag_line)
+        self.assertIs(ax_step.lines[0], step_line)
+        np.testing.assert_array_almost_equal(mag_line.get_data()[1], mag)
+        np.testing.assert_array_almost_equal(step_line.get_data()[1], step)
+        self.assertEqual([text.get_text() for text in ax_mag.texts], texts)
+
 def test_suite():
     return unittest.TestLoader().loadTestsFromTestCase(TestSisotool)
 
@@ -219,6 +219,23 @@ class TestStateSpace(unittest.TestCase):
             assert len(w) == 1
             assert issubclass(w[-1].category, PendingDeprecationWarning)
 
+    def test_horner_array(self):
+        """Evaluate the transfer function at an array of complex points."""
+
+        s = np.array([0.1j, 1. + 2j, -0.5, 10j])
+        resp = self.sys322.horner(s)
+        self.assertEqual(resp.shape, (2, 2, 4))
+        for k, sk in enumerate(s):
+            np.testing.assert_array_almost_equal(
+                resp[:, :, k], self.sys322.horner(sk))
+
+        # Array of frequencies through _evalfr
+        omega = np.array([0.1, 1., 10.])
+        resp = self.sys322._evalfr(omega)
+        for k, w in enumerate(omega):
+            np.testing.assert_array_almost_equal(
+                resp[:, :, k], self.sys322._evalfr(w))
+
     @unittest.skipIf(not slycot_check(), "slycot not installed")
     def test_freq_resp(self):
         """Evaluate the frequency response at multiple frequencies."""
@@ -245,6 +262,50 @@ class TestStateSpace(unittest.TestCase):
         np.testing.assert_almost_equal(phase, true_phase)
         np.testing.assert_equal(omega, true_omega)
 
+    def test_freq_resp_hessenberg(self):
+        """Evaluate the frequency response using the Hessenberg method."""
+
+        A = [[-2, 0.5], [0.5, -0.3]]
+        B = [[0.3, -1.3], [0.1, 0.]]
+        C = [[0., 0.1], [-0.3, -0.2]]
+        D = [[0., -0.8], [-0.3, 0.]]
+        sys = StateSpace(A, B, C, D)
+
+        true_mag = [[[0.0852992637230322, 0.00103596611395218],
+                    [0.935374692849736, 0.799380720864549]],
+                   [[0.55656854563842, 0.301542699860857],
+                    [0.609178071542849, 0.0382108097985257]]]
+        true_phase = [[[-0.566195599644593, -1.68063565332582],
+                      [3.0465958317514, 3.14141384339534]],
+                     [[2.90457947657161, 3.10601268291914],
+                      [-0.438157380501337, -1.40720969147217]]]
+        true_omega = [0.1, 10.]
+
+        mag, phase, omega = sys.freqresp(true_omega, method='hessenberg')
+
+        np.testing.assert_almost_equal(mag, true_mag)
+        np.testing.assert_almost_equal(phase, true_phase)
+        np.testing.assert_equal(omega, true_omega)
+
+        # Compare against a direct solve for a larger system, which will
+        # require pivoting during the elimination
+        omega = np.logspace(-2, 2, 50)
+        mag, phase, omega = self.sys322.freqresp(omega, method='hessenberg')
+        for k, w in enumerate(omega):
+            resp = self.sys322._evalfr(w)
+            np.testing.assert_array_almost_equal(
+                mag[:, :, k] * np.exp(1j * phase[:, :, k]), resp)
+
+        # Discrete time system
+        sysd = StateSpace(A, B, C, D, 0.1)
+        mag, phase, omega = sysd.freqresp([0.1, 10.], method='hessenberg')
+        for k, w in enumerate(omega):
+            np.testing.assert_array_almost_equal(
+                mag[:, :, k] * np.exp(1j * phase[:, :, k]), sysd._evalfr(w))
+
+        # Unknown method
+        self.assertRaises(ValueError, sys.freqresp, true_omega, method='foo')
+
     @unittest.skipIf(not slycot_check(), "slycot not installed")
     def test_minreal(self):
         """Test a minreal model reduction."""
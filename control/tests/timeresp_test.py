@@ -10,7 +10,11 @@
 
 import unittest
 import numpy as np
+import scipy as sp
+import scipy.signal
 from control.timeresp import *
+from control.timeresp import _lti_recursion, _discretization_cache, \
+    _forced_response_matrices
 from control.statesp import *
 from control.xferfcn import TransferFunction, _convert_to_transfer_function
 from control.dtime import c2d
@@ -190,6 +194,49 @@ class TestTimeresp(unittest.TestCase):
         np.testing.assert_array_almost_equal(
             yy, np.vstack((youttrue, np.zeros_like(youttrue))), decimal=4)
 
+    def test_all_inputs_response(self):
+        # Responses to all inputs, from a single simulation
+        t = np.linspace(0, 1, 10)
+        for sys, T in ((self.mimo_ss1, t),
+                       (self.mimo_dss2, np.arange(10) * 0.2)):
+            for response in (step_response, impulse_response):
+                tout, yout, xout = response(sys, T, input='all',
+                                            return_x=True)
+                np.testing.assert_array_almost_equal(tout, T)
+                self.assertEqual(yout.shape, (2, 2, 10))
+                self.assertEqual(xout.shape, (4, 2, 10))
+                for j in range(2):
+                    _t, ytrue, xtrue = response(sys, T, input=j,
+                                                return_x=True)
+                    np.testing.assert_array_almost_equal(yout[:, j], ytrue)
+                    np.testing.assert_array_almost_equal(xout[:, j], xtrue)
+
+        # Select an output, with an initial condition
+        _t, yout = step_response(self.mimo_ss1, t, X0=[1, 0, 0, 1],
+                                 input='all', output=1)
+        _t, ytrue = step_response(self.mimo_ss1, t, X0=[1, 0, 0, 1],
+                                  input=0, output=1)
+        self.assertEqual(yout.shape, (2, 10))
+        np.testing.assert_array_almost_equal(yout[0], ytrue)
+
+    def test_all_inputs_response_discrete(self):
+        # Discrete time, with the default time vector and with time steps
+        # that are a multiple of the sampling time
+        sys = self.mimo_dss2
+        for T in (None, np.arange(10) * 0.6):
+            for response in (step_response, impulse_response):
+                tout, yout, xout = response(sys, T, input='all',
+                                            return_x=True)
+                self.assertEqual(yout.shape, (2, 2, len(tout)))
+                for j in range(2):
+                    _t, ytrue, xtrue = response(sys, T, input=j,
+                                                return_x=True)
+                    np.testing.assert_array_almost_equal(tout, _t)
+                    np.testing.assert_array_almost_equal(yout[:, j], ytrue)
+                    np.testing.assert_array_almost_equal(xout[:, j], xtrue)
+        self.assertRaises(ValueError, step_response, sys,
+                          np.arange(10) * 0.5, input='all')
+
     def test_initial_response(self):
         # Test SISO system
         sys = self.siso_ss1
@@ -270,6 +317,133 @@ class TestTimeresp(unittest.TestCase):
         np.testing.assert_array_equal(youtc.shape, youtd.shape)
         np.testing.assert_array_almost_equal(youtc, youtd, decimal=4)
 
+    def test_long_discrete_response(self):
+        # blocked recursion agrees with stepping through the samples
+        A = np.array([[0.9, 0.2, 0.], [-0.2, 0.9, 0.1], [0., 0., 0.5]])
+        W = np.random.randn(3, 1000)
+        x0 = np.array([1., -1., 2.])
+        xtrue = np.zeros((3, 1001))
+        xtrue[:, 0] = x0
+        for i in range(1000):
+            xtrue[:, i+1] = np.dot(A, xtrue[:, i]) + W[:, i]
+        for blocksize in (None, 1, 7, 64, 2048):
+            np.testing.assert_array_almost_equal(
+                _lti_recursion(A, W, x0, blocksize), xtrue)
+
+        # discrete time response matches scipy
+        sysd = c2d(self.mimo_ss1, 0.01)
+        t = np.arange(5000) * 0.01
+        u = np.array([np.sin(t), np.cos(3*t)])
+        _t, yout, xout = forced_response(sysd, t, u, [1., 0., 0., 1.])
+        _t, ytrue, xtrue = sp.signal.dlsim(
+            (sysd.A, sysd.B, sysd.C, sysd.D, 0.01), u.T, t, [1., 0., 0., 1.])
+        np.testing.assert_array_almost_equal(yout, ytrue.T)
+        np.testing.assert_array_almost_equal(xout, xtrue.T)
+
+        # inputs with the wrong shape or length are rejected
+        self.assertRaises(ValueError, forced_response, sysd, t, u.T)
+        self.assertRaises(ValueError, forced_response, sysd, t, u[:, :2500])
+        siso_d = c2d(self.siso_ss1, 0.1)
+        self.assertRaises(ValueError, forced_response, siso_d,
+                          np.arange(10) * 0.1, np.ones(5))
+
+        # unless transpose is given for (n_steps, n_inputs) inputs
+        _t, yout_t, _x = forced_response(sysd, t, u.T, [1., 0., 0., 1.],
+                                         transpose=True)
+        np.testing.assert_array_almost_equal(yout_t, ytrue)
+
+    def test_forced_response_batch(self):
+        t = np.linspace(0, 1, 10)
+        u = np.array([np.ones(10), np.sin(t), np.zeros(10)])
+        x0 = np.array([[0., 0.], [.5, 1.], [1., -1.]])
+
+        # batch agrees with the individual responses
+        for sys in (self.siso_ss1, c2d(self.siso_ss1, t[1] - t[0])):
+            tout, yout, xout = forced_response_batch(sys, t, u[:, None], x0)
+            np.testing.assert_array_almost_equal(tout, t)
+            self.assertEqual(yout.shape, (3, 1, 10))
+            self.assertEqual(xout.shape, (3, 2, 10))
+            for i in range(3):
+                _t, ytrue, xtrue = forced_response(sys, t, u[i], x0[i])
+                np.testing.assert_array_almost_equal(yout[i, 0], ytrue)
+                np.testing.assert_array_almost_equal(xout[i], xtrue)
+
+        # a single input or initial condition is shared by the batch
+        _t, yout, _x = forced_response_batch(self.siso_ss1, t, u[1], x0)
+        _t, ytrue, _x = forced_response(self.siso_ss1, t, u[1], x0[2])
+        np.testing.assert_array_almost_equal(yout[2, 0], ytrue)
+        _t, yout, _x = forced_response_batch(self.mimo_ss1, t, 0,
+                                             np.ones((5, 4)))
+        self.assertEqual(yout.shape, (5, 2, 10))
+        self.assertRaises(ValueError, forced_response_batch, self.siso_ss1,
+                          t, u[:2, None], x0)
+
+        # a transposed input is rejected, not reinterpreted
+        U = np.array([np.sin(t), np.cos(t)])
+        _t, yout, _x = forced_response_batch(self.mimo_ss1, t, U)
+        _t, ytrue, _x = forced_response(self.mimo_ss1, t, U)
+        np.testing.assert_array_almost_equal(yout[0], ytrue)
+        self.assertRaises(ValueError, forced_response_batch, self.mimo_ss1,
+                          t, U.T)
+        self.assertRaises(ValueError, forced_response_batch, self.mimo_ss1,
+                          t, U[0])
+
+    def test_forced_response_chunks(self):
+        t = np.linspace(0, 1, 100)
+        u = np.array([np.sin(5 * t), np.cos(3 * t)])
+        x0 = np.array([1., 0., 0., -1.])
+
+        # chunks of any length, also single samples, give the same response
+        for sys in (self.mimo_ss1, c2d(self.mimo_ss1, t[1] - t[0])):
+            _t, ytrue, xtrue = forced_response(sys, t, u, x0)
+            chunks = [u[:, :1], u[:, 1:37], u[:, 37:38], u[:, 38:]]
+            results = list(forced_response_chunks(sys, chunks, t[1] - t[0],
+                                                  x0))
+            self.assertEqual([tout.shape for tout, y, x in results],
+                             [(1,), (36,), (1,), (62,)])
+            np.testing.assert_array_almost_equal(
+                np.hstack([tout for tout, y, x in results]), t)
+            np.testing.assert_array_almost_equal(
+                np.hstack([y for tout, y, x in results]), ytrue)
+            np.testing.assert_array_almost_equal(
+                np.hstack([x for tout, y, x in results]), xtrue)
+
+        # single input systems take 1D chunks, squeezed by default
+        _t, ytrue, _x = forced_response(self.siso_ss1, t, u[0])
+        results = list(forced_response_chunks(self.siso_ss1,
+                                              np.split(u[0], 4), t[1]))
+        self.assertEqual(results[0][1].shape, (25,))
+        np.testing.assert_array_almost_equal(
+            np.hstack([y for tout, y, x in results]), ytrue)
+
+    def test_discretization_cache(self):
+        t = np.linspace(0, 1, 10)
+        _discretization_cache.clear()
+        _t, ytrue = step_response(self.siso_ss1, t)
+        self.assertEqual(len(_discretization_cache), 1)
+
+        # same system and time step reuse the entry
+        _t, yout = step_response(StateSpace(self.siso_ss1), t)
+        np.testing.assert_array_equal(yout, ytrue)
+        self.assertEqual(len(_discretization_cache), 1)
+
+        # changed matrices or time step give new entries
+        sys = StateSpace(self.siso_ss1)
+        sys.A = sys.A * 2
+        step_response(sys, t)
+        step_response(self.siso_ss1, 2 * t)
+        self.assertEqual(len(_discretization_cache), 3)
+
+        # cached matrices cannot be changed by the callers
+        Ad, Bd0, Bd1 = _forced_response_matrices(
+            np.asarray(self.siso_ss1.A), np.asarray(self.siso_ss1.B), t[1])
+        self.assertRaises(ValueError, Ad.fill, 0.)
+        _t, yout = step_response(self.siso_ss1, t)
+        np.testing.assert_array_equal(yout, ytrue)
+
+        clear_discretization_cache()
+        self.assertEqual(len(_discretization_cache), 0)
+
     def test_lsim_double_integrator(self):
         # Note: scipy.signal.lsim fails if A is not invertible
         A = np.mat("0. 1.;0. 0.")
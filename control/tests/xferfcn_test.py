@@ -495,6 +495,38 @@ class TestXferFcn(unittest.TestCase):
         np.testing.assert_array_almost_equal(phase, true_phase)
         np.testing.assert_array_equal(omega, true_omega)
 
+    def test_freqresp_methods(self):
+        """Compare vectorized and factored frequency responses."""
+
+        num = [[[1., 2.], [0., 3.], [2., -1.]],
+               [[1.], [4., 0.], [1., -4., 3.]]]
+        den = [[[-3., 2., 4.], [1., 0., 0.], [2., -1.]],
+               [[3., 0., .0], [2., -1., -1.], [1.]]]
+        sys = TransferFunction(num, den)
+        omega = np.logspace(-1, 2, 20)
+
+        mag, phase, omega = sys.freqresp(omega)
+        for i in range(sys.outputs):
+            for j in range(sys.inputs):
+                resp = np.polyval(num[i][j], 1j * omega) / \
+                    np.polyval(den[i][j], 1j * omega)
+                np.testing.assert_array_almost_equal(
+                    mag[i, j] * np.exp(1j * phase[i, j]), resp)
+
+        mag_zpk, phase_zpk, omega = sys.freqresp(omega, method='zpk')
+        np.testing.assert_array_almost_equal(
+            mag_zpk * np.exp(1j * phase_zpk), mag * np.exp(1j * phase))
+
+        # The cached coefficients must follow changes to num and den
+        sys.num[0][0] = np.array([2., 4.])
+        mag2, phase2, omega = sys.freqresp(omega)
+        np.testing.assert_array_almost_equal(mag2[0, 0], 2 * mag[0, 0])
+        np.testing.assert_array_almost_equal(mag2[1:], mag[1:])
+        mag2, phase2, omega = sys.freqresp(omega, method='zpk')
+        np.testing.assert_array_almost_equal(mag2[0, 0], 2 * mag[0, 0])
+
+        self.assertRaises(ValueError, sys.freqresp, omega, method='foo')
+
     # Tests for TransferFunction.pole and TransferFunction.zero.
     
     @unittest.skipIf(not slycot_check(), "slycot not installed")
@@ -68,12 +68,16 @@ import scipy as sp              # SciPy library (used all over)
 import numpy as np              # NumPy library
 from scipy.signal.ltisys import _default_response_times
 import warnings
+import hashlib
+from collections import OrderedDict
 from .lti import LTI     # base class of StateSpace, TransferFunction
 from .statesp import _convertToStateSpace, _mimo2simo, _mimo2siso
 from .lti import isdtime, isctime
 
-__all__ = ['forced_response', 'step_response', 'step_info', 'initial_response',
-           'impulse_response']
+__all__ = ['forced_response', 'forced_response_batch',
+           'forced_response_chunks', 'step_response', 'step_info',
+           'initial_response', 'impulse_response',
+           'clear_discretization_cache']
 
 
 # Helper function for checking array-like parameters
@@ -258,7 +262,6 @@ def forced_response(sys, T=None, U=0., X0=0., transpose=False,
 #    d_type = A.dtype
     n_states = A.shape[0]
     n_inputs = B.shape[1]
-    n_outputs = C.shape[0]
 
     # Set and/or check time vector in discrete time case
     if isdtime(sys, strict=True):
@@ -294,10 +297,6 @@ def forced_response(sys, T=None, U=0., X0=0., transpose=False,
     X0 = _check_convert_array(X0, [(n_states,), (n_states, 1)],
                               'Parameter ``X0``: ', squeeze=True)
 
-    xout = np.zeros((n_states, n_steps))
-    xout[:, 0] = X0
-    yout = np.zeros((n_outputs, n_steps))
-
     # Separate out the discrete and continuous time cases
     if isctime(sys):
         # Solve the differential equation, copied from scipy.signal.ltisys.
@@ -306,9 +305,10 @@ def forced_response(sys, T=None, U=0., X0=0., transpose=False,
         # Faster algorithm if U is zero
         if U is None or (isinstance(U, (int, float)) and U == 0):
             # Solve using matrix exponential
-            expAdt = sp.linalg.expm(A * dt)
-            for i in range(1, n_steps):
-                xout[:, i] = dot(expAdt, xout[:, i-1])
+            expAdt = _discretization_cache.get(
+                ('expm', dt), (A,), lambda: sp.linalg.expm(A * dt))
+            xout = _lti_recursion(expAdt, np.zeros((n_states, n_steps - 1)),
+                                  X0)
             yout = dot(C, xout)
 
         # General algorithm that interpolates U in between output points
@@ -323,33 +323,16 @@ def forced_response(sys, T=None, U=0., X0=0., transpose=False,
             if len(U.shape) == 1:
                 U = U.reshape(1, -1)  # pylint: disable=E1103
 
-            # Algorithm: to integrate from time 0 to time dt, with linear
-            # interpolation between inputs u(0) = u0 and u(dt) = u1, we solve
-            #   xdot = A x + B u,        x(0) = x0
-            #   udot = (u1 - u0) / dt,   u(0) = u0.
-            #
-            # Solution is
-            #   [ x(dt) ]       [ A*dt  B*dt  0 ] [  x0   ]
-            #   [ u(dt) ] = exp [  0     0    I ] [  u0   ]
-            #   [u1 - u0]       [  0     0    0 ] [u1 - u0]
-
-            M = np.block([[A * dt, B * dt, np.zeros((n_states, n_inputs))],
-                         [np.zeros((n_inputs, n_states + n_inputs)),
-                          np.identity(n_inputs)],
-                         [np.zeros((n_inputs, n_states + 2 * n_inputs))]])
-            expM = sp.linalg.expm(M)
-            Ad = expM[:n_states, :n_states]
-            Bd1 = expM[:n_states, n_states+n_inputs:]
-            Bd0 = expM[:n_states, n_states:n_states + n_inputs] - Bd1
-
-            for i in range(1, n_steps):
-                xout[:, i] = (dot(Ad, xout[:, i-1]) + dot(Bd0, U[:, i-1]) +
-                              dot(Bd1, U[:, i]))
+            # Discretize, with U linear in between the time steps
+            Ad, Bd0, Bd1 = _forced_response_matrices(A, B, dt)
+
+            xout = _lti_recursion(
+                Ad, dot(Bd0, U[:, :-1]) + dot(Bd1, U[:, 1:]), X0)
             yout = dot(C, xout) + dot(D, U)
         tout = T
 
     else:
-        # Discrete type system => use SciPy signal processing toolbox
+        # Discrete type system
         if sys.dt is not True:
             # Make sure that the time increment is a multiple of sampling time
 
@@ -366,23 +349,34 @@ def forced_response(sys, T=None, U=0., X0=0., transpose=False,
         else:
             sys.dt = dt         # For unspecified sampling time, use time incr
 
-        # Discrete time simulation using signal processing toolbox
-        dsys = (A, B, C, D, sys.dt)
+        # Input with one row per input, following the same conventions as
+        # in the continuous time case
+        legal_shapes = [(n_steps,), (1, n_steps)] if n_inputs == 1 else \
+                       [(n_inputs, n_steps)]
+        U = _check_convert_array(U, legal_shapes,
+                                 'Parameter ``U``: ', squeeze=False,
+                                 transpose=transpose)
+        U = np.asarray(U, dtype=float).reshape(n_inputs, n_steps)
+
+        # If dt is larger than sys.dt, simulate at the sampling time, with
+        # the input interpolated linearly
+        inc = int(round(dt / sys.dt))
+        if inc > 1:
+            tout = T[0] + np.arange((n_steps - 1) * inc + 1) * sys.dt
+            U = np.array([np.interp(tout, T, u) for u in U]).reshape(
+                n_inputs, -1)
+        else:
+            tout = T
 
-        # Use signal processing toolbox for the discrete time simulation
-        # Transpose the input to match toolbox convention
-        tout, yout, xout = sp.signal.dlsim(dsys, np.transpose(U), T, X0)
+        # The states follow from x[k+1] = A x[k] + B u[k]
+        xout = _lti_recursion(A, np.dot(B, U[:, :-1]), X0)
+        yout = np.dot(C, xout) + np.dot(D, U)
 
         if not interpolate:
             # If dt is different from sys.dt, resample the output
-            inc = int(round(dt / sys.dt))
             tout = T            # Return exact list of time steps
-            yout = yout[::inc, :]
-            xout = xout[::inc, :]
-
-        # Transpose the output and state vectors to match local convention
-        xout = sp.transpose(xout)
-        yout = sp.transpose(yout)
+            yout = yout[:, ::inc]
+            xout = xout[:, ::inc]
 
     # Get rid of unneeded dimensions
     if squeeze:
@@ -398,6 +392,410 @@ def forced_response(sys, T=None, U=0., X0=0., transpose=False,
     return tout, yout, xout
 
 
+def forced_response_batch(sys, T, U=0., X0=0.):
+    """Simulate the output of a linear system for a batch of inputs.
+
+    Computes the same responses as calling forced_response for every pair
+    of input and initial state, but the system is discretized only once
+    and the whole batch is simulated together.
+
+    Parameters
+    ----------
+    sys: LTI (StateSpace, or TransferFunction)
+        LTI system to simulate
+    T: array-like
+        Time steps at which the input is defined; values must be equally
+        spaced.  For discrete time systems, the spacing must be a multiple
+        of the sampling time; the system is then simulated at the sampling
+        time, with the input interpolated linearly, as in forced_response.
+    U: array-like or number, optional
+        Inputs, with shape (batch, n_inputs, n_steps).  A single input, with
+        shape (n_inputs, n_steps) (or (n_steps,) for single input systems),
+        or a number is used for all elements in the batch.  Inputs are linearly interpolated between the
+        time steps for continuous time systems.  Default value is 0.
+    X0: array-like or number, optional
+        Initial conditions, with shape (batch, n_states).  A single initial
+        condition, with shape (n_states,), or a number is used for all
+        elements in the batch.  Default value is 0.
+
+    Returns
+    -------
+    T: array
+        Time values of the output.
+    yout: array
+        Responses of the system, with shape (batch, n_outputs, n_steps).
+    xout: array
+        Time evolution of the states, with shape (batch, n_states, n_steps).
+
+    See Also
+    --------
+    forced_response
+
+    Examples
+    --------
+    >>> U = np.random.randn(100, 1, len(T))
+    >>> T, yout, xout = forced_response_batch(sys, T, U)
+    """
+    if not isinstance(sys, LTI):
+        raise TypeError('Parameter ``sys``: must be a ``LTI`` object. '
+                        '(For example ``StateSpace`` or ``TransferFunction``)')
+    sys = _convertToStateSpace(sys)
+    A, B, C, D = np.asarray(sys.A), np.asarray(sys.B), np.asarray(sys.C), \
+        np.asarray(sys.D)
+    n_states = A.shape[0]
+    n_inputs = B.shape[1]
+
+    T = _check_convert_array(T, [('any',), (1, 'any')],
+                             'Parameter ``T``: ', squeeze=True)
+    dt = T[1] - T[0]
+    if not np.allclose(T[1:] - T[:-1], dt):
+        raise ValueError("Parameter ``T``: time values must be "
+                         "equally spaced.")
+    n_steps = len(T)
+
+    # Bring the inputs and initial states to their batch shapes
+    U = np.asarray(U, dtype=float)
+    if U.ndim == 0:
+        U = np.broadcast_to(U, (1, n_inputs, n_steps))
+    elif U.shape == (n_inputs, n_steps) or \
+            (n_inputs == 1 and U.shape == (n_steps,)):
+        U = U.reshape(1, n_inputs, n_steps)
+    elif U.ndim != 3 or U.shape[1:] != (n_inputs, n_steps):
+        raise ValueError("Parameter ``U``: shape must be "
+                         "(batch, %d, %d)." % (n_inputs, n_steps))
+    X0 = np.asarray(X0, dtype=float)
+    if X0.ndim == 0:
+        X0 = np.broadcast_to(X0, (1, n_states))
+    elif X0.ndim == 1 and X0.size == n_states:
+        X0 = X0.reshape(1, n_states)
+    elif X0.ndim != 2 or X0.shape[1] != n_states:
+        raise ValueError("Parameter ``X0``: shape must be "
+                         "(batch, %d)." % n_states)
+    batch = max(U.shape[0], X0.shape[0])
+    if U.shape[0] not in (1, batch) or X0.shape[0] not in (1, batch):
+        raise ValueError("Parameters ``U`` and ``X0``: batch sizes "
+                         "do not match.")
+
+    # Discretize once, for the whole batch
+    inc = 1
+    if isctime(sys):
+        Ad, Bd0, Bd1 = _forced_response_matrices(A, B, dt)
+    else:
+        if sys.dt is not True:
+            # Same checks on the time steps as in forced_response
+            if dt < sys.dt and not np.isclose(dt, sys.dt):
+                raise ValueError("Time steps ``T`` must match sampling time")
+            elif not (np.isclose(dt % sys.dt, 0) or
+                      np.isclose(dt % sys.dt, sys.dt)):
+                raise ValueError("Time steps ``T`` must be multiples of "
+                                 "sampling time")
+            inc = int(round(dt / sys.dt))
+        Ad, Bd0, Bd1 = A, B, np.zeros_like(B)
+
+    # Simulate with the batch as trailing dimension
+    U = np.moveaxis(np.broadcast_to(U, (batch, n_inputs, n_steps)), 0, -1)
+    if inc > 1:
+        # Simulate at the sampling time, with the input interpolated
+        # linearly, and keep every inc-th sample (as in forced_response)
+        idx = np.arange((n_steps - 1) * inc + 1) / inc
+        k = np.minimum(idx.astype(int), n_steps - 2)
+        frac = (idx - k)[:, np.newaxis]
+        U = U[:, k] * (1. - frac) + U[:, k + 1] * frac
+    X0 = np.broadcast_to(X0, (batch, n_states)).T
+    W = np.tensordot(Bd0, U[:, :-1], axes=1) + \
+        np.tensordot(Bd1, U[:, 1:], axes=1)
+    xout = _lti_recursion(Ad, W, X0)[:, ::inc]
+    yout = np.tensordot(C, xout, axes=1) + \
+        np.tensordot(D, U[:, ::inc], axes=1)
+
+    return T, np.moveaxis(yout, -1, 0), np.moveaxis(xout, -1, 0)
+
+
+def forced_response_chunks(sys, chunks, dt, X0=0., T0=0., squeeze=True):
+    """Simulate the output of a linear system, one input chunk at a time.
+
+    Generator version of forced_response, for very long simulations.  The
+    input is taken from an iterable of chunks, and the response to each
+    chunk is yielded as soon as it has been computed.  Only the state and
+    the input at the end of the previous chunk are kept between chunks, so
+    the memory use does not grow with the length of the simulation.
+
+    Parameters
+    ----------
+    sys: LTI (StateSpace, or TransferFunction)
+        LTI system to simulate
+    chunks: iterable of array-like
+        Consecutive pieces of the input, each with shape (n_inputs,
+        n_samples), or (n_samples,) for single input systems.  Inputs are
+        linearly interpolated between the samples, also across the chunk
+        boundaries, for continuous time systems.
+    dt: float
+        Time between the input samples.  For discrete time systems, this
+        must be the sampling time.
+    X0: array-like or number, optional
+        Initial condition (default = 0).
+    T0: float, optional
+        Time of the first input sample (default = 0).
+    squeeze: bool, optional (default=True)
+        If True, the output response of single output systems is returned
+        as a 1D array.
+
+    Yields
+    ------
+    T: array
+        Time values of the chunk.
+    yout: array
+        Response of the system during the chunk.
+    xout: array
+        Time evolution of the states during the chunk.
+
+    See Also
+    --------
+    forced_response
+
+    Examples
+    --------
+    >>> for T, yout, xout in forced_response_chunks(sys, chunks, 0.01):
+    ...     writer.write(yout)
+    """
+    if not isinstance(sys, LTI):
+        raise TypeError('Parameter ``sys``: must be a ``LTI`` object. '
+                        '(For example ``StateSpace`` or ``TransferFunction``)')
+    sys = _convertToStateSpace(sys)
+    C, D = np.asarray(sys.C), np.asarray(sys.D)
+    n_states, n_inputs = np.asarray(sys.B).shape
+    X0 = _check_convert_array(X0, [(n_states,), (n_states, 1)],
+                              'Parameter ``X0``: ', squeeze=True)
+
+    # The system is time invariant, so each chunk is simulated on a time
+    # vector starting at zero; this keeps the time steps exact
+    n_done, u_last, x_last = 0, None, X0
+    for chunk in chunks:
+        U = _check_convert_array(chunk, [(n_inputs, 'any'), (n_inputs,)]
+                                 if n_inputs > 1 else [('any',), (1, 'any')],
+                                 'Parameter ``chunks``: ', squeeze=False)
+        U = U.reshape(n_inputs, -1)
+        n_steps = U.shape[1]
+        if n_steps == 0:
+            continue
+
+        if u_last is None:
+            # First chunk: the response starts at the initial state
+            if n_steps > 1:
+                _T, yout, xout = forced_response(
+                    sys, dt * np.arange(n_steps), U, x_last, squeeze=False)
+                yout = yout.reshape(-1, n_steps)
+                xout = xout.reshape(n_states, n_steps)
+            else:
+                xout = x_last.reshape(n_states, 1)
+                yout = np.dot(C, xout) + np.dot(D, U)
+        else:
+            # Continue from the last sample of the previous chunk
+            _T, yout, xout = forced_response(
+                sys, dt * np.arange(n_steps + 1), np.hstack((u_last, U)),
+                x_last, squeeze=False)
+            yout = yout.reshape(-1, n_steps + 1)[:, 1:]
+            xout = xout.reshape(n_states, -1)[:, 1:]
+
+        T = T0 + dt * np.arange(n_done, n_done + n_steps)
+        n_done, u_last, x_last = n_done + n_steps, U[:, -1:], xout[:, -1]
+        if squeeze and yout.shape[0] == 1:
+            yout = yout[0]
+        yield T, yout, xout
+
+
+class _DiscretizationCache(object):
+    """Least recently used cache for discretized system matrices
+
+    Entries are found from a fingerprint (SHA-1 digest) of the shapes,
+    types and contents of the system matrices, together with a key giving
+    the kind of discretization and the time step.  Changing a system,
+    also in place, therefore gives a new fingerprint; clear() empties the
+    cache explicitly.  The cached arrays are shared between all callers,
+    so they are made read-only.
+    """
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def fingerprint(arrays):
+        """Digest of a sequence of arrays"""
+        digest = hashlib.sha1()
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            digest.update(repr((array.shape, array.dtype.str)).encode())
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key, arrays, compute):
+        """Cached result of compute() for the key and the arrays"""
+        key = (key, self.fingerprint(arrays))
+        if key in self._entries:
+            value = self._entries.pop(key)
+        else:
+            value = compute()
+            for array in (value if isinstance(value, tuple) else (value,)):
+                array.flags.writeable = False
+        if self.maxsize > 0:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all entries"""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_discretization_cache = _DiscretizationCache()
+
+
+def clear_discretization_cache():
+    """Clear the cache of discretized system matrices
+
+    forced_response and the functions built on it keep the matrix
+    exponentials of recently simulated systems, so that repeated
+    simulations with the same time step do not recompute them.  Systems
+    changed in place are detected automatically; this function is only
+    needed to release the memory held by the cache.
+    """
+    _discretization_cache.clear()
+
+
+def _forced_response_matrices(A, B, dt):
+    """Discretize xdot = A x + B u, for u linear between the time steps
+
+    Returns Ad, Bd0 and Bd1, with x[k+1] = Ad x[k] + Bd0 u[k] + Bd1 u[k+1].
+    The results are kept in a cache, so repeated simulations of a system
+    with the same time step do not recompute the matrix exponential.
+    """
+    return _discretization_cache.get(
+        ('foh', dt), (A, B), lambda: _forced_response_expm(A, B, dt))
+
+
+def _forced_response_expm(A, B, dt):
+    """Compute the matrices for _forced_response_matrices"""
+    n_states, n_inputs = B.shape
+
+    # Algorithm: to integrate from time 0 to time dt, with linear
+    # interpolation between inputs u(0) = u0 and u(dt) = u1, we solve
+    #   xdot = A x + B u,        x(0) = x0
+    #   udot = (u1 - u0) / dt,   u(0) = u0.
+    #
+    # Solution is
+    #   [ x(dt) ]       [ A*dt  B*dt  0 ] [  x0   ]
+    #   [ u(dt) ] = exp [  0     0    I ] [  u0   ]
+    #   [u1 - u0]       [  0     0    0 ] [u1 - u0]
+
+    M = np.block([[A * dt, B * dt, np.zeros((n_states, n_inputs))],
+                 [np.zeros((n_inputs, n_states + n_inputs)),
+                  np.identity(n_inputs)],
+                 [np.zeros((n_inputs, n_states + 2 * n_inputs))]])
+    expM = sp.linalg.expm(M)
+    Ad = expM[:n_states, :n_states]
+    Bd1 = expM[:n_states, n_states+n_inputs:]
+    Bd0 = expM[:n_states, n_states:n_states + n_inputs] - Bd1
+    return Ad, Bd0, Bd1
+
+
+def _lti_recursion(A, W, x0, blocksize=None):
+    """States of the recursion x[k+1] = A x[k] + W[:, k], x[0] = x0
+
+    Returns an array with the n_steps = W.shape[1] + 1 states as columns.
+    W and x0 may have extra trailing dimensions, for a batch of
+    recursions with the same A; these are kept in the result.  Instead of stepping through the samples one by one in Python, the
+    samples are split into blocks of length L.  The responses within all
+    blocks are computed at once with a prefix scan over powers of A
+    (log2(L) passes), and the block initial states are then carried from
+    block to block.  Unstable recursions, where the scan would add up
+    large powers of A, are stepped through one sample at a time.
+    """
+    n_states, n_steps, batch = A.shape[0], W.shape[1] + 1, W.shape[2:]
+    if n_states == 0:
+        return np.zeros((0, n_steps) + batch)
+    if np.max(np.abs(np.linalg.eigvals(A))) > 1:
+        xout = np.zeros((n_states, n_steps) + batch,
+                        dtype=np.result_type(A, W, x0, float))
+        xout[:, 0] = x0
+        for i in range(1, n_steps):
+            xout[:, i] = np.dot(A, xout[:, i-1]) + W[:, i-1]
+        return xout
+    if blocksize is None:
+        # about sqrt(n_steps), limited by the memory for the powers of A
+        blocksize = int(2**min(np.ceil(np.log2(np.sqrt(n_steps))), 12,
+                               np.floor(np.log2(2**22 / n_states**2))))
+        blocksize = max(blocksize, 1)
+    n_blocks = -(-n_steps // blocksize)
+
+    # Contributions to each state, the initial state comes first
+    Y = np.zeros((n_states, n_blocks * blocksize) + batch,
+                 dtype=np.result_type(A, W, x0, float))
+    Y[:, 0] = x0
+    Y[:, 1:n_steps] = W
+    Y = Y.reshape((n_states, n_blocks, blocksize) + batch)
+
+    # Scan within the blocks: Y[:, b, j] = sum_i A^(j-i) Y[:, b, i]
+    power = A
+    shift = 1
+    while shift < blocksize:
+        Y[:, :, shift:] += np.tensordot(power, Y[:, :, :-shift], axes=1)
+        power = np.dot(power, power)
+        shift *= 2
+
+    # Carry the final state of each block into the next one
+    powers = np.empty((blocksize, n_states, n_states), dtype=A.dtype)
+    powers[0] = A
+    for j in range(1, blocksize):
+        powers[j] = np.dot(A, powers[j - 1])
+    for b in range(1, n_blocks):
+        Y[:, b, :] += np.swapaxes(
+            np.tensordot(powers, Y[:, b - 1, -1], axes=1), 0, 1)
+
+    return Y.reshape((n_states, -1) + batch)[:, :n_steps]
+
+
+def _all_inputs_response(sys, T, X0, impulse, output, transpose,
+                         return_x, squeeze):
+    """Step or impulse response from all inputs in one simulation
+
+    The responses to the input channels are simulated together, as a batch
+    in forced_response_batch.  Returns yout with shape (n_outputs,
+    n_inputs, n_steps) and xout with shape (n_states, n_inputs, n_steps).
+    """
+    sys = _convertToStateSpace(sys)
+    n_states, n_inputs = sys.B.shape
+    X0 = _check_convert_array(X0, [(n_states,), (n_states, 1)],
+                              'Parameter ``X0``: \n', squeeze=True)
+    T = np.asarray(T, dtype=float)
+    U = np.zeros((n_inputs, n_inputs, len(T)))
+    X0 = np.tile(X0, (n_inputs, 1))
+    if not impulse:
+        U[np.arange(n_inputs), np.arange(n_inputs), :] = 1.
+    elif isctime(sys):
+        # Impulses enter as initial states, see impulse_response
+        X0 = X0 + np.asarray(sys.B).T
+    else:
+        U[np.arange(n_inputs), np.arange(n_inputs), 0] = 1.
+
+    T, yout, xout = forced_response_batch(sys, T, U, X0)
+    yout = np.moveaxis(yout, 0, 1)
+    xout = np.moveaxis(xout, 0, 1)
+    if output is not None:
+        yout = yout[output:output + 1]
+
+    if transpose:
+        yout, xout = np.transpose(yout), np.transpose(xout)
+    if squeeze:
+        yout = np.squeeze(yout)
+    if return_x:
+        return T, yout, xout
+    return T, yout
+
+
 def _get_ss_simo(sys, input=None, output=None):
     """Return a SISO or SIMO state-space version of sys
 
@@ -425,7 +823,9 @@ def step_response(sys, T=None, X0=0., input=None, output=None,
     If the system has multiple inputs or outputs (MIMO), one input has
     to be selected for the simulation. Optionally, one output may be
     selected. The parameters `input` and `output` do this. All other
-    inputs are set to 0, all other outputs are ignored.
+    inputs are set to 0, all other outputs are ignored.  With
+    ``input='all'``, the responses to steps on each of the inputs are
+    computed together, in a single simulation.
 
     For information on the **shape** of parameters `T`, `X0` and
     return values `T`, `yout`, see :ref:`time-series-convention`.
@@ -443,8 +843,11 @@ def step_response(sys, T=None, X0=0., input=None, output=None,
 
         Numbers are converted to constant arrays with the correct shape.
 
-    input: int
-        Index of the input that will be used in this simulation.
+    input: int or 'all'
+        Index of the input that will be used in this simulation.  If
+        'all', the response to each of the inputs is returned, and `yout`
+        has shape (n_outputs, n_inputs, n_steps).  `T` must then be
+        equally spaced.
 
     output: int
         Index of the output that will be used in this simulation. Set to None
@@ -481,8 +884,10 @@ def step_response(sys, T=None, X0=0., input=None, output=None,
     --------
     >>> T, yout = step_response(sys, T, X0)
     """
-    sys = _get_ss_simo(sys, input, output)
+    if not isinstance(input, str) or input != 'all':
+        sys = _get_ss_simo(sys, input, output)
     if T is None:
+        sys = _convertToStateSpace(sys)
         if isctime(sys):
             T = _default_response_times(sys.A, 100)
         else:
@@ -490,6 +895,10 @@ def step_response(sys, T=None, X0=0., input=None, output=None,
             tvec = _default_response_times(sys.A, 100)
             T = range(int(np.ceil(max(tvec))))
 
+    if isinstance(input, str) and input == 'all':
+        return _all_inputs_response(sys, T, X0, False, output, transpose,
+                                    return_x, squeeze)
+
     U = np.ones_like(T)
 
     T, yout, xout = forced_response(sys, T, U, X0, transpose=transpose,
@@ -688,7 +1097,9 @@ def impulse_response(sys, T=None, X0=0., input=0, output=None,
     If the system has multiple inputs or outputs (MIMO), one input has
     to be selected for the simulation. Optionally, one output may be
     selected. The parameters `input` and `output` do this. All other
-    inputs are set to 0, all other outputs are ignored.
+    inputs are set to 0, all other outputs are ignored.  With
+    ``input='all'``, the responses to impulses on each of the inputs are
+    computed together, in a single simulation.
 
     For information on the **shape** of parameters `T`, `X0` and
     return values `T`, `yout`, see :ref:`time-series-convention`.
@@ -706,8 +1117,11 @@ def impulse_response(sys, T=None, X0=0., input=0, output=None,
 
         Numbers are converted to constant arrays with the correct shape.
 
-    input: int
-        Index of the input that will be used in this simulation.
+    input: int or 'all'
+        Index of the input that will be used in this simulation.  If
+        'all', the response to each of the inputs is returned, and `yout`
+        has shape (n_outputs, n_inputs, n_steps).  `T` must then be
+        equally spaced.
 
     output: int
         Index of the output that will be used in this simulation. Set to None
@@ -742,7 +1156,10 @@ def impulse_response(sys, T=None, X0=0., input=0, output=None,
     --------
     >>> T, yout = impulse_response(sys, T, X0)
     """
-    sys = _get_ss_simo(sys, input, output)
+    if isinstance(input, str) and input == 'all':
+        sys = _convertToStateSpace(sys)
+    else:
+        sys = _get_ss_simo(sys, input, output)
 
     # System has direct feedthrough, can't simulate impulse response
     # numerically
@@ -767,6 +1184,10 @@ def impulse_response(sys, T=None, X0=0., input=0, output=None,
             tvec = _default_response_times(sys.A, 100)
             T = range(int(np.ceil(max(tvec))))
 
+    if isinstance(input, str) and input == 'all':
+        return _all_inputs_response(sys, T, X0, True, output, transpose,
+                                    return_x, squeeze)
+
     U = np.zeros_like(T)
 
     # Compute new X0 that contains the impulse
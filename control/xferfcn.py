@@ -53,8 +53,8 @@ $Id$
 
 # External function declarations
 import numpy as np
-from numpy import angle, array, empty, finfo, ndarray, ones, \
-    polyadd, polymul, polyval, roots, sqrt, zeros, squeeze, exp, pi, \
+from numpy import angle, array, finfo, ndarray, ones, \
+    polyadd, polymul, roots, sqrt, zeros, squeeze, exp, pi, \
     where, delete, real, poly, nonzero
 import scipy as sp
 from numpy.polynomial.polynomial import polyfromroots
@@ -617,27 +617,95 @@ class TransferFunction(LTI):
 
         return self.horner(s)
 
+    def _coeff_arrays(self, factored=False):
+        """Return the num and den of all entries as padded arrays.
+
+        Returns (num, den), arrays of shape (outputs, inputs, n) with the
+        polynomial coefficients of each entry (highest power first), padded
+        with leading zeros to a common length.  If factored is True, returns
+        (zeros, poles, gain) instead, where zeros and poles are padded with
+        NaN.  The arrays are cached and only rebuilt if num or den change.
+        """
+        coeffs = [self.num[i][j] for i in range(self.outputs)
+                  for j in range(self.inputs)] + \
+            [self.den[i][j] for i in range(self.outputs)
+             for j in range(self.inputs)]
+
+        # Check whether the cached arrays are still valid
+        cache = getattr(self, '_coeff_cache', None)
+        if cache is None or len(cache['coeffs']) != len(coeffs) or \
+           not all(np.array_equal(c1, c2)
+                   for c1, c2 in zip(cache['coeffs'], coeffs)):
+            cache = {'coeffs': [array(c, dtype=float) for c in coeffs]}
+            self._coeff_cache = cache
+
+        key = 'zpk' if factored else 'poly'
+        if key not in cache:
+            shape = (self.outputs, self.inputs)
+            nnum = self.outputs * self.inputs
+            if factored:
+                rts = [roots(c) for c in cache['coeffs']]
+                order = max([len(r) for r in rts] + [0])
+                padded = np.full((len(rts), order), np.nan, dtype=complex)
+                for k, r in enumerate(rts):
+                    padded[k, :len(r)] = r
+                gain = array([c[0] for c in cache['coeffs']])
+                cache[key] = (padded[:nnum].reshape(shape + (order,)),
+                              padded[nnum:].reshape(shape + (order,)),
+                              (gain[:nnum] / gain[nnum:]).reshape(shape))
+            else:
+                order = max(len(c) for c in cache['coeffs'])
+                padded = zeros((len(cache['coeffs']), order))
+                for k, c in enumerate(cache['coeffs']):
+                    padded[k, order - len(c):] = c
+                cache[key] = (padded[:nnum].reshape(shape + (order,)),
+                              padded[nnum:].reshape(shape + (order,)))
+        return cache[key]
+
+    def _horner_array(self, s, method=None):
+        """Evaluate all entries at an array of complex points at once.
+
+        Returns an array of shape (outputs, inputs, len(s)).  The default
+        method, 'horner', evaluates the padded polynomial coefficients using
+        Horner's rule.  The 'zpk' method evaluates the factored form k *
+        prod(s - z) / prod(s - p), which is more accurate for high order
+        transfer functions.
+        """
+        # Keep real points real, so that division by zero gives inf
+        s = np.asarray(s)
+        s = s.astype(np.result_type(s, float)).reshape(-1)
+        if method is None or method == 'horner':
+            num, den = self._coeff_arrays()
+            numval = zeros(num.shape[:2] + s.shape, dtype=s.dtype)
+            denval = zeros(den.shape[:2] + s.shape, dtype=s.dtype)
+            for k in range(num.shape[2]):
+                numval = numval * s + num[:, :, k, np.newaxis]
+                denval = denval * s + den[:, :, k, np.newaxis]
+            return (numval / denval).astype(complex)
+
+        elif method == 'zpk':
+            zrs, pls, gain = self._coeff_arrays(factored=True)
+            diff = s - np.concatenate((zrs, pls), axis=2)[..., np.newaxis]
+            diff[np.isnan(diff)] = 1.
+            nz = zrs.shape[2]
+            return gain[..., np.newaxis] * np.prod(diff[:, :, :nz], axis=2) / \
+                np.prod(diff[:, :, nz:], axis=2)
+
+        else:
+            raise ValueError("unknown freqresp method '%s'" % method)
+
     def horner(self, s):
         """Evaluate the systems's transfer function for a complex variable
 
         Returns a matrix of values evaluated at complex variable s.
         """
-
-        # Preallocate the output.
         if getattr(s, '__iter__', False):
-            out = empty((self.outputs, self.inputs, len(s)), dtype=complex)
-        else:
-            out = empty((self.outputs, self.inputs), dtype=complex)
+            return self._horner_array(s)
 
-        for i in range(self.outputs):
-            for j in range(self.inputs):
-                out[i][j] = (polyval(self.num[i][j], s) /
-                             polyval(self.den[i][j], s))
-
-        return out
+        return self._horner_array(s)[:, :, 0]
 
     # Method for generating the frequency response of the system
-    def freqresp(self, omega):
+    def freqresp(self, omega, method=None):
         """Evaluate a transfer function at a list of angular frequencies.
 
         mag, phase, omega = self.freqresp(omega)
@@ -647,32 +715,29 @@ class TransferFunction(LTI):
         is a list of angular frequencies, and is a sorted version of the input
         omega.
 
-        """
+        The response of all input/output pairs is computed in a single
+        vectorized pass.  If method is 'zpk', the transfer function is
+        evaluated in factored (zero/pole/gain) form instead of by evaluating
+        the numerator and denominator polynomials, which is more accurate
+        for high order transfer functions.
 
-        # Preallocate outputs.
-        numfreq = len(omega)
-        mag = empty((self.outputs, self.inputs, numfreq))
-        phase = empty((self.outputs, self.inputs, numfreq))
+        """
 
         # Figure out the frequencies
         omega.sort()
+        omega_arr = np.asarray(omega, dtype=float)
         if isdtime(self, strict=True):
             dt = timebase(self)
-            slist = np.array([exp(1.j * w * dt) for w in omega])
+            slist = exp(1.j * omega_arr * dt)
             if max(omega) * dt > pi:
                 warn("freqresp: frequency evaluation above Nyquist frequency")
         else:
-            slist = np.array([1j * w for w in omega])
+            slist = 1j * omega_arr
 
-        # Compute frequency response for each input/output pair
-        for i in range(self.outputs):
-            for j in range(self.inputs):
-                fresp = (polyval(self.num[i][j], slist) /
-                         polyval(self.den[i][j], slist))
-                mag[i, j, :] = abs(fresp)
-                phase[i, j, :] = angle(fresp)
+        # Compute frequency response for all input/output pairs
+        fresp = self._horner_array(slist, method)
 
-        return mag, phase, omega
+        return abs(fresp), angle(fresp), omega
 
     def pole(self):
         """Compute the poles of a transfer function."""